@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Califica en paralelo la dificultad de todas las partidas de un catálogo.
+
+Resuelve cada partida con logic.calificador (técnicas lógicas necesarias,
+retrocesos y ancho de ramificación) en un ProcessPoolExecutor y escribe una
+línea JSON por partida con su puntaje y el nivel calculado. Con
+--reetiquetar además guarda una copia del catálogo con la "dificultad" de
+cada partida reemplazada por la calculada.
+
+Uso:
+    python calificar_partidas.py [archivo] [-o calificacion.jsonl] [--reetiquetar nuevo.json]
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.calificador import calificar_partida
+from logic.partida_loader import PARTIDAS_FILE, _load_partidas_file
+from logic.persistencia import escribir_json_atomico
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Califica la dificultad de las partidas de Kakuro")
+    parser.add_argument("archivo", nargs="?", default=PARTIDAS_FILE,
+                        help=f"Archivo de partidas (por defecto {PARTIDAS_FILE})")
+    parser.add_argument("-o", "--salida", default=None,
+                        help="Archivo JSON Lines de salida (por defecto la salida estándar)")
+    parser.add_argument("--reetiquetar", default=None,
+                        help="Escribe el catálogo con la dificultad calculada en este archivo")
+    parser.add_argument("-p", "--procesos", type=int, default=None,
+                        help="Número de procesos (por defecto uno por CPU)")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="Partidas enviadas a cada proceso por lote")
+    return parser.parse_args(argv)
+
+
+def _catalogo_reetiquetado(archivo, partidas):
+    """
+    Arma el catálogo a escribir con --reetiquetar: el del archivo original
+    con sus otras claves de primer nivel y solo "partidas" reemplazada.
+    """
+    try:
+        with open(archivo, "r", encoding="utf-8") as f:
+            original = json.load(f)
+    except ValueError:
+        original = None  # JSON Lines: no tiene claves de primer nivel
+    if isinstance(original, list):
+        return partidas
+    catalogo = dict(original) if isinstance(original, dict) else {}
+    catalogo["partidas"] = partidas
+    return catalogo
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    partidas = _load_partidas_file(args.archivo)
+    if partidas is None:
+        return 1
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    niveles = Counter()
+    cambiadas = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.procesos) as executor:
+            resultados = executor.map(calificar_partida, partidas, chunksize=max(1, args.chunksize))
+            for partida, resultado in zip(partidas, resultados):
+                salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+                niveles[resultado["nivel"]] += 1
+                if resultado["dificultad"] != resultado["dificultad_original"]:
+                    cambiadas += 1
+                if args.reetiquetar and resultado["resuelta"]:
+                    partida["dificultad"] = resultado["dificultad"]
+                    partida["puntaje_dificultad"] = resultado["puntaje"]
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    if args.reetiquetar:
+        escribir_json_atomico(args.reetiquetar, _catalogo_reetiquetado(args.archivo, partidas), indent=2)
+
+    resumen = ", ".join(f"{nivel}: {cantidad}" for nivel, cantidad in sorted(niveles.items()))
+    print(f"[CALIFICAR] {len(partidas)} partidas ({resumen}); {cambiadas} cambian de dificultad",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Genera en paralelo partidas nuevas con solución única.
+
+Cada partida se genera con logic.generador en un ProcessPoolExecutor (una
+semilla por partida, así que el resultado es reproducible) y se escribe en
+el esquema de kakuro2025_partidas.json. Las partidas repetidas (misma
+huella canónica que otra de esta ejecución, del archivo al que se anexa o
+del índice de huellas indicado con --indice) se descartan.
+
+El índice describe un solo catálogo (--catalogo): generar solo lo consulta,
+y lo actualiza únicamente si la salida es ese catálogo. Así las partidas
+generadas en otro archivo se pueden importar después con importar_partidas.py.
+
+Uso:
+    python generar_partidas.py facil -n 500 -o data/kakuro2025_partidas.json --anexar
+    python generar_partidas.py experto -n 100 --filas 9 --columnas 9 -o experto.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.generador import DIFICULTADES, generar_tarea
+from logic.huella_partida import IndiceHuellas, huella_partida
+from logic.lector_partidas import iterar_partidas
+from logic.partida_loader import PARTIDAS_FILE
+from logic.persistencia import escribir_json_atomico
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Genera partidas de Kakuro con solución única")
+    parser.add_argument("dificultad", choices=DIFICULTADES, help="Dificultad de las partidas")
+    parser.add_argument("-n", "--cantidad", type=int, default=10,
+                        help="Número de partidas a generar")
+    parser.add_argument("--filas", type=int, default=None,
+                        help="Filas del tablero incluida la fila de claves (por defecto según dificultad)")
+    parser.add_argument("--columnas", type=int, default=None,
+                        help="Columnas del tablero incluida la columna de claves")
+    parser.add_argument("-o", "--salida", default=None,
+                        help="Archivo .json ({\"partidas\": [...]}) o .jsonl (por defecto JSON Lines a la salida estándar)")
+    parser.add_argument("--anexar", action="store_true",
+                        help="Conservar las partidas que ya tenga el archivo de salida")
+    parser.add_argument("--indice", default=None,
+                        help="Índice de huellas en disco contra el que se descartan repetidas")
+    parser.add_argument("--catalogo", default=PARTIDAS_FILE,
+                        help=f"Catálogo que describe el índice (por defecto {PARTIDAS_FILE}); "
+                             "el índice solo se actualiza si la salida es este archivo")
+    parser.add_argument("-p", "--procesos", type=int, default=None,
+                        help="Número de procesos (por defecto uno por CPU)")
+    parser.add_argument("--semilla", type=int, default=None,
+                        help="Semilla de la primera partida (por defecto aleatoria)")
+    parser.add_argument("--chunksize", type=int, default=1,
+                        help="Partidas enviadas a cada proceso por lote")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    semilla = args.semilla if args.semilla is not None else random.randrange(1 << 31)
+    tareas = [(args.dificultad, args.filas, args.columnas, semilla + i) for i in range(args.cantidad)]
+
+    # El índice en disco solo se consulta, salvo que la salida sea su catálogo;
+    # las huellas de esta ejecución y del archivo de salida van a "vistas"
+    indice = IndiceHuellas(args.indice) if args.indice else None
+    actualizar_indice = (indice is not None and args.salida is not None
+                         and os.path.abspath(args.salida) == os.path.abspath(args.catalogo))
+    vistas = indice if actualizar_indice else IndiceHuellas(None)
+
+    def repetida(huella, partida_id):
+        if indice is not None and vistas is not indice and huella in indice:
+            return True
+        return not vistas.agregar(huella, partida_id)
+
+    jsonl = args.salida is None or args.salida.endswith(".jsonl")
+
+    # Las partidas del archivo al que se anexa se recorren una a una; solo
+    # el .json las conserva, porque se reescribe completo al final
+    existentes = []
+    if args.anexar and args.salida:
+        try:
+            for posicion, partida in enumerate(iterar_partidas(args.salida)):
+                huella = huella_partida(partida)
+                if huella:
+                    vistas.agregar(huella, str(partida.get("id", f"partida_{posicion + 1}")))
+                if not jsonl:
+                    existentes.append(partida)
+        except FileNotFoundError:
+            existentes = []
+        except (ValueError, OSError) as e:
+            print(f"[GENERAR] No se pudo leer {args.salida}: {e}", file=sys.stderr)
+            return 1
+
+    generadas = []
+    fallidas = 0
+    repetidas = 0
+    if args.salida is None:
+        salida = sys.stdout
+    elif jsonl:
+        salida = open(args.salida, "a" if args.anexar else "w", encoding="utf-8")
+    else:
+        salida = None
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.procesos) as executor:
+            for partida in executor.map(generar_tarea, tareas, chunksize=max(1, args.chunksize)):
+                if partida is None:
+                    fallidas += 1
+                elif repetida(huella_partida(partida), partida["id"]):
+                    repetidas += 1
+                elif jsonl:
+                    salida.write(json.dumps(partida, ensure_ascii=False) + "\n")
+                    salida.flush()
+                    generadas.append(partida["id"])
+                else:
+                    generadas.append(partida)
+    finally:
+        if salida is not None and salida is not sys.stdout:
+            salida.close()
+
+    if not jsonl:
+        escribir_json_atomico(args.salida, {"partidas": existentes + generadas}, indent=2)
+    if actualizar_indice:
+        indice.guardar()
+
+    print(f"[GENERAR] {len(generadas)} partidas '{args.dificultad}' generadas "
+          f"(semillas {semilla}-{semilla + args.cantidad - 1}), {fallidas} fallidas, {repetidas} repetidas",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,8 @@ from tkinter import ttk, messagebox
 import json
 import os
 
+from logic.config_loader import load_configuracion, save_configuracion
+
 CONFIG_FILE = "data/configuracion.json"
 
 
@@ -366,12 +368,15 @@ class ConfigScreen(tk.Frame):
                 config["minutos"] = minutos
                 config["segundos"] = segundos
 
-            # Crear directorio data si no existe
-            os.makedirs("data", exist_ok=True)
+            # Conservar la frecuencia del autoguardado (no se edita en esta pantalla)
+            actual = load_configuracion()
+            config["autoguardado_segundos"] = actual["autoguardado_segundos"]
+            config["autoguardado_jugadas"] = actual["autoguardado_jugadas"]
 
-            # Guardar en archivo
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            # Guardar en archivo (reemplazo atómico; crea data/ si no existe)
+            if not save_configuracion(config):
+                messagebox.showerror("Error", "No se pudo guardar la configuración.")
+                return
 
             # Mostrar mensaje de confirmación
             tiempo_str = ""
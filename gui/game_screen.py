@@ -1,11 +1,25 @@
+import os
 import tkinter as tk
 from tkinter import messagebox
+from logic.autoguardado import Autoguardado
 from logic.config_loader import load_configuracion
-from logic.partida_loader import load_random_partida
+from logic.diario_jugadas import DiarioJugadas, reproducir
+from logic.partida_loader import TAMANO_POR_DEFECTO, dimensiones_partida
+from logic.persistencia import escribir_json_atomico
+from logic.pool_partidas import obtener_pool
 from logic.record_manager import guardar_record, obtener_top_records, formatear_tiempo
+from logic.estado_runs import EstadoRuns
+from logic.indice_partida import IndicePartida
+from logic.board import Board
+from logic.pistas import MotorPistas
 from gui.components.cell_components import create_white_cell, create_black_cell, create_key_cell
 
 
+ARCHIVO_GUARDADO = "data/kakuro2025_guardado.json"  # GUARDAR JUEGO / CARGAR JUEGO
+ARCHIVO_AUTOGUARDADO = "data/kakuro2025_autoguardado.json"  # Instantánea de la partida en curso + diario
+DESCARTAR_AUTOGUARDADO = {"descartar": True}  # Pedido al hilo de autoguardado para borrar autoguardado y diario
+
+
 class GameScreen(tk.Frame):
     def __init__(self, parent, controller):
         super().__init__(parent, bg="#2c2c2c")
@@ -13,15 +27,30 @@ class GameScreen(tk.Frame):
         self.parent = parent
         self.nombre_jugador = "Jugador"  # Minitask 14
         self.partida_data = None  # Almacenar datos de la partida cargada
-        self.board_size = 9  # Tamaño del tablero (9x9)
+        self.filas = TAMANO_POR_DEFECTO  # Dimensiones del tablero, según el "tamaño" de la partida
+        self.columnas = TAMANO_POR_DEFECTO
         self.juego_activo = False  # Bandera para controlar el estado del juego
         self.numero_seleccionado = None  # Número actualmente seleccionado por el jugador
         self.botones_numeros = []  # Lista para almacenar referencias a los botones numéricos
-        self.estado_tablero = [[None for _ in range(9)] for _ in range(9)]  # Matriz para trackear el estado del tablero
+        self.estado_tablero = self.nuevo_estado_tablero()  # Matriz para trackear el estado del tablero
+        self.indice_partida = None  # Índice casilla <-> corridas, construido al cargar la partida
+        self.estado_runs = None  # Sumas parciales por corrida para verificar la victoria en O(1)
+        self.motor_pistas = None  # Candidatos incrementales para las pistas
+        self.pool_partidas = obtener_pool()  # Partidas precargadas, repuestas en segundo plano
+        self.partida_preparada = None  # Partida del pool con su índice ya construido
+        self.mensaje_carga = None  # Etiqueta "Cargando partida..." mientras el pool prepara una
         
         # 🧠 Estructura de datos para historial de jugadas
         self.historial_jugadas = []  # Stack principal para deshacer
         self.historial_rehacer = []  # Stack auxiliar para rehacer
+        self.diario = DiarioJugadas()  # Jugadas posteriores al último autoguardado, para recuperar tras un cierre
+        self.autoguardado = Autoguardado(self.escribir_guardado)  # Escribe los autoguardados en un hilo de fondo
+        self.guardado_manual = Autoguardado(self.escribir_guardado_manual)  # Escribe GUARDAR JUEGO en un hilo de fondo
+        self.tick_autoguardado = None  # Id del after() que revisa el intervalo de autoguardado
+        self.reintento_guardado = None  # Id del after() que espera a los hilos de guardado
+        # Continuar la numeración detrás de las jugadas que hayan quedado en el diario,
+        # para que el primer autoguardado las descarte
+        self.diario.leer()
         
         self.setup_ui()
 
@@ -90,6 +119,7 @@ class GameScreen(tk.Frame):
             ("DESHACER JUGADA", "#c5e1a5", self.deshacer_jugada),
             ("REHACER JUGADA", "#80deea", self.rehacer_jugada),
             ("BORRAR CASILLA", "#90caf9", self.borrar_casilla),
+            ("PISTA", "#ce93d8", self.mostrar_pista),
             ("GUARDAR JUEGO", "#ffb74d", self.guardar_partida_actual),
             ("TERMINAR JUEGO", "#80cbc4", self.terminar_juego)
         ]
@@ -136,14 +166,14 @@ class GameScreen(tk.Frame):
 
         # Mostrar nivel actual
         nivel_actual = self.partida_data["nivel_de_dificultad"] if self.partida_data else "FÁCIL"
-        level_label = tk.Label(
+        self.level_label = tk.Label(
             self,
             text=f"NIVEL {nivel_actual}",
             font=("Segoe UI", 12, "bold"),
             fg="white",
             bg="#2c2c2c"
         )
-        level_label.pack(pady=10)
+        self.level_label.pack(pady=10)
 
     def activar_juego(self):
         """
@@ -155,6 +185,24 @@ class GameScreen(tk.Frame):
             print("El juego ya está activo. Ignorando clic adicional.")
             return
         
+        # Un autoguardado o descarte pendiente cambia lo que hay para recuperar
+        if not self.esperar_guardados(self.activar_juego):
+            return
+        
+        # El autoguardado inicial reemplaza al de una partida que quedó sin terminar
+        if self.ofrecer_recuperacion():
+            return
+        
+        if not self.partida_data and self.mensaje_carga is None:
+            # Después de TERMINAR JUEGO la partida nueva se saca recién ahora
+            self.load_game_data()
+            if self.partida_data:
+                self.partida_lista()
+        
+        if not self.partida_data:
+            messagebox.showinfo("Kakuro 2025", "La partida todavía se está cargando.")
+            return
+        
         # Pedir nombre del jugador
         self.nombre_jugador = simpledialog.askstring("Nombre", "¿Cuál es tu nombre?")
         if not self.nombre_jugador:
@@ -175,6 +223,10 @@ class GameScreen(tk.Frame):
         self.activar_botones()
         self.activar_botones_numeros()
         self.setup_reloj()
+
+        # Autoguardado inicial: el diario de jugadas se reproduce sobre esta partida
+        self.autoguardar()
+        self.configurar_autoguardado()
         
         print("Juego iniciado correctamente")
 
@@ -184,8 +236,8 @@ class GameScreen(tk.Frame):
         """
         print("Activando tablero...")
         
-        for fila in range(9):
-            for columna in range(9):
+        for fila in range(self.filas):
+            for columna in range(self.columnas):
                 celda = self.celdas_blancas[fila][columna]
                 
                 if celda and isinstance(celda, tk.Label):
@@ -203,10 +255,24 @@ class GameScreen(tk.Frame):
         
         print("Tablero activado")
 
+    def nuevo_estado_tablero(self):
+        """Devuelve una matriz vacía con las dimensiones del tablero actual."""
+        return [[None for _ in range(self.columnas)] for _ in range(self.filas)]
+
+    def sacar_partida(self, nivel):
+        """
+        Saca una partida ya convertida e indexada del pool de partidas.
+        No espera: devuelve None si el pool todavía no tiene una lista.
+        """
+        self.partida_preparada = self.pool_partidas.obtener(nivel)
+        return self.partida_preparada.partida if self.partida_preparada else None
+
     def load_game_data(self):
         """
         Carga la configuración del juego y una partida aleatoria.
-        Si no se puede cargar una partida válida, muestra un error.
+        La partida sale del pool precargado, sin leer archivos en el hilo de Tk.
+        Si el pool todavía no tiene una lista, muestra "Cargando partida..." y
+        la espera con after() sin bloquear la interfaz (ver esperar_partida).
         """
         try:
             # Cargar configuración para obtener el nivel actual
@@ -214,26 +280,16 @@ class GameScreen(tk.Frame):
             nivel = config.get("nivel", "FÁCIL")
             
             # Cargar partida aleatoria para el nivel
-            self.partida_data = load_random_partida(nivel)
+            self.partida_data = self.sacar_partida(nivel)
             
             if not self.partida_data:
-                # Si no se pudo cargar la partida, intentar con un nivel diferente
-                print(f"No hay partidas disponibles para el nivel: {nivel}")
-                
-                # Intentar con otros niveles en orden de preferencia
-                niveles_alternativos = ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"]
-                for nivel_alt in niveles_alternativos:
-                    if nivel_alt != nivel:
-                        print(f"Intentando cargar partida para nivel: {nivel_alt}")
-                        self.partida_data = load_random_partida(nivel_alt)
-                        if self.partida_data:
-                            print(f"Partida cargada para nivel alternativo: {nivel_alt}")
-                            break
-                
-                if not self.partida_data:
-                    # Si no se pudo cargar ninguna partida, mostrar error
-                    self.show_error_message("No se pudo cargar una partida válida. Verifica que el archivo de partidas contenga datos.")
-                    return
+                # Si no hay una lista, se pide al pool y se intentan los demás niveles en orden de preferencia
+                print(f"No hay partidas preparadas para el nivel: {nivel}")
+                niveles = [nivel] + [n for n in ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"] if n != nivel]
+                self.pool_partidas.pedir(nivel)
+                self.mostrar_cargando()
+                self.after(100, self.esperar_partida, niveles, 0)
+                return
                 
             print(f"Partida cargada: {self.partida_data['nivel_de_dificultad']} - Partida {self.partida_data['partida']}")
             print(f"Número de claves: {len(self.partida_data['claves'])}")
@@ -243,6 +299,78 @@ class GameScreen(tk.Frame):
             self.show_error_message("Error al cargar los datos del juego.")
             self.partida_data = None
 
+    def mostrar_cargando(self):
+        """Muestra el estado de carga y bloquea INICIAR JUEGO hasta tener partida."""
+        if self.mensaje_carga is None:
+            self.mensaje_carga = tk.Label(
+                self,
+                text="Cargando partida...",
+                font=("Segoe UI", 12, "italic"),
+                fg="#ffcc80",
+                bg="#2c2c2c"
+            )
+            self.mensaje_carga.pack(pady=10)
+        if hasattr(self, 'boton_iniciar'):
+            self.boton_iniciar.config(state="disabled")
+
+    def ocultar_cargando(self):
+        """Quita el estado de carga."""
+        if self.mensaje_carga is not None:
+            self.mensaje_carga.destroy()
+            self.mensaje_carga = None
+
+    def esperar_partida(self, niveles, posicion):
+        """
+        Revisa el pool cada 100 ms (con after) hasta que haya una partida del
+        nivel pedido; si el pool no encuentra partidas de ese nivel, pasa al
+        siguiente de la lista. La carga y la generación corren fuera del hilo de Tk.
+        """
+        if not self.winfo_exists():
+            return
+        if self.juego_activo:
+            # Mientras tanto se cargó una partida guardada
+            self.ocultar_cargando()
+            return
+        if hasattr(self, 'boton_iniciar'):
+            self.boton_iniciar.config(state="disabled")
+
+        nivel = niveles[posicion]
+        if self.pool_partidas.disponibles(nivel):
+            self.partida_data = self.sacar_partida(nivel)
+            if self.partida_data:
+                if posicion > 0:
+                    print(f"Partida cargada para nivel alternativo: {nivel}")
+                self.partida_lista()
+                return
+
+        if self.pool_partidas.sin_partidas(nivel):
+            posicion += 1
+            if posicion == len(niveles):
+                # Si no se pudo cargar ninguna partida, mostrar error
+                self.ocultar_cargando()
+                self.show_error_message("No se pudo cargar una partida válida. Verifica que el archivo de partidas contenga datos.")
+                return
+            print(f"Intentando cargar partida para nivel: {niveles[posicion]}")
+            self.pool_partidas.pedir(niveles[posicion])
+
+        self.after(100, self.esperar_partida, niveles, posicion)
+
+    def partida_lista(self):
+        """Construye el tablero de la partida que llegó del pool y habilita INICIAR JUEGO."""
+        self.ocultar_cargando()
+        print(f"Partida cargada: {self.partida_data['nivel_de_dificultad']} - Partida {self.partida_data['partida']}")
+        print(f"Número de claves: {len(self.partida_data['claves'])}")
+
+        for widget in self.board_frame.winfo_children():
+            widget.destroy()
+        self.estado_tablero = []
+        self.build_dynamic_board()
+
+        if hasattr(self, 'level_label'):
+            self.level_label.config(text=f"NIVEL {self.partida_data['nivel_de_dificultad']}")
+        if hasattr(self, 'boton_iniciar') and not self.juego_activo:
+            self.boton_iniciar.config(state="normal")
+
     def show_error_message(self, message):
         """
         Muestra un mensaje de error en la interfaz.
@@ -262,15 +390,20 @@ class GameScreen(tk.Frame):
     def build_dynamic_board(self):
         """
         Construye el tablero dinámicamente basado en los datos de la partida.
-        Crea un tablero 9x9 con celdas blancas bloqueadas por defecto,
-        luego sobreescribe posiciones según las claves del juego.
+        Crea un tablero del tamaño de la partida con celdas blancas bloqueadas
+        por defecto, luego sobreescribe posiciones según las claves del juego.
         """
+        # Dimensiones de la partida; estado_tablero se rehace si no coincide
+        self.filas, self.columnas = dimensiones_partida(self.partida_data)
+        if len(self.estado_tablero) != self.filas or any(len(f) != self.columnas for f in self.estado_tablero):
+            self.estado_tablero = self.nuevo_estado_tablero()
+        
         # Siempre inicializar celdas_blancas, incluso si no hay partida_data
-        self.celdas_blancas = [[None for _ in range(self.board_size)] for _ in range(self.board_size)]
+        self.celdas_blancas = [[None for _ in range(self.columnas)] for _ in range(self.filas)]
         
-        # Paso 1: Crear tablero 9x9 con celdas blancas bloqueadas por defecto
-        for fila in range(self.board_size):
-            for columna in range(self.board_size):
+        # Paso 1: Crear tablero con celdas blancas bloqueadas por defecto
+        for fila in range(self.filas):
+            for columna in range(self.columnas):
                 # Por defecto, colocar una celda blanca "bloqueada" (solo visual)
                 white = tk.Label(
                     self.board_frame, 
@@ -283,12 +416,24 @@ class GameScreen(tk.Frame):
                 white.grid(row=fila, column=columna)
                 self.celdas_blancas[fila][columna] = white
         
+        # Índice de corridas y estado incremental, sincronizado con estado_tablero
+        claves = self.partida_data.get('claves', []) if self.partida_data else []
+        preparada = self.partida_preparada
+        if preparada is not None and preparada.partida is self.partida_data:
+            self.indice_partida = preparada.indice
+        else:
+            self.indice_partida = IndicePartida(claves)
+        self.estado_runs = EstadoRuns(claves, indice=self.indice_partida)
+        self.estado_runs.cargar_tablero(self.estado_tablero)
+        self.motor_pistas = MotorPistas(self.indice_partida)
+        self.motor_pistas.cargar_valores(self.estado_runs.valores)
+        
         # Paso 2: Si hay datos de partida, sobreescribir posiciones según las claves del juego
         if self.partida_data and self.partida_data.get('claves'):
             self.apply_game_claves()
-            print(f"Tablero 9x9 construido con {len(self.partida_data['claves'])} claves")
+            print(f"Tablero {self.filas}x{self.columnas} construido con {len(self.partida_data['claves'])} claves")
         else:
-            print("Tablero 9x9 construido sin claves (modo demo)")
+            print(f"Tablero {self.filas}x{self.columnas} construido sin claves (modo demo)")
 
     def apply_game_claves(self):
         """
@@ -307,7 +452,7 @@ class GameScreen(tk.Frame):
             casillas = clave["casillas"]
             
             # Verificar que los índices estén dentro del rango del tablero
-            if fila < 0 or fila >= self.board_size or columna < 0 or columna >= self.board_size:
+            if not (0 <= fila < self.filas and 0 <= columna < self.columnas):
                 print(f"Índice fuera de rango: fila={fila}, columna={columna}")
                 continue
             
@@ -392,17 +537,19 @@ class GameScreen(tk.Frame):
             
             # Solo registrar si el valor cambió
             if self.numero_seleccionado != valor_actual:
-                self.historial_jugadas.append({
+                jugada = {
                     "fila": fila,
                     "columna": columna,
                     "valor_anterior": valor_actual,
                     "valor_nuevo": self.numero_seleccionado
-                })
+                }
+                self.historial_jugadas.append(jugada)
                 self.historial_rehacer.clear()
+                self.registrar_en_diario("jugada", jugada)
             
             # Actualizar celda y estado
             celda.config(text=str(self.numero_seleccionado))
-            self.estado_tablero[fila][columna] = self.numero_seleccionado
+            self.actualizar_estado_celda(fila, columna, self.numero_seleccionado)
             
             print(f"Número {self.numero_seleccionado} colocado en ({fila+1}, {columna+1})")
             
@@ -410,6 +557,61 @@ class GameScreen(tk.Frame):
             if self.verificar_victoria():
                 self.declarar_victoria()
 
+    def actualizar_estado_celda(self, fila, columna, valor):
+        """
+        Actualiza estado_tablero y el estado incremental de las corridas.
+        Todas las jugadas (colocar, deshacer, rehacer, borrar) pasan por aquí.
+        """
+        self.estado_tablero[fila][columna] = valor
+        if self.estado_runs:
+            self.estado_runs.colocar(fila, columna, valor)
+        if self.motor_pistas:
+            self.motor_pistas.colocar(fila, columna, valor)
+
+    def snapshot_tablero(self):
+        """Devuelve una instantánea compacta (Board) del estado actual del tablero."""
+        return Board.from_matrix(self.estado_tablero, self.indice_partida)
+
+    def registrar_en_diario(self, evento, jugada):
+        """
+        Anexa la jugada al diario (O(1)) y pide un autoguardado completo
+        cada "autoguardado_jugadas" jugadas.
+        """
+        try:
+            self.diario.registrar(evento, jugada)
+        except OSError as e:
+            print(f"[DIARIO] No se pudo registrar la jugada: {e}")
+        if self.autoguardado.registrar_jugada():
+            self.autoguardar()
+
+    def configurar_autoguardado(self):
+        """Aplica la frecuencia de autoguardado de la configuración y arranca la revisión periódica."""
+        config = load_configuracion()
+        self.autoguardado.intervalo = config.get("autoguardado_segundos", self.autoguardado.intervalo)
+        self.autoguardado.cada_jugadas = config.get("autoguardado_jugadas", self.autoguardado.cada_jugadas)
+
+        if self.tick_autoguardado is not None:
+            self.after_cancel(self.tick_autoguardado)
+        self.tick_autoguardado = self.after(1000, self.revisar_autoguardado)
+
+    def revisar_autoguardado(self):
+        """Autoguarda si pasó el intervalo con jugadas sin guardar; se repite cada segundo."""
+        self.tick_autoguardado = None
+        if not self.juego_activo:
+            return
+        if self.autoguardado.vencido():
+            self.autoguardar()
+        self.tick_autoguardado = self.after(1000, self.revisar_autoguardado)
+
+    def autoguardar(self):
+        """
+        Toma una instantánea del juego y la entrega al hilo de autoguardado.
+        Solo copia la partida en memoria; la escritura no bloquea la interfaz.
+        """
+        if not self.partida_data:
+            return
+        self.autoguardado.guardar(self.datos_guardado())
+
     def deshacer_jugada(self):
         """Deshace la última jugada realizada."""
         if not self.historial_jugadas:
@@ -423,9 +625,10 @@ class GameScreen(tk.Frame):
 
         celda = self.celdas_blancas[fila][columna]
         celda.config(text=str(valor_anterior) if valor_anterior else "")
-        self.estado_tablero[fila][columna] = valor_anterior
+        self.actualizar_estado_celda(fila, columna, valor_anterior)
 
         self.historial_rehacer.append(jugada)
+        self.registrar_en_diario("deshacer", jugada)
         print(f"Jugada deshecha: ({fila+1}, {columna+1}) → {valor_anterior}")
 
     def rehacer_jugada(self):
@@ -441,9 +644,10 @@ class GameScreen(tk.Frame):
 
         celda = self.celdas_blancas[fila][columna]
         celda.config(text=str(valor_nuevo) if valor_nuevo else "")
-        self.estado_tablero[fila][columna] = valor_nuevo
+        self.actualizar_estado_celda(fila, columna, valor_nuevo)
 
         self.historial_jugadas.append(jugada)
+        self.registrar_en_diario("rehacer", jugada)
         print(f"Jugada rehecha: ({fila+1}, {columna+1}) → {valor_nuevo}")
 
     def verificar_tablero(self):
@@ -460,63 +664,46 @@ class GameScreen(tk.Frame):
 
         print("Iniciando verificación del tablero...")
 
-        # Verificar que todas las celdas estén completas
-        for fila in range(9):
-            for col in range(9):
-                celda = self.estado_tablero[fila][col]
-                if celda is None:
-                    messagebox.showwarning("Tablero Incompleto", "Hay celdas vacías en el tablero.")
-                    return False
-
-        # Validar claves de filas y columnas
         claves = self.partida_data.get("claves", [])
         
         if not claves:
             messagebox.showinfo("Sin Claves", "No hay claves para validar en esta partida.")
             return True
 
-        for clave in claves:
-            tipo = clave["tipo_de_clave"]
-            fila = clave["fila"] - 1
-            columna = clave["columna"] - 1
-            esperado = clave["clave"]
-            casillas = clave["casillas"]
+        try:
+            # Verificar que todas las celdas blancas estén completas
+            indice = self.indice_partida
+            for fila, col in indice.coordenadas:
+                if self.estado_tablero[fila][col] is None:
+                    messagebox.showwarning("Tablero Incompleto", "Hay celdas vacías en el tablero.")
+                    return False
 
-            suma_real = 0
-            valores_vistos = set()
-
-            try:
-                if tipo == "F":  # Clave de Fila
-                    for offset in range(1, casillas + 1):
-                        valor = self.estado_tablero[fila][columna + offset]
-                        if valor in valores_vistos:
-                            messagebox.showwarning("Error de Validación", f"Valor duplicado {valor} en la clave de fila.")
-                            return False
-                        if not (1 <= valor <= 9):
-                            messagebox.showwarning("Error de Validación", f"Valor fuera de rango {valor} en la clave de fila.")
-                            return False
-                        valores_vistos.add(valor)
-                        suma_real += valor
-
-                elif tipo == "C":  # Clave de Columna
-                    for offset in range(1, casillas + 1):
-                        valor = self.estado_tablero[fila + offset][columna]
-                        if valor in valores_vistos:
-                            messagebox.showwarning("Error de Validación", f"Valor duplicado {valor} en la clave de columna.")
-                            return False
-                        if not (1 <= valor <= 9):
-                            messagebox.showwarning("Error de Validación", f"Valor fuera de rango {valor} en la clave de columna.")
-                            return False
-                        valores_vistos.add(valor)
-                        suma_real += valor
-
-            except IndexError as e:
-                messagebox.showerror("Error de Validación", "Error de índice al validar las claves del tablero.")
-                return False
-
-            if suma_real != esperado:
-                messagebox.showwarning("Error de Validación", f"Clave incorrecta en ({fila+1},{columna+1}): esperada={esperado}, actual={suma_real}")
-                return False
+            # Validar cada corrida a partir del índice, sin recorrer desplazamientos desde las claves
+            for run_id in range(indice.total_runs):
+                tipo = "fila" if indice.tipos_runs[run_id] == "F" else "columna"
+                fila, columna = indice.origenes_runs[run_id]
+                esperado = indice.sumas_runs[run_id]
+
+                suma_real = 0
+                valores_vistos = set()
+
+                for f, c in indice.celdas_de_run(run_id):
+                    valor = self.estado_tablero[f][c]
+                    if valor in valores_vistos:
+                        messagebox.showwarning("Error de Validación", f"Valor duplicado {valor} en la clave de {tipo}.")
+                        return False
+                    if not (1 <= valor <= 9):
+                        messagebox.showwarning("Error de Validación", f"Valor fuera de rango {valor} en la clave de {tipo}.")
+                        return False
+                    valores_vistos.add(valor)
+                    suma_real += valor
+
+                if suma_real != esperado:
+                    messagebox.showwarning("Error de Validación", f"Clave incorrecta en ({fila+1},{columna+1}): esperada={esperado}, actual={suma_real}")
+                    return False
+        except IndexError:
+            messagebox.showerror("Error de Validación", "Error de índice al validar las claves del tablero.")
+            return False
 
         print("Tablero validado correctamente.")
         messagebox.showinfo("¡Felicidades!", "¡El tablero está completo y todas las claves son correctas!")
@@ -533,57 +720,11 @@ class GameScreen(tk.Frame):
         if not self.partida_data:
             return False
         
-        # Verificar que todas las celdas estén completas
-        for fila in range(9):
-            for col in range(9):
-                celda = self.estado_tablero[fila][col]
-                if celda is None:
-                    return False
-        
-        # Validar claves de filas y columnas
-        claves = self.partida_data.get("claves", [])
-        
-        if not claves:
-            return True
+        # Cada corrida mantiene su suma parcial, así que la verificación es O(1)
+        if not self.partida_data.get("claves", []):
+            return all(celda is not None for fila in self.estado_tablero for celda in fila)
         
-        for clave in claves:
-            tipo = clave["tipo_de_clave"]
-            fila = clave["fila"] - 1
-            columna = clave["columna"] - 1
-            esperado = clave["clave"]
-            casillas = clave["casillas"]
-
-            suma_real = 0
-            valores_vistos = set()
-
-            try:
-                if tipo == "F":  # Clave de Fila
-                    for offset in range(1, casillas + 1):
-                        valor = self.estado_tablero[fila][columna + offset]
-                        if valor in valores_vistos:
-                            return False
-                        if not (1 <= valor <= 9):
-                            return False
-                        valores_vistos.add(valor)
-                        suma_real += valor
-
-                elif tipo == "C":  # Clave de Columna
-                    for offset in range(1, casillas + 1):
-                        valor = self.estado_tablero[fila + offset][columna]
-                        if valor in valores_vistos:
-                            return False
-                        if not (1 <= valor <= 9):
-                            return False
-                        valores_vistos.add(valor)
-                        suma_real += valor
-
-            except IndexError:
-                return False
-
-            if suma_real != esperado:
-                return False
-        
-        return True
+        return self.estado_runs is not None and self.estado_runs.completa()
 
     def declarar_victoria(self):
         """
@@ -601,6 +742,9 @@ class GameScreen(tk.Frame):
             if hasattr(self, 'game_timer'):
                 tiempo_usado = self.game_timer.get_elapsed_time()
             
+            # La partida terminó: ya no hay nada que recuperar
+            self.descartar_autoguardado()
+            
             msg = f"🎉 ¡Felicidades {self.nombre_jugador}!\nCompletaste el juego en {tiempo_usado} segundos."
             messagebox.showinfo("¡Juego completado!", msg)
             print(f"[GAME] {self.nombre_jugador} terminó el juego con éxito en nivel {nivel}")
@@ -613,7 +757,8 @@ class GameScreen(tk.Frame):
         """
         Termina el juego según los requisitos del documento.
         - Pregunta confirmación SI/NO
-        - Si SI: termina inmediatamente y muestra nuevo juego
+        - Si SI: termina inmediatamente y deja el tablero vacío; la partida
+          nueva se saca del pool recién al presionar INICIAR JUEGO
         - Si NO: continúa jugando
         - Solo disponible si el juego ha iniciado
         """
@@ -633,6 +778,7 @@ class GameScreen(tk.Frame):
             
             # Terminar el juego actual
             self.juego_activo = False
+            self.descartar_autoguardado()
             
             # Limpiar el tablero actual
             for widget in self.board_frame.winfo_children():
@@ -643,7 +789,7 @@ class GameScreen(tk.Frame):
             self.historial_rehacer.clear()
             
             # Limpiar estado del tablero
-            self.estado_tablero = [[None for _ in range(9)] for _ in range(9)]
+            self.estado_tablero = self.nuevo_estado_tablero()
             
             # Detener temporizador si existe
             if hasattr(self, 'game_timer'):
@@ -655,8 +801,9 @@ class GameScreen(tk.Frame):
                 self.reloj_label.destroy()
                 delattr(self, 'reloj_label')
             
-            # Cargar nueva partida
-            self.load_game_data()
+            # Sin partida: la siguiente se saca al iniciar un juego nuevo
+            self.partida_data = None
+            self.partida_preparada = None
             self.build_dynamic_board()
             
             # Reactivar botón de iniciar juego
@@ -674,7 +821,7 @@ class GameScreen(tk.Frame):
             # Limpiar selección de número
             self.numero_seleccionado = None
             
-            messagebox.showinfo("Nuevo Juego", "Se ha cargado un nuevo juego. Presiona 'INICIAR JUEGO' para comenzar.")
+            messagebox.showinfo("Nuevo Juego", "Presiona 'INICIAR JUEGO' para comenzar un nuevo juego.")
             
         else:  # NO - Continuar jugando
             print("Jugador canceló terminar el juego")
@@ -721,9 +868,6 @@ class GameScreen(tk.Frame):
 
     def guardar_partida_actual(self):
         """Guarda el estado actual del juego en un archivo JSON."""
-        import json
-        import os
-        
         if not self.juego_activo:
             messagebox.showwarning("Guardar Juego", "No hay una partida activa para guardar.")
             return
@@ -733,53 +877,159 @@ class GameScreen(tk.Frame):
             return
 
         try:
-            # Preparar datos para guardar
-            datos_guardado = {
-                "nivel": self.partida_data.get("nivel_de_dificultad", "FÁCIL"),
-                "partida": self.partida_data.get("partida", 1),
-                "tablero": self.estado_tablero,
-                "claves": self.partida_data.get("claves", []),
-                "reloj": self.partida_data.get("reloj", "SIN RELOJ"),
-                "fecha_guardado": "2025-01-01",
-                "jugador": self.name_entry.get() if hasattr(self, 'name_entry') else "Jugador",
-                "historial_jugadas": len(self.historial_jugadas),
-                "historial_rehacer": len(self.historial_rehacer)
-            }
+            # El archivo se escribe en segundo plano, sin bloquear la interfaz;
+            # el resultado se informa cuando la escritura termina
+            numero = self.guardado_manual.guardar(self.datos_guardado())
+            self.after(50, self.confirmar_guardado, numero)
 
-            # Guardar tiempo restante si hay temporizador activo
-            if hasattr(self, 'game_timer'):
-                tiempo_restante = self.game_timer.get_remaining_time()
-                if tiempo_restante is not None:
-                    horas = tiempo_restante // 3600
-                    minutos = (tiempo_restante % 3600) // 60
-                    segundos = tiempo_restante % 60
-                    
-                    datos_guardado["tiempo_restante"] = {
-                        "horas": horas,
-                        "minutos": minutos,
-                        "segundos": segundos
-                    }
+        except Exception as e:
+            print(f"[ERROR] No se pudo guardar la partida: {e}")
+            messagebox.showerror("Guardar Juego", f"❌ Error al guardar la partida: {str(e)}")
 
-            # Crear directorio y guardar archivo
-            os.makedirs("data", exist_ok=True)
-            archivo_guardado = "data/kakuro2025_guardado.json"
-            
-            with open(archivo_guardado, "w", encoding="utf-8") as f:
-                json.dump(datos_guardado, f, indent=4, ensure_ascii=False)
+    def confirmar_guardado(self, numero):
+        """Informa el resultado de GUARDAR JUEGO cuando el hilo de guardado termina."""
+        resultado = self.guardado_manual.resultado(numero)
+        if resultado is None:
+            self.after(50, self.confirmar_guardado, numero)
+            return
 
+        ok, error = resultado
+        if ok:
             messagebox.showinfo("Guardar Juego", "✅ Partida guardada exitosamente.")
-            print(f"[LOG] Partida guardada en {archivo_guardado}")
+            print(f"[LOG] Partida guardada en {ARCHIVO_GUARDADO}")
+        else:
+            print(f"[ERROR] No se pudo guardar la partida: {error}")
+            messagebox.showerror("Guardar Juego", f"❌ Error al guardar la partida: {error}")
+
+    def datos_guardado(self):
+        """Arma el dict del guardado completo (instantánea) de la partida actual."""
+        datos_guardado = {
+            "nivel": self.partida_data.get("nivel_de_dificultad", "FÁCIL"),
+            "partida": self.partida_data.get("partida", 1),
+            "tablero": [list(fila) for fila in self.estado_tablero],
+            "claves": self.partida_data.get("claves", []),
+            "tamaño": {"filas": self.filas, "columnas": self.columnas},
+            "reloj": self.partida_data.get("reloj", "SIN RELOJ"),
+            "fecha_guardado": "2025-01-01",
+            "jugador": self.name_entry.get() if hasattr(self, 'name_entry') else "Jugador",
+            "historial_jugadas": len(self.historial_jugadas),
+            "historial_rehacer": len(self.historial_rehacer),
+            # Pilas completas y última jugada incluida, para reproducir el diario encima
+            "jugadas": list(self.historial_jugadas),
+            "rehacer": list(self.historial_rehacer),
+            "diario_hasta": self.diario.ultimo
+        }
+
+        # Guardar tiempo restante si hay temporizador activo
+        if hasattr(self, 'game_timer'):
+            tiempo_restante = self.game_timer.get_remaining_time()
+            if tiempo_restante is not None:
+                horas = tiempo_restante // 3600
+                minutos = (tiempo_restante % 3600) // 60
+                segundos = tiempo_restante % 60
+                
+                datos_guardado["tiempo_restante"] = {
+                    "horas": horas,
+                    "minutos": minutos,
+                    "segundos": segundos
+                }
 
-        except Exception as e:
-            print(f"[ERROR] No se pudo guardar la partida: {e}")
-            messagebox.showerror("Guardar Juego", f"❌ Error al guardar la partida: {str(e)}")
+        return datos_guardado
+
+    def escribir_guardado(self, datos):
+        """
+        Escribe el autoguardado y descarta del diario las jugadas que incluye.
+        Se ejecuta en el hilo de autoguardado.
+
+        El autoguardado registra en "diario_hasta" la última jugada que incluye,
+        así que si el proceso muere antes de compactar el diario esas jugadas
+        no se reproducen dos veces. No toca el guardado de GUARDAR JUEGO.
+        Con DESCARTAR_AUTOGUARDADO borra el autoguardado y vacía el diario.
+        """
+        if datos is DESCARTAR_AUTOGUARDADO:
+            if os.path.exists(ARCHIVO_AUTOGUARDADO):
+                os.remove(ARCHIVO_AUTOGUARDADO)
+            self.diario.vaciar()
+            return
+
+        # Guardar archivo (reemplazo atómico; crea data/ si no existe)
+        escribir_json_atomico(ARCHIVO_AUTOGUARDADO, datos, indent=4)
+        self.diario.vaciar(hasta=datos["diario_hasta"])
+
+    def escribir_guardado_manual(self, datos):
+        """Escribe el guardado de GUARDAR JUEGO. Se ejecuta en el hilo de guardado."""
+        datos = dict(datos)
+        datos.pop("diario_hasta", None)  # el diario solo se reproduce sobre el autoguardado
+        escribir_json_atomico(ARCHIVO_GUARDADO, datos, indent=4)
+
+    def descartar_autoguardado(self):
+        """Pide al hilo de autoguardado borrar el autoguardado y el diario de una partida que terminó."""
+        self.autoguardado.guardar(DESCARTAR_AUTOGUARDADO)
+
+    def esperar_guardados(self, accion):
+        """
+        Indica si los hilos de guardado terminaron sus escrituras. Si no,
+        vuelve a llamar a accion con after() cuando terminen, sin bloquear
+        el hilo de Tk (como confirmar_guardado).
+
+        Returns:
+            bool: True si no hay escrituras pendientes
+        """
+        if self.autoguardado.esperar(0) and self.guardado_manual.esperar(0):
+            return True
+        if self.reintento_guardado is None:
+            self.reintento_guardado = self.after(50, self.reintentar_tras_guardado, accion)
+        return False
+
+    def reintentar_tras_guardado(self, accion):
+        """Vuelve a ejecutar una acción que esperaba a los hilos de guardado."""
+        self.reintento_guardado = None
+        accion()
 
     def cargar_partida_guardada(self):
-        """Carga una partida guardada desde el archivo JSON."""
+        """
+        Carga una partida guardada desde el archivo JSON.
+
+        Si quedó el autoguardado de una partida que no terminó (p. ej. por un
+        cierre inesperado), ofrece recuperarla: se lee el autoguardado y se
+        reproducen encima las jugadas del diario.
+        """
+        # Un autoguardado en curso podría dejar el diario a medio compactar
+        if not self.esperar_guardados(self.cargar_partida_guardada):
+            return
+
+        if not self.ofrecer_recuperacion():
+            self.restaurar_partida(recuperar=False)
+
+    def ofrecer_recuperacion(self):
+        """
+        Si quedó el autoguardado de una partida sin terminar, pregunta si se
+        recupera y, si la respuesta es SI, la restaura.
+
+        Returns:
+            bool: True si se recuperó la partida
+        """
+        if self.juego_activo or not os.path.exists(ARCHIVO_AUTOGUARDADO):
+            return False
+        if not messagebox.askyesno(
+            "Cargar Partida",
+            "Hay una partida sin terminar guardada automáticamente.\n¿Desea recuperarla?"
+        ):
+            return False
+        self.restaurar_partida(recuperar=True)
+        return True
+
+    def restaurar_partida(self, recuperar):
+        """
+        Restaura una partida guardada.
+
+        Args:
+            recuperar: True para el autoguardado más las jugadas del diario,
+                False para el guardado de GUARDAR JUEGO
+        """
         import json
-        import os
         
-        ruta = "data/kakuro2025_guardado.json"
+        ruta = ARCHIVO_AUTOGUARDADO if recuperar else ARCHIVO_GUARDADO
 
         if not os.path.exists(ruta):
             messagebox.showwarning("Cargar Partida", "No hay partida guardada disponible.")
@@ -797,8 +1047,22 @@ class GameScreen(tk.Frame):
                 "claves": partida.get("claves", []),
                 "reloj": partida.get("reloj", "SIN RELOJ")
             }
-
-            self.estado_tablero = partida.get("tablero", [[None]*9 for _ in range(9)])
+            # Los guardados sin "tamaño" toman las dimensiones del tablero guardado
+            filas, columnas = dimensiones_partida(partida)
+            self.partida_data["tamaño"] = {"filas": filas, "columnas": columnas}
+
+            # build_dynamic_board rehace la matriz si no tiene el tamaño de la partida
+            self.estado_tablero = partida.get("tablero") or []
+            self.historial_jugadas = list(partida.get("jugadas") or [])
+            self.historial_rehacer = list(partida.get("rehacer") or [])
+
+            # Reproducir las jugadas que quedaron en el diario después del autoguardado
+            if recuperar and "diario_hasta" in partida:
+                eventos = self.diario.leer(desde=partida["diario_hasta"])
+                recuperadas = reproducir(eventos, self.estado_tablero,
+                                         self.historial_jugadas, self.historial_rehacer)
+                if recuperadas:
+                    print(f"[DIARIO] {recuperadas} jugadas recuperadas del diario")
 
             # Restaurar tiempo restante si existe
             tiempo_restante_data = partida.get("tiempo_restante", {})
@@ -815,10 +1079,6 @@ class GameScreen(tk.Frame):
                 self.name_entry.delete(0, tk.END)
                 self.name_entry.insert(0, partida.get("jugador"))
 
-            # Limpiar historiales
-            self.historial_jugadas.clear()
-            self.historial_rehacer.clear()
-
             # Reconstruir tablero
             for widget in self.board_frame.winfo_children():
                 widget.destroy()
@@ -829,14 +1089,11 @@ class GameScreen(tk.Frame):
 
             # Restaurar valores en el tablero
             celdas_restauradas = 0
-            for fila in range(9):
-                for col in range(9):
-                    valor = self.estado_tablero[fila][col]
-                    if isinstance(valor, int) and 1 <= valor <= 9:
-                        celda = self.celdas_blancas[fila][col]
-                        if isinstance(celda, tk.Button):
-                            celda.config(text=str(valor))
-                            celdas_restauradas += 1
+            for (fila, col), valor in self.estado_runs.valores.items():
+                celda = self.celdas_blancas[fila][col]
+                if isinstance(celda, tk.Button):
+                    celda.config(text=str(valor))
+                    celdas_restauradas += 1
 
             # Activar interfaz
             self.juego_activo = True
@@ -848,11 +1105,15 @@ class GameScreen(tk.Frame):
 
             # Mostrar confirmación
             nivel_actual = self.partida_data["nivel_de_dificultad"]
-            messagebox.showinfo("Cargar Juego", f"✅ Partida restaurada correctamente.\nNivel: {nivel_actual}\nCeldas llenas: {celdas_restauradas}/81")
+            messagebox.showinfo("Cargar Juego", f"✅ Partida restaurada correctamente.\nNivel: {nivel_actual}\nCeldas llenas: {celdas_restauradas}/{self.indice_partida.total_celdas}")
 
             # Configurar reloj
             self.setup_reloj()
 
+            # La partida cargada pasa a ser la del autoguardado y el diario
+            self.autoguardar()
+            self.configurar_autoguardado()
+
         except json.JSONDecodeError as e:
             messagebox.showerror("Cargar Juego", "❌ Error al leer el archivo guardado (formato inválido).")
         except Exception as e:
@@ -940,6 +1201,31 @@ class GameScreen(tk.Frame):
         messagebox.showwarning("Tiempo Agotado", "¡Se ha agotado el tiempo!")
         self.terminar_juego()
 
+    def mostrar_pista(self):
+        """
+        Muestra la siguiente casilla deducible y la regla que la justifica.
+        La pista sale del estado incremental de candidatos, sin resolver el tablero.
+        """
+        if not self.juego_activo:
+            messagebox.showwarning("Pista", "El juego no está activo.")
+            return
+
+        pista = self.motor_pistas.pista() if self.motor_pistas else None
+        if pista is None:
+            if self.motor_pistas and not self.motor_pistas.consistente:
+                messagebox.showinfo("Pista", "Hay números en el tablero que no pueden ser parte de la solución.")
+            else:
+                messagebox.showinfo("Pista", "No hay una deducción directa disponible.")
+            return
+
+        celda = self.celdas_blancas[pista["fila"]][pista["columna"]]
+        if isinstance(celda, tk.Button):
+            celda.config(bg="#fff59d")  # Resaltar la casilla deducida
+            self.after(1500, lambda: celda.winfo_exists() and celda.config(bg="white"))
+
+        messagebox.showinfo("Pista", pista["explicacion"])
+        print(f"[PISTA] {pista['regla']}: ({pista['fila']+1}, {pista['columna']+1}) = {pista['valor']}")
+
     def borrar_casilla(self):
         """
         Borra el número de la celda seleccionada.
@@ -952,29 +1238,30 @@ class GameScreen(tk.Frame):
             messagebox.showwarning("Borrar Casilla", "Por favor, selecciona un número del panel numérico.")
             return
         
-        # Buscar la celda que contiene el número seleccionado
-        for fila in range(9):
-            for columna in range(9):
+        # Buscar la celda que contiene el número seleccionado (solo casillas llenas)
+        for (fila, columna), valor in list(self.estado_runs.valores.items()):
+            if valor == self.numero_seleccionado:
                 celda = self.celdas_blancas[fila][columna]
-                if (isinstance(celda, tk.Button) and 
-                    celda.cget("text") == str(self.numero_seleccionado)):
+                if isinstance(celda, tk.Button):
                     
                     # Capturar el valor actual antes de borrar
                     valor_actual = self.estado_tablero[fila][columna]
                     
                     # Registrar la jugada en el historial
-                    self.historial_jugadas.append({
+                    jugada = {
                         "fila": fila,
                         "columna": columna,
                         "valor_anterior": valor_actual,
                         "valor_nuevo": None
-                    })
+                    }
+                    self.historial_jugadas.append(jugada)
                     # Limpiar el historial de rehacer
                     self.historial_rehacer.clear()
+                    self.registrar_en_diario("borrar", jugada)
                     
                     # Borrar el número
                     celda.config(text="")
-                    self.estado_tablero[fila][columna] = None
+                    self.actualizar_estado_celda(fila, columna, None)
                     
                     print(f"Casilla borrada en ({fila+1}, {columna+1})")
                     return
@@ -7,15 +7,19 @@ import json
 import os
 from datetime import datetime
 from tkinter import messagebox
-from logic.partida_loader import cargar_partida_aleatoria
 from logic.config_loader import load_configuracion
+from logic.board import Board
+from logic.partida_loader import dimensiones_partida
+from logic.persistencia import actualizar_json, escribir_json_atomico
+from logic.record_manager import NIVELES, guardar_record, obtener_top_records
+from logic.servicio_records import TOP_K, fila_lista
+from logic.validator import KakuroValidator
 
 
 class SaveLoadManager:
     def __init__(self):
         self.save_file = "data/kakuro2025_juego_actual.json"
         self.partidas_file = "data/kakuro2025_partidas.json"
-        self.records_file = "data/kakuro2025_récords.json"
         
         # Asegurar que el directorio data existe
         os.makedirs("data", exist_ok=True)
@@ -26,7 +30,7 @@ class SaveLoadManager:
         
         Args:
             partida_data (dict): Datos de la partida
-            estado_tablero (list): Estado actual del tablero
+            estado_tablero (list o Board): Estado actual del tablero
             tiempo_transcurrido (int): Tiempo transcurrido en segundos
             tiempo_restante (int): Tiempo restante en segundos
             
@@ -34,6 +38,9 @@ class SaveLoadManager:
             bool: True si se guardó correctamente, False en caso contrario
         """
         try:
+            if isinstance(estado_tablero, Board):
+                estado_tablero = estado_tablero.to_matrix()
+            
             # Preparar datos para guardar
             save_data = {
                 "fecha_guardado": datetime.now().isoformat(),
@@ -45,9 +52,8 @@ class SaveLoadManager:
                 "nivel_dificultad": partida_data.get("nivel_de_dificultad", "FÁCIL")
             }
             
-            # Guardar en archivo
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            # Guardar en archivo (reemplazo atómico)
+            escribir_json_atomico(self.save_file, save_data)
             
             print(f"[SAVE] Juego guardado exitosamente en {self.save_file}")
             return True
@@ -103,25 +109,33 @@ class SaveLoadManager:
                 print(f"[LOAD] Falta clave requerida: {key}")
                 return False
         
-        # Verificar estructura del estado del tablero
-        estado_tablero = save_data["estado_tablero"]
-        if not isinstance(estado_tablero, list) or len(estado_tablero) != 9:
-            print("[LOAD] Estado del tablero inválido")
-            return False
-        
-        for fila in estado_tablero:
-            if not isinstance(fila, list) or len(fila) != 9:
-                print("[LOAD] Fila del tablero inválida")
-                return False
-        
         # Verificar datos de partida
         partida_data = save_data["partida_data"]
         if not isinstance(partida_data, dict) or "claves" not in partida_data:
             print("[LOAD] Datos de partida inválidos")
             return False
         
+        # Verificar que el tablero tenga las dimensiones de la partida
+        filas, columnas = dimensiones_partida(partida_data)
+        if not KakuroValidator().validate_board_shape(save_data["estado_tablero"], filas, columnas):
+            print(f"[LOAD] Estado del tablero inválido (se esperaba {filas}x{columnas})")
+            return False
+        
         return True
     
+    def load_board(self, save_data, indice=None):
+        """
+        Convierte el tablero de unos datos de guardado en un Board compacto.
+        
+        Args:
+            save_data (dict): Datos devueltos por load_game
+            indice (IndicePartida): Índice de la partida (opcional)
+            
+        Returns:
+            Board: Tablero compacto con los valores guardados
+        """
+        return Board.from_matrix(save_data["estado_tablero"], indice)
+    
     def has_saved_game(self):
         """
         Verifica si existe un juego guardado.
@@ -157,7 +171,7 @@ class SaveLoadManager:
         
         Args:
             partida_data (dict): Datos de la partida
-            estado_tablero (list): Estado final del tablero
+            estado_tablero (list o Board): Estado final del tablero
             tiempo_transcurrido (int): Tiempo transcurrido en segundos
             completada (bool): Si la partida fue completada
             
@@ -165,8 +179,8 @@ class SaveLoadManager:
             bool: True si se guardó correctamente, False en caso contrario
         """
         try:
-            # Cargar partidas existentes
-            partidas = self._load_partidas_file()
+            if isinstance(estado_tablero, Board):
+                estado_tablero = estado_tablero.to_matrix()
             
             # Crear entrada de partida
             partida_entry = {
@@ -179,12 +193,14 @@ class SaveLoadManager:
                 "partida_id": partida_data.get("id", "unknown")
             }
             
-            # Agregar al historial
-            partidas.append(partida_entry)
+            # Agregar al historial con el archivo bloqueado (otro proceso puede estar agregando)
+            def agregar(partidas):
+                if not isinstance(partidas, list):
+                    raise ValueError(f"{self.partidas_file} no es un historial de partidas")
+                partidas.append(partida_entry)
+                return partidas
             
-            # Guardar archivo actualizado
-            with open(self.partidas_file, 'w', encoding='utf-8') as f:
-                json.dump(partidas, f, indent=2, ensure_ascii=False)
+            actualizar_json(self.partidas_file, agregar, por_defecto=[])
             
             print(f"[SAVE] Partida guardada en historial: {partida_entry['fecha']}")
             return True
@@ -233,7 +249,7 @@ class SaveLoadManager:
     
     def save_record(self, jugador, nivel_dificultad, tiempo_transcurrido):
         """
-        Guarda un nuevo récord.
+        Guarda un nuevo récord en el servicio único de récords.
         
         Args:
             jugador (str): Nombre del jugador
@@ -243,75 +259,25 @@ class SaveLoadManager:
         Returns:
             bool: True si se guardó correctamente, False en caso contrario
         """
-        try:
-            # Cargar récords existentes
-            records = self._load_records_file()
-            
-            # Crear entrada de récord
-            record_entry = {
-                "fecha": datetime.now().isoformat(),
-                "jugador": jugador,
-                "nivel_dificultad": nivel_dificultad,
-                "tiempo_transcurrido": tiempo_transcurrido,
-                "tiempo_formato": self._format_time(tiempo_transcurrido)
-            }
-            
-            # Agregar al historial de récords
-            records.append(record_entry)
-            
-            # Ordenar por tiempo (más rápido primero)
-            records.sort(key=lambda x: x["tiempo_transcurrido"])
-            
-            # Mantener solo los mejores 10 récords por nivel
-            records_filtered = []
-            for nivel in ["FÁCIL", "MEDIO", "DIFÍCIL"]:
-                nivel_records = [r for r in records if r["nivel_dificultad"] == nivel]
-                records_filtered.extend(nivel_records[:10])
-            
-            # Guardar archivo actualizado
-            with open(self.records_file, 'w', encoding='utf-8') as f:
-                json.dump(records_filtered, f, indent=2, ensure_ascii=False)
-            
-            print(f"[SAVE] Récord guardado: {jugador} - {nivel_dificultad} - {self._format_time(tiempo_transcurrido)}")
-            return True
-            
-        except Exception as e:
-            print(f"[SAVE] Error al guardar récord: {e}")
+        if not guardar_record(jugador, nivel_dificultad, tiempo_transcurrido):
             return False
-    
-    def _load_records_file(self):
-        """
-        Carga el archivo de récords.
         
-        Returns:
-            list: Lista de récords guardados
-        """
-        try:
-            if os.path.exists(self.records_file):
-                with open(self.records_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return []
-        except Exception as e:
-            print(f"[LOAD] Error al cargar archivo de récords: {e}")
-            return []
+        print(f"[SAVE] Récord guardado: {jugador} - {nivel_dificultad} - {self._format_time(tiempo_transcurrido)}")
+        return True
     
     def get_records(self, nivel_dificultad=None):
         """
-        Obtiene los récords guardados.
+        Obtiene los mejores récords (top 10 por nivel).
         
         Args:
             nivel_dificultad (str): Filtrar por nivel de dificultad
             
         Returns:
-            list: Lista de récords
+            list: Lista de récords con "fecha", "jugador", "nivel_dificultad",
+            "tiempo_transcurrido" y "tiempo_formato"
         """
-        records = self._load_records_file()
-        
-        if nivel_dificultad:
-            records = [r for r in records if r["nivel_dificultad"] == nivel_dificultad]
-        
-        return records
+        niveles = [nivel_dificultad] if nivel_dificultad else NIVELES
+        return [fila_lista(record, nivel) for nivel in niveles for record in obtener_top_records(nivel, TOP_K)]
     
     def _format_time(self, segundos):
         """
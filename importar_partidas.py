@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Une catálogos de partidas en uno solo descartando las repetidas.
+
+Cada partida se identifica por su huella canónica (logic.huella_partida),
+que no cambia al transponer el tablero. Las huellas del catálogo destino se
+guardan en un índice en disco, así que importar solo calcula la huella de
+las partidas nuevas y cada comprobación es O(1).
+
+Uso:
+    python importar_partidas.py generadas.jsonl otras.json -o data/kakuro2025_partidas.json
+"""
+
+import argparse
+import json
+import sys
+
+from logic.huella_partida import HUELLAS_FILE, IndiceHuellas, huella_partida
+from logic.lector_partidas import iterar_partidas
+from logic.partida_loader import PARTIDAS_FILE
+from logic.persistencia import escribir_json_atomico
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Importa partidas de Kakuro sin repetidas")
+    parser.add_argument("archivos", nargs="+", help="Catálogos a importar (.json o .jsonl)")
+    parser.add_argument("-o", "--salida", default=PARTIDAS_FILE,
+                        help=f"Catálogo destino (por defecto {PARTIDAS_FILE})")
+    parser.add_argument("--indice", default=HUELLAS_FILE,
+                        help=f"Índice de huellas del catálogo destino (por defecto {HUELLAS_FILE})")
+    return parser.parse_args(argv)
+
+
+def _leer_existentes(ruta):
+    try:
+        return list(iterar_partidas(ruta))
+    except FileNotFoundError:
+        return []
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    jsonl = args.salida.endswith(".jsonl")
+
+    try:
+        existentes = [] if jsonl else _leer_existentes(args.salida)
+    except (ValueError, OSError) as e:
+        print(f"[IMPORTAR] No se pudo leer {args.salida}: {e}", file=sys.stderr)
+        return 1
+
+    importadas = []
+    repetidas = 0
+    invalidas = 0
+    indice = IndiceHuellas(args.indice)
+    if not indice.existe():
+        # Primer uso: se registran las partidas que ya tiene el destino
+        origen = iterar_partidas(args.salida) if jsonl else existentes
+        try:
+            for posicion, partida in enumerate(origen):
+                huella = huella_partida(partida)
+                if huella:
+                    indice.agregar(huella, str(partida.get("id", f"partida_{posicion + 1}")))
+        except FileNotFoundError:
+            pass
+
+    for archivo in args.archivos:
+        try:
+            for partida in iterar_partidas(archivo):
+                huella = huella_partida(partida)
+                if huella is None:
+                    invalidas += 1
+                elif indice.agregar(huella, str(partida.get("id", ""))):
+                    importadas.append(partida)
+                else:
+                    repetidas += 1
+        except (ValueError, OSError) as e:
+            print(f"[IMPORTAR] No se pudo leer {archivo}: {e}", file=sys.stderr)
+            return 1
+
+    if jsonl:
+        with open(args.salida, "a", encoding="utf-8") as f:
+            for partida in importadas:
+                f.write(json.dumps(partida, ensure_ascii=False) + "\n")
+    else:
+        escribir_json_atomico(args.salida, {"partidas": existentes + importadas}, indent=2)
+    indice.guardar()
+
+    print(f"[IMPORTAR] {len(importadas)} partidas importadas en {args.salida}, "
+          f"{repetidas} repetidas, {invalidas} inválidas", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Almacén de récords en SQLite.
+
+Cada récord es una fila (jugador, nivel, tiempo, fecha) de la tabla
+"records", con un índice sobre (nivel, tiempo): guardar un récord es un
+INSERT y pedir los N mejores de un nivel lee solo las N primeras entradas
+del índice, sin cargar ni reordenar el resto. Otro índice sobre el jugador
+sirve para su historial.
+
+La base es un archivo local; se abre en modo WAL para que varios procesos
+de la misma instalación lean mientras otro escribe. Los récords de los
+archivos JSON anteriores se importan una sola vez con migrar_json().
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+RECORDS_DB = "data/kakuro2025_records.db"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    jugador TEXT NOT NULL,
+    nivel TEXT NOT NULL,
+    tiempo INTEGER NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_nivel_tiempo ON records (nivel, tiempo);
+CREATE INDEX IF NOT EXISTS idx_records_jugador ON records (jugador, fecha);
+CREATE TABLE IF NOT EXISTS migraciones (
+    origen TEXT PRIMARY KEY,
+    fecha TEXT NOT NULL
+);
+"""
+
+
+class AlmacenRecords:
+    """
+    Récords de todos los niveles en una base SQLite local.
+    """
+
+    def __init__(self, ruta: str = RECORDS_DB):
+        self.ruta = ruta
+        if ruta != ":memory:":
+            directorio = os.path.dirname(ruta)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conexion = sqlite3.connect(ruta, timeout=5.0, check_same_thread=False)
+        self._conexion.row_factory = sqlite3.Row
+        with self._lock, self._conexion:
+            if ruta != ":memory:":
+                self._conexion.execute("PRAGMA journal_mode=WAL")
+            self._conexion.executescript(_ESQUEMA)
+
+    def agregar(self, jugador: str, nivel: str, tiempo: int, fecha: Optional[str] = None) -> None:
+        """
+        Guarda un récord.
+
+        Args:
+            jugador: Nombre del jugador
+            nivel: Nivel de dificultad
+            tiempo: Tiempo usado en segundos
+            fecha: Fecha "YYYY-MM-DD HH:MM:SS" (por defecto ahora)
+        """
+        fecha = fecha or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock, self._conexion:
+            self._conexion.execute(
+                "INSERT INTO records (jugador, nivel, tiempo, fecha) VALUES (?, ?, ?, ?)",
+                (jugador, nivel, int(tiempo), fecha)
+            )
+
+    def top(self, nivel: str, n: int = 3) -> List[Dict[str, Any]]:
+        """
+        Devuelve los n mejores récords del nivel (menor tiempo primero).
+
+        Returns:
+            List[Dict]: Récords con "jugador", "tiempo" y "fecha"
+        """
+        with self._lock:
+            filas = self._conexion.execute(
+                "SELECT jugador, tiempo, fecha FROM records WHERE nivel = ? "
+                "ORDER BY tiempo, fecha LIMIT ?",
+                (nivel, n)
+            ).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def historial(self, jugador: str, nivel: Optional[str] = None,
+                  limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Devuelve los récords de un jugador, del más reciente al más antiguo.
+
+        Args:
+            jugador: Nombre del jugador
+            nivel: Filtrar por nivel (opcional)
+            limite: Número máximo de récords (opcional)
+
+        Returns:
+            List[Dict]: Récords con "nivel", "tiempo" y "fecha"
+        """
+        consulta = "SELECT nivel, tiempo, fecha FROM records WHERE jugador = ?"
+        parametros: List[Any] = [jugador]
+        if nivel is not None:
+            consulta += " AND nivel = ?"
+            parametros.append(nivel)
+        consulta += " ORDER BY fecha DESC, id DESC"
+        if limite is not None:
+            consulta += " LIMIT ?"
+            parametros.append(limite)
+
+        with self._lock:
+            filas = self._conexion.execute(consulta, parametros).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def cantidad(self, nivel: Optional[str] = None) -> int:
+        """Número de récords guardados (de un nivel o de todos)."""
+        with self._lock:
+            if nivel is None:
+                fila = self._conexion.execute("SELECT COUNT(*) FROM records").fetchone()
+            else:
+                fila = self._conexion.execute("SELECT COUNT(*) FROM records WHERE nivel = ?", (nivel,)).fetchone()
+        return fila[0]
+
+    def version(self) -> int:
+        """
+        Versión de los datos (PRAGMA data_version): cambia cuando otra
+        conexión, p. ej. otro proceso, confirma cambios en la base.
+        """
+        with self._lock:
+            return self._conexion.execute("PRAGMA data_version").fetchone()[0]
+
+    def eliminar_nivel(self, nivel: str) -> None:
+        """Elimina todos los récords de un nivel."""
+        with self._lock, self._conexion:
+            self._conexion.execute("DELETE FROM records WHERE nivel = ?", (nivel,))
+
+    def migrar_json(self, ruta_json: str) -> int:
+        """
+        Importa los récords de un archivo JSON anterior.
+
+        Acepta los tres formatos que existieron: {nivel: [récords]} de
+        record_manager, la lista de SaveLoadManager (con "nivel_dificultad"
+        y "tiempo_transcurrido") y {"records": [...]} de FileManager.
+
+        La migración se registra en la tabla "migraciones", así que el mismo
+        archivo no se importa dos veces, aunque dos procesos lo intenten a la
+        vez: la comprobación y la inserción van en una sola transacción
+        BEGIN IMMEDIATE. Los récords que no se pueden interpretar se omiten.
+
+        Returns:
+            int: Número de récords importados
+        """
+        origen = os.path.abspath(ruta_json)
+        with self._lock:
+            ya_migrado = self._conexion.execute(
+                "SELECT 1 FROM migraciones WHERE origen = ?", (origen,)
+            ).fetchone()
+        if ya_migrado or not os.path.exists(ruta_json):
+            return 0
+
+        try:
+            with open(ruta_json, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[RECORDS] No se pudo migrar {ruta_json}: {e}")
+            return 0
+
+        if isinstance(data, dict) and isinstance(data.get("records"), list):
+            data = data["records"]
+        if isinstance(data, list):
+            por_nivel = ((None, data),)
+        elif isinstance(data, dict):
+            por_nivel = data.items()
+        else:
+            por_nivel = ()
+
+        filas = []
+        for nivel, records in por_nivel:
+            for record in records if isinstance(records, list) else []:
+                if not isinstance(record, dict):
+                    continue
+                nivel_record = nivel or record.get("nivel") or record.get("nivel_dificultad")
+                try:
+                    tiempo = int(record.get("tiempo", record.get("tiempo_transcurrido")))
+                except (TypeError, ValueError):
+                    continue
+                if record.get("jugador") and nivel_record:
+                    filas.append((str(record["jugador"]), str(nivel_record), tiempo, str(record.get("fecha", ""))))
+
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE")
+            try:
+                ya_migrado = self._conexion.execute(
+                    "SELECT 1 FROM migraciones WHERE origen = ?", (origen,)
+                ).fetchone()
+                if ya_migrado:
+                    # Otro proceso lo migró mientras se leía el archivo
+                    self._conexion.rollback()
+                    return 0
+                self._conexion.executemany(
+                    "INSERT INTO records (jugador, nivel, tiempo, fecha) VALUES (?, ?, ?, ?)", filas
+                )
+                self._conexion.execute(
+                    "INSERT INTO migraciones (origen, fecha) VALUES (?, ?)",
+                    (origen, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                )
+                self._conexion.commit()
+            except BaseException:
+                self._conexion.rollback()
+                raise
+        print(f"[RECORDS] {len(filas)} récords migrados desde {ruta_json}")
+        return len(filas)
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base."""
+        with self._lock:
+            self._conexion.close()
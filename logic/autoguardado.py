@@ -0,0 +1,178 @@
+"""
+Autoguardado en un hilo de fondo.
+
+La interfaz toma una instantánea del juego (una copia de la partida en
+memoria, sin tocar el disco) cada cierto número de jugadas o cada cierto
+tiempo y se la entrega a Autoguardado, que la serializa y la escribe desde
+un hilo propio. Así la escritura, que en directorios de red puede tardar,
+no congela el hilo de Tk.
+
+Si llega una instantánea nueva mientras la anterior todavía se escribe,
+solo se conserva la más reciente: las intermedias se descartan sin
+escribirse, porque la nueva ya las incluye. Cada instantánea entregada
+recibe un número; resultado() indica si ya quedó escrita (por sí misma o por
+una posterior que la incluye) y si la escritura falló.
+"""
+
+import atexit
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+INTERVALO = 30  # segundos entre autoguardados
+CADA_JUGADAS = 20  # jugadas entre autoguardados
+
+
+class Autoguardado:
+    """
+    Escritor de instantáneas en segundo plano que une las escrituras pendientes.
+    """
+
+    def __init__(self, escribir: Callable[[Dict[str, Any]], None],
+                 intervalo: float = INTERVALO, cada_jugadas: int = CADA_JUGADAS):
+        """
+        Args:
+            escribir: Guarda una instantánea en disco; se llama desde el hilo de fondo
+            intervalo: Segundos máximos entre autoguardados mientras haya jugadas nuevas
+            cada_jugadas: Jugadas que disparan un autoguardado
+        """
+        self.escribir = escribir
+        self.intervalo = intervalo
+        self.cada_jugadas = cada_jugadas
+        self.jugadas = 0  # jugadas desde la última instantánea
+        self.escritas = 0
+        self.descartadas = 0  # instantáneas reemplazadas antes de escribirse
+        self._ultima = time.monotonic()
+        self._pendiente: Optional[Dict[str, Any]] = None
+        self._entregadas = 0  # número de la última instantánea entregada
+        # Por cada escritura terminada, en orden: número de la instantánea escrita y su error
+        self._escrituras: List[int] = []
+        self._errores: List[Optional[Exception]] = []
+        self._escribiendo = False
+        self._condicion = threading.Condition()
+        self._activo = False
+        self._hilo = None
+
+    def iniciar(self) -> None:
+        """Arranca el hilo de escritura (si no estaba corriendo)."""
+        with self._condicion:
+            if self._activo:
+                return
+            self._activo = True
+        self._hilo = threading.Thread(target=self._trabajar, name="autoguardado", daemon=True)
+        self._hilo.start()
+        # El hilo es daemon: al salir se escribe la instantánea pendiente antes de cortarlo
+        atexit.register(self.detener)
+
+    def detener(self) -> None:
+        """Escribe la instantánea pendiente y detiene el hilo."""
+        with self._condicion:
+            self._activo = False
+            self._condicion.notify_all()
+        if self._hilo is not None and self._hilo is not threading.current_thread():
+            self._hilo.join()
+        self._hilo = None
+
+    def registrar_jugada(self) -> bool:
+        """
+        Cuenta una jugada.
+
+        Returns:
+            bool: True si corresponde tomar una instantánea
+        """
+        self.jugadas += 1
+        return self.jugadas >= self.cada_jugadas or self.vencido()
+
+    def vencido(self) -> bool:
+        """Indica si hay jugadas sin guardar y pasó el intervalo desde la última instantánea."""
+        return self.jugadas > 0 and time.monotonic() - self._ultima >= self.intervalo
+
+    def guardar(self, datos: Dict[str, Any]) -> int:
+        """
+        Entrega una instantánea para escribir en segundo plano. No bloquea.
+
+        La instantánea debe ser una copia: el hilo de fondo la serializa
+        mientras la interfaz sigue modificando el juego.
+
+        Returns:
+            int: Número de la instantánea, para consultar resultado()
+        """
+        self.jugadas = 0
+        self._ultima = time.monotonic()
+        with self._condicion:
+            if self._pendiente is not None:
+                self.descartadas += 1
+            self._entregadas += 1
+            numero = self._entregadas
+            self._pendiente = datos
+            self._condicion.notify_all()
+        if self._hilo is None:
+            self.iniciar()
+        return numero
+
+    def resultado(self, numero: int) -> Optional[Tuple[bool, Optional[Exception]]]:
+        """
+        Consulta si la instantánea entregada con ese número ya se escribió.
+
+        La instantánea la incluye la primera escritura con número mayor o
+        igual (la suya, o una posterior que la reemplazó antes de escribirse);
+        las escrituras siguientes no cambian su resultado.
+
+        Args:
+            numero: Valor devuelto por guardar()
+
+        Returns:
+            None si todavía no se escribió; si no, (ok, error) de la escritura
+            que la incluyó
+        """
+        with self._condicion:
+            posicion = bisect.bisect_left(self._escrituras, numero)
+            if posicion == len(self._escrituras):
+                return None
+            error = self._errores[posicion]
+            return error is None, error
+
+    def esperar(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que se escriban las instantáneas entregadas.
+
+        Returns:
+            bool: True si no queda nada por escribir
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._condicion:
+            while self._pendiente is not None or self._escribiendo:
+                if self._hilo is None:
+                    return False
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._condicion.wait(restante)
+        return True
+
+    def _trabajar(self) -> None:
+        while True:
+            with self._condicion:
+                while self._pendiente is None and self._activo:
+                    self._condicion.wait()
+                if self._pendiente is None:
+                    return
+                datos, self._pendiente = self._pendiente, None
+                numero = self._entregadas
+                self._escribiendo = True
+
+            error = None
+            try:
+                self.escribir(datos)
+                self.escritas += 1
+            except Exception as e:
+                error = e
+                print(f"[AUTOGUARDADO] No se pudo guardar la partida: {e}")
+            finally:
+                with self._condicion:
+                    self._escrituras.append(numero)
+                    self._errores.append(error)
+                    self._escribiendo = False
+                    self._condicion.notify_all()
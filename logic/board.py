@@ -0,0 +1,142 @@
+"""
+Representación compacta del tablero de Kakuro.
+
+El tablero guarda un byte por casilla (0 = vacía) en un bytearray y, por
+cada corrida, la máscara de dígitos presentes en un array('H'). Copiar un
+tablero son dos copias de memoria contigua, así que sirve para tomar
+instantáneas o para retroceder en una búsqueda sin copiar listas de listas.
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+
+from .indice_partida import IndicePartida
+
+
+class Board:
+    """
+    Tablero compacto de filas x columnas con máscaras por corrida.
+    """
+
+    __slots__ = ("filas", "columnas", "celdas", "mascaras_runs", "indice", "_posiciones_runs")
+
+    def __init__(self, filas: int, columnas: int, indice: Optional[IndicePartida] = None):
+        self.filas = filas
+        self.columnas = columnas
+        self.indice = indice
+        self.celdas = bytearray(filas * columnas)
+
+        # Posición lineal de las casillas de cada corrida (compartida entre copias)
+        posiciones: Tuple[Tuple[int, ...], ...] = ()
+        if indice is not None:
+            posiciones = tuple(
+                tuple(f * columnas + c for f, c in indice.celdas_de_run(run_id))
+                for run_id in range(indice.total_runs)
+            )
+        self._posiciones_runs = posiciones
+        self.mascaras_runs = array("H", [0]) * len(posiciones)
+
+    @classmethod
+    def from_indice(cls, indice: IndicePartida) -> "Board":
+        """Crea un tablero vacío con las dimensiones de la partida."""
+        return cls(indice.filas, indice.columnas, indice)
+
+    @classmethod
+    def from_matrix(cls, matriz: List[List[Optional[int]]], indice: Optional[IndicePartida] = None) -> "Board":
+        """
+        Crea un tablero a partir de una matriz estilo estado_tablero.
+
+        Args:
+            matriz: Lista de filas con dígitos o None
+            indice: Índice de la partida (opcional, para las máscaras por corrida)
+        """
+        filas = len(matriz)
+        columnas = len(matriz[0]) if filas else 0
+        if indice is not None:
+            filas = max(filas, indice.filas)
+            columnas = max(columnas, indice.columnas)
+
+        tablero = cls(filas, columnas, indice)
+        celdas = tablero.celdas
+        for f, fila in enumerate(matriz):
+            base = f * columnas
+            for c, valor in enumerate(fila):
+                if isinstance(valor, int) and 1 <= valor <= 9:
+                    celdas[base + c] = valor
+        tablero._recalcular_mascaras()
+        return tablero
+
+    def get(self, fila: int, columna: int) -> Optional[int]:
+        """Devuelve el dígito de una casilla o None si está vacía."""
+        valor = self.celdas[fila * self.columnas + columna]
+        return valor or None
+
+    def set(self, fila: int, columna: int, valor: Optional[int]) -> Optional[int]:
+        """
+        Coloca un dígito (o None para borrar) y actualiza las máscaras.
+
+        Returns:
+            El valor anterior de la casilla
+        """
+        pos = fila * self.columnas + columna
+        anterior = self.celdas[pos]
+        self.celdas[pos] = valor or 0
+
+        indice = self.indice
+        if indice is not None and anterior != (valor or 0):
+            celda_id = indice.id_celda.get((fila, columna))
+            if celda_id is not None:
+                for run_id in indice.runs_de_celda[celda_id]:
+                    self._recalcular_mascara(run_id)
+
+        return anterior or None
+
+    def mascara_run(self, run_id: int) -> int:
+        """Máscara de dígitos presentes en una corrida (bit d = dígito d)."""
+        return self.mascaras_runs[run_id]
+
+    def copy(self) -> "Board":
+        """Copia el tablero (copia de memoria del bytearray y del array de máscaras)."""
+        copia = Board.__new__(Board)
+        copia.filas = self.filas
+        copia.columnas = self.columnas
+        copia.indice = self.indice
+        copia._posiciones_runs = self._posiciones_runs
+        copia.celdas = self.celdas[:]
+        copia.mascaras_runs = self.mascaras_runs[:]
+        return copia
+
+    def to_matrix(self) -> List[List[Optional[int]]]:
+        """Convierte el tablero en una matriz estilo estado_tablero (None = vacía)."""
+        columnas = self.columnas
+        return [
+            [v or None for v in self.celdas[f * columnas:(f + 1) * columnas]]
+            for f in range(self.filas)
+        ]
+
+    def to_bytes(self) -> bytes:
+        """Serializa las casillas (un byte por casilla) para instantáneas."""
+        return bytes(self.celdas)
+
+    def load_bytes(self, datos: bytes) -> None:
+        """Restaura las casillas desde una instantánea de to_bytes()."""
+        if len(datos) != len(self.celdas):
+            raise ValueError("La instantánea no coincide con el tamaño del tablero")
+        self.celdas[:] = datos
+        self._recalcular_mascaras()
+
+    def __eq__(self, otro) -> bool:
+        if not isinstance(otro, Board):
+            return NotImplemented
+        return (self.filas, self.columnas, self.celdas) == (otro.filas, otro.columnas, otro.celdas)
+
+    def _recalcular_mascara(self, run_id: int) -> None:
+        celdas = self.celdas
+        mascara = 0
+        for pos in self._posiciones_runs[run_id]:
+            mascara |= 1 << celdas[pos]
+        self.mascaras_runs[run_id] = mascara & ~1  # el bit 0 corresponde a casillas vacías
+
+    def _recalcular_mascaras(self) -> None:
+        for run_id in range(len(self._posiciones_runs)):
+            self._recalcular_mascara(run_id)
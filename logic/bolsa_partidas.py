@@ -0,0 +1,193 @@
+"""
+Bolsa persistente de partidas por nivel (sorteo sin reposición).
+
+Para cada nivel se guarda en disco una permutación de las posiciones del
+catálogo y un cursor. Sortear es leer la posición bajo el cursor y
+avanzarlo, así que cuesta O(1) y no se repite ninguna partida hasta vaciar
+la bolsa, aunque el juego se cierre o varios jugadores usen la misma
+instalación.
+
+Archivos (dentro de BOLSAS_DIR):
+    estado.json        por nivel: firma del catálogo, generación, cantidad y cursor
+    <nivel>.perm       permutación del nivel como array('I') (se escribe al rellenar)
+
+El estado se vuelve a leer antes de cada sorteo, con el bloqueo del
+archivo de estado tomado, para que dos procesos que comparten la
+instalación avancen el mismo cursor sin pisarse. Los archivos se escriben
+con reemplazo atómico (ver persistencia). Si la permutación o el cursor no
+se pueden guardar, el sorteo falla con OSError en vez de avanzar solo en
+memoria: al reiniciar se repetirían partidas.
+"""
+
+import json
+import os
+import random
+import unicodedata
+import uuid
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+from .persistencia import bloqueo_archivo, escribir_bytes_atomico, escribir_json_atomico
+
+
+BOLSAS_DIR = "data/bolsas"
+
+
+def _nombre_archivo(nivel: str) -> str:
+    """Nombre ASCII del archivo de permutación de un nivel ("DIFÍCIL" -> "dificil")."""
+    sin_tildes = unicodedata.normalize("NFKD", nivel).encode("ascii", "ignore").decode("ascii")
+    return sin_tildes.lower() + ".perm"
+
+
+class BolsaPartidas:
+    """
+    Bolsas por nivel con permutación y cursor persistentes.
+    """
+
+    def __init__(self, directorio: str = BOLSAS_DIR):
+        self.directorio = directorio
+        self.ruta_estado = os.path.join(directorio, "estado.json")
+        self._estado: Dict[str, Dict[str, Any]] = {}
+        # Permutaciones ya leídas: nivel -> (generación, array)
+        self._permutaciones: Dict[str, Tuple[str, array]] = {}
+
+    def sacar(self, nivel: str, cantidad: int, firma: str) -> Optional[int]:
+        """
+        Saca la siguiente posición de la bolsa del nivel.
+
+        Si la bolsa está vacía o el catálogo cambió (otra firma u otra
+        cantidad) se rellena con una permutación nueva.
+
+        Args:
+            nivel: Nivel de dificultad
+            cantidad: Número de partidas del nivel en el catálogo
+            firma: Identifica el contenido del catálogo del nivel
+
+        Returns:
+            Posición (base 0) de la partida dentro del nivel, o None si no hay partidas
+
+        Raises:
+            OSError: Si la bolsa no se puede guardar (después de los reintentos
+                de persistencia); el cursor no avanza
+        """
+        if cantidad <= 0:
+            return None
+
+        try:
+            try:
+                with bloqueo_archivo(self.ruta_estado):
+                    return self._sacar(nivel, cantidad, firma)
+            except TimeoutError as e:
+                # Sin bloqueo se sortea igual: a lo sumo se repite una partida
+                print(f"[PARTIDAS] {e}; se sortea sin bloquear")
+                return self._sacar(nivel, cantidad, firma)
+        except OSError:
+            # El estado en disco es el válido; se vuelve a leer en el próximo sorteo
+            self._estado = {}
+            raise
+
+    def _sacar(self, nivel: str, cantidad: int, firma: str) -> int:
+        self._leer_estado()
+        bolsa = self._estado.get(nivel)
+        ultima = None
+        if bolsa is not None and bolsa.get("firma") == firma and bolsa.get("cantidad") == cantidad:
+            permutacion = self._permutacion(nivel, bolsa["generacion"], cantidad)
+            if permutacion is not None and bolsa["cursor"] < cantidad:
+                posicion = permutacion[bolsa["cursor"]]
+                bolsa["cursor"] += 1
+                self._guardar_estado()
+                return posicion
+            if permutacion is not None and cantidad > 1:
+                ultima = permutacion[cantidad - 1]
+
+        bolsa = self._rellenar(nivel, cantidad, firma, ultima)
+        posicion = self._permutaciones[nivel][1][0]
+        bolsa["cursor"] = 1
+        self._guardar_estado()
+        return posicion
+
+    def restantes(self, nivel: str) -> int:
+        """Partidas que quedan en la bolsa del nivel (0 si no existe)."""
+        self._leer_estado()
+        bolsa = self._estado.get(nivel)
+        if bolsa is None:
+            return 0
+        return max(bolsa["cantidad"] - bolsa["cursor"], 0)
+
+    def vaciar(self, nivel: Optional[str] = None) -> None:
+        """
+        Descarta la bolsa de un nivel (o de todos) para empezar una nueva.
+
+        Args:
+            nivel: Nivel a descartar, o None para todos
+        """
+        try:
+            try:
+                with bloqueo_archivo(self.ruta_estado):
+                    self._vaciar(nivel)
+            except TimeoutError as e:
+                # Igual que en sacar: sin bloqueo se vacía de todos modos
+                print(f"[PARTIDAS] {e}; se vacía sin bloquear")
+                self._vaciar(nivel)
+        except OSError as e:
+            # Sin el archivo de permutación la bolsa se rellena en el próximo sorteo
+            print(f"[PARTIDAS] No se pudo guardar el estado de las bolsas: {e}")
+
+    def _vaciar(self, nivel: Optional[str]) -> None:
+        self._leer_estado()
+        niveles = list(self._estado) if nivel is None else [nivel]
+        for nivel_key in niveles:
+            self._estado.pop(nivel_key, None)
+            self._permutaciones.pop(nivel_key, None)
+            try:
+                os.remove(os.path.join(self.directorio, _nombre_archivo(nivel_key)))
+            except OSError:
+                pass
+        self._guardar_estado()
+
+    def _rellenar(self, nivel: str, cantidad: int, firma: str, ultima: Optional[int]) -> Dict[str, Any]:
+        """Crea una permutación nueva evitando empezar por la última partida jugada."""
+        permutacion = array("I", range(cantidad))
+        random.shuffle(permutacion)
+        if ultima is not None and permutacion[0] == ultima:
+            permutacion[0], permutacion[-1] = permutacion[-1], permutacion[0]
+
+        generacion = uuid.uuid4().hex
+        escribir_bytes_atomico(os.path.join(self.directorio, _nombre_archivo(nivel)), permutacion.tobytes())
+
+        self._permutaciones[nivel] = (generacion, permutacion)
+        bolsa = {"firma": firma, "generacion": generacion, "cantidad": cantidad, "cursor": 0}
+        self._estado[nivel] = bolsa
+        return bolsa
+
+    def _permutacion(self, nivel: str, generacion: str, cantidad: int) -> Optional[array]:
+        """Devuelve la permutación del nivel, leyéndola del disco si cambió de generación."""
+        guardada = self._permutaciones.get(nivel)
+        if guardada is not None and guardada[0] == generacion:
+            return guardada[1]
+
+        permutacion = array("I")
+        try:
+            with open(os.path.join(self.directorio, _nombre_archivo(nivel)), "rb") as f:
+                permutacion.fromfile(f, cantidad)
+        except (OSError, EOFError):
+            return None
+
+        self._permutaciones[nivel] = (generacion, permutacion)
+        return permutacion
+
+    def _leer_estado(self) -> None:
+        """Relee el estado del disco; si no se puede, se conserva el de memoria."""
+        try:
+            with open(self.ruta_estado, "r", encoding="utf-8") as f:
+                estado = json.load(f)
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[PARTIDAS] Estado de bolsas no válido, se ignora: {e}")
+            return
+        if isinstance(estado, dict):
+            self._estado = estado
+
+    def _guardar_estado(self) -> None:
+        escribir_json_atomico(self.ruta_estado, self._estado, indent=None)
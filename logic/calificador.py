@@ -0,0 +1,306 @@
+"""
+Calificación de dificultad de partidas según el trabajo del solver.
+
+La partida se resuelve aplicando técnicas lógicas de menor a mayor
+dificultad, volviendo siempre a la más simple en cuanto una hace progreso:
+
+- "eliminacion": un dígito colocado se descarta en el resto de su corrida.
+- "suma_de_corrida": las casillas abiertas solo admiten los dígitos de las
+  combinaciones que completan la suma restante.
+- "digito_obligado": un dígito que está en todas las combinaciones de la
+  corrida y solo cabe en una casilla va en esa casilla.
+- "combinaciones": se descartan las combinaciones que no caben en los
+  candidatos de la corrida o que dejan una casilla sin dígito.
+
+Si ninguna técnica avanza se pasa a búsqueda con retroceso, contando los
+retrocesos y el ancho de cada ramificación. El puntaje suma el peso de la
+técnica más difícil usada, los usos de cada técnica, el tamaño de la
+partida y la búsqueda; los umbrales de UMBRALES_NIVEL lo convierten en nivel.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .combinaciones import combinaciones
+from .indice_partida import IndicePartida
+from .solver import KakuroSolver, MASCARA_COMPLETA
+
+
+_POPCOUNT = [bin(m).count("1") for m in range(1 << 10)]
+
+# Peso de cada técnica (en orden de aplicación)
+PESOS_TECNICAS = {
+    "eliminacion": 1,
+    "suma_de_corrida": 2,
+    "digito_obligado": 4,
+    "combinaciones": 8,
+}
+PESO_RETROCESO = 25
+PESO_RAMIFICACION = 10
+PESO_CASILLA = 1
+
+# Puntaje máximo (exclusivo) de cada nivel; lo que supera el último es EXPERTO.
+# Calibrado con partidas de logic.generador de 5x5 a 9x9.
+UMBRALES_NIVEL = [("FÁCIL", 70), ("MEDIO", 100), ("DIFÍCIL", 140)]
+NIVEL_A_DIFICULTAD = {"FÁCIL": "facil", "MEDIO": "normal", "DIFÍCIL": "dificil", "EXPERTO": "experto"}
+
+MAX_NODOS_BUSQUEDA = 100000
+
+
+class CalificadorDificultad:
+    """
+    Resuelve una partida como lo haría una persona y registra qué hizo falta.
+    """
+
+    def __init__(self, claves: List[Dict], indice: Optional[IndicePartida] = None):
+        self.indice = indice if indice is not None else IndicePartida(claves)
+        self._solver = KakuroSolver([], indice=self.indice)
+        self.tecnicas = [
+            ("eliminacion", self._eliminacion),
+            ("suma_de_corrida", self._suma_de_corrida),
+            ("digito_obligado", self._digito_obligado),
+            ("combinaciones", self._combinaciones),
+        ]
+
+        self.usos = {nombre: 0 for nombre, _ in self.tecnicas}
+        self.nodos = 0
+        self.retrocesos = 0
+        self.ramificaciones: List[int] = []
+
+    def calificar(self) -> Dict[str, Any]:
+        """
+        Resuelve la partida y calcula su dificultad.
+
+        Returns:
+            Dict con "resuelta", "tecnicas" (usos por técnica), "retrocesos",
+            "nodos", "ramificacion_maxima", "ramificacion_media", "puntaje" y "nivel"
+        """
+        candidatos = [MASCARA_COMPLETA] * self.indice.total_celdas
+        resuelta = self._logica(candidatos) if candidatos else None
+        if resuelta is None:
+            resuelta = False
+        elif not resuelta:
+            resuelta = self._buscar(candidatos)
+
+        puntaje = self._puntaje()
+        return {
+            "resuelta": resuelta,
+            "tecnicas": dict(self.usos),
+            "retrocesos": self.retrocesos,
+            "nodos": self.nodos,
+            "ramificacion_maxima": max(self.ramificaciones, default=0),
+            "ramificacion_media": (
+                sum(self.ramificaciones) / len(self.ramificaciones) if self.ramificaciones else 0.0
+            ),
+            "puntaje": puntaje,
+            "nivel": nivel_por_puntaje(puntaje),
+        }
+
+    def _logica(self, candidatos: List[int]) -> Optional[bool]:
+        """
+        Aplica las técnicas hasta resolver o atascarse.
+
+        Returns:
+            True si quedó resuelta, False si hace falta búsqueda, None si es contradictoria
+        """
+        while True:
+            if all(_POPCOUNT[m] == 1 for m in candidatos):
+                return True if self._asignacion_valida(candidatos) else None
+            for nombre, tecnica in self.tecnicas:
+                progreso = tecnica(candidatos)
+                if progreso is None:
+                    return None
+                if progreso:
+                    self.usos[nombre] += 1
+                    break
+            else:
+                return False
+
+    def _buscar(self, candidatos: List[int]) -> bool:
+        """Búsqueda con retroceso (MRV) contando retrocesos y ancho de ramificación."""
+        self.nodos += 1
+        if self.nodos > MAX_NODOS_BUSQUEDA:
+            return False
+
+        mejor = -1
+        mejor_cuenta = 10
+        for idx, m in enumerate(candidatos):
+            cuenta = _POPCOUNT[m]
+            if 1 < cuenta < mejor_cuenta:
+                mejor = idx
+                mejor_cuenta = cuenta
+        if mejor < 0:
+            return self._asignacion_valida(candidatos)
+
+        self.ramificaciones.append(mejor_cuenta)
+        m = candidatos[mejor]
+        while m:
+            bit = m & -m
+            m ^= bit
+            copia = list(candidatos)
+            copia[mejor] = bit
+            if self._solver.propagar(copia, self.indice.runs_de_celda[mejor]) and self._buscar(copia):
+                candidatos[:] = copia
+                return True
+            self.retrocesos += 1
+        return False
+
+    def _asignacion_valida(self, candidatos: List[int]) -> bool:
+        """
+        Comprueba una asignación completa: cada casilla con un solo dígito y
+        cada corrida con dígitos distintos que suman su clave. Las técnicas
+        solo podan candidatos, así que pueden dejar un dígito por casilla
+        sin que las sumas cierren.
+        """
+        for run_id, celdas in enumerate(self.indice.celdas_runs):
+            usados = 0
+            suma = 0
+            for celda_id in celdas:
+                m = candidatos[celda_id]
+                if _POPCOUNT[m] != 1 or usados & m:
+                    return False
+                usados |= m
+                suma += m.bit_length() - 1
+            if suma != self.indice.sumas_runs[run_id]:
+                return False
+        return True
+
+    def _estado_run(self, candidatos: List[int], run_id: int):
+        """Dígitos fijos, casillas abiertas y combinaciones posibles de una corrida."""
+        fijos = 0
+        resto = self.indice.sumas_runs[run_id]
+        abiertas = []
+        for celda_id in self.indice.celdas_runs[run_id]:
+            m = candidatos[celda_id]
+            if _POPCOUNT[m] == 1:
+                fijos |= m
+                resto -= m.bit_length() - 1
+            else:
+                abiertas.append(celda_id)
+        combos = [c for c in combinaciones(resto, len(abiertas)) if not c & fijos]
+        return fijos, abiertas, combos
+
+    def _eliminacion(self, candidatos: List[int]) -> Optional[bool]:
+        progreso = False
+        for celdas in self.indice.celdas_runs:
+            fijos = 0
+            for celda_id in celdas:
+                m = candidatos[celda_id]
+                if _POPCOUNT[m] == 1:
+                    if fijos & m:
+                        return None
+                    fijos |= m
+            for celda_id in celdas:
+                m = candidatos[celda_id]
+                if _POPCOUNT[m] > 1 and m & fijos:
+                    m &= ~fijos
+                    if not m:
+                        return None
+                    candidatos[celda_id] = m
+                    progreso = True
+        return progreso
+
+    def _suma_de_corrida(self, candidatos: List[int]) -> Optional[bool]:
+        progreso = False
+        for run_id in range(self.indice.total_runs):
+            _, abiertas, combos = self._estado_run(candidatos, run_id)
+            if not abiertas:
+                continue
+            permitido = 0
+            for combo in combos:
+                permitido |= combo
+            for celda_id in abiertas:
+                m = candidatos[celda_id] & permitido
+                if not m:
+                    return None
+                if m != candidatos[celda_id]:
+                    candidatos[celda_id] = m
+                    progreso = True
+        return progreso
+
+    def _digito_obligado(self, candidatos: List[int]) -> Optional[bool]:
+        progreso = False
+        for run_id in range(self.indice.total_runs):
+            _, abiertas, combos = self._estado_run(candidatos, run_id)
+            if not abiertas or not combos:
+                continue
+            obligatorio = MASCARA_COMPLETA
+            for combo in combos:
+                obligatorio &= combo
+            while obligatorio:
+                bit = obligatorio & -obligatorio
+                obligatorio ^= bit
+                donde = [celda_id for celda_id in abiertas if candidatos[celda_id] & bit]
+                if not donde:
+                    return None
+                if len(donde) == 1 and candidatos[donde[0]] != bit:
+                    candidatos[donde[0]] = bit
+                    progreso = True
+        return progreso
+
+    def _combinaciones(self, candidatos: List[int]) -> Optional[bool]:
+        progreso = False
+        for run_id in range(self.indice.total_runs):
+            _, abiertas, combos = self._estado_run(candidatos, run_id)
+            if not abiertas:
+                continue
+            union = 0
+            for celda_id in abiertas:
+                union |= candidatos[celda_id]
+
+            # Una combinación sirve si cabe en los candidatos y toca a cada casilla abierta
+            permitido = 0
+            for combo in combos:
+                if combo & ~union:
+                    continue
+                if all(candidatos[celda_id] & combo for celda_id in abiertas):
+                    permitido |= combo
+            for celda_id in abiertas:
+                m = candidatos[celda_id] & permitido
+                if not m:
+                    return None
+                if m != candidatos[celda_id]:
+                    candidatos[celda_id] = m
+                    progreso = True
+        return progreso
+
+    def _puntaje(self) -> float:
+        usadas = [PESOS_TECNICAS[nombre] for nombre, usos in self.usos.items() if usos]
+        puntaje = 5 * max(usadas, default=0)
+        puntaje += sum(PESOS_TECNICAS[nombre] * usos for nombre, usos in self.usos.items())
+        puntaje += PESO_CASILLA * self.indice.total_celdas
+        puntaje += PESO_RETROCESO * self.retrocesos
+        puntaje += PESO_RAMIFICACION * sum(ancho - 1 for ancho in self.ramificaciones)
+        return round(puntaje, 2)
+
+
+def nivel_por_puntaje(puntaje: float) -> str:
+    """Devuelve el nivel ("FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO") de un puntaje."""
+    for nivel, maximo in UMBRALES_NIVEL:
+        if puntaje < maximo:
+            return nivel
+    return "EXPERTO"
+
+
+def calificar_partida(partida: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Califica una partida en el formato de kakuro2025_partidas.json.
+
+    Pensada para ProcessPoolExecutor.map sobre todo el catálogo.
+
+    Returns:
+        Dict con "id", "dificultad_original", "dificultad" (la calculada, en
+        el vocabulario del archivo) y los datos de CalificadorDificultad.calificar
+    """
+    from .partida_loader import _convert_partida_format
+
+    convertida = _convert_partida_format(partida)
+    claves = convertida["claves"] if convertida else []
+
+    resultado = {
+        "id": partida.get("id"),
+        "dificultad_original": partida.get("dificultad"),
+    }
+    calificacion = CalificadorDificultad(claves).calificar()
+    resultado["dificultad"] = NIVEL_A_DIFICULTAD[calificacion["nivel"]]
+    resultado.update(calificacion)
+    return resultado
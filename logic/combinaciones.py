@@ -0,0 +1,86 @@
+"""
+Tabla precalculada de combinaciones para las corridas del Kakuro.
+
+Para cada par (suma objetivo, cantidad de casillas) guarda la máscara de
+dígitos que pueden aparecer en la corrida y la lista de combinaciones de
+dígitos distintos que la completan. La tabla se construye una sola vez al
+importar el módulo (512 subconjuntos de 1-9), así que cualquier cálculo de
+candidatos se reduce a una consulta.
+
+Las combinaciones se codifican como máscaras de bits: el bit d representa
+el dígito d (1-9).
+"""
+
+from typing import Dict, List, Tuple
+
+
+SUMA_MAXIMA = 45  # Suma máxima posible con números 1-9
+MAX_CASILLAS = 9
+
+
+def _construir_tabla() -> Dict[Tuple[int, int], Tuple[int, Tuple[int, ...]]]:
+    """
+    Recorre todos los subconjuntos de {1..9} y los agrupa por (suma, casillas).
+
+    Returns:
+        Dict[(suma, casillas), (mascara_permitida, combinaciones)]
+    """
+    grupos: Dict[Tuple[int, int], List[int]] = {}
+    for subconjunto in range(1, 1 << 9):
+        mascara = subconjunto << 1
+        digitos = [d for d in range(1, 10) if mascara & (1 << d)]
+        grupos.setdefault((sum(digitos), len(digitos)), []).append(mascara)
+
+    tabla = {}
+    for suma in range(SUMA_MAXIMA + 1):
+        for casillas in range(MAX_CASILLAS + 1):
+            combos = tuple(sorted(grupos.get((suma, casillas), [])))
+            permitido = 0
+            for combo in combos:
+                permitido |= combo
+            tabla[(suma, casillas)] = (permitido, combos)
+    return tabla
+
+
+TABLA_COMBINACIONES = _construir_tabla()
+
+_SIN_COMBINACIONES = (0, ())
+
+
+def combinaciones(suma: int, casillas: int) -> Tuple[int, ...]:
+    """
+    Devuelve las combinaciones válidas para una corrida.
+
+    Args:
+        suma: Suma objetivo de la corrida
+        casillas: Número de casillas de la corrida
+
+    Returns:
+        Tuple[int, ...]: Máscaras de las combinaciones (vacía si no hay ninguna)
+    """
+    return TABLA_COMBINACIONES.get((suma, casillas), _SIN_COMBINACIONES)[1]
+
+
+def mascara_permitida(suma: int, casillas: int) -> int:
+    """
+    Devuelve la máscara de dígitos que pueden aparecer en la corrida.
+
+    Args:
+        suma: Suma objetivo de la corrida
+        casillas: Número de casillas de la corrida
+
+    Returns:
+        int: Unión de todas las combinaciones válidas (0 si no hay ninguna)
+    """
+    return TABLA_COMBINACIONES.get((suma, casillas), _SIN_COMBINACIONES)[0]
+
+
+def digitos(mascara: int) -> List[int]:
+    """
+    Convierte una máscara en la lista ordenada de dígitos que contiene.
+
+    Example:
+        >>> digitos(0b1010)
+        [1, 3]
+    """
+    return [d for d in range(1, 10) if mascara & (1 << d)]
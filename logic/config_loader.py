@@ -10,6 +10,8 @@ import json
 import os
 from typing import Dict, Any
 
+from .persistencia import escribir_json_atomico
+
 
 def load_configuracion() -> Dict[str, Any]:
     """
@@ -28,7 +30,9 @@ def load_configuracion() -> Dict[str, Any]:
                 "tiempo_limite": int,   # Tiempo en segundos (solo para TEMPORIZADOR)
                 "horas": int,           # 0-23
                 "minutos": int,         # 0-59
-                "segundos": int         # 0-59
+                "segundos": int,        # 0-59
+                "autoguardado_segundos": int,  # Segundos entre autoguardados
+                "autoguardado_jugadas": int    # Jugadas entre autoguardados
             }
     
     Example:
@@ -43,7 +47,9 @@ def load_configuracion() -> Dict[str, Any]:
         "tiempo_limite": 1800,  # 30 minutos por defecto
         "horas": 0,
         "minutos": 30,
-        "segundos": 0
+        "segundos": 0,
+        "autoguardado_segundos": 30,
+        "autoguardado_jugadas": 20
     }
     
     # Intentar diferentes rutas de archivo
@@ -110,6 +116,12 @@ def load_configuracion() -> Dict[str, Any]:
             if not isinstance(result["segundos"], int) or result["segundos"] < 0 or result["segundos"] > 59:
                 result["segundos"] = config_default["segundos"]
             
+            # Frecuencia del autoguardado
+            for clave in ("autoguardado_segundos", "autoguardado_jugadas"):
+                result[clave] = data.get(clave, config_default[clave])
+                if not isinstance(result[clave], int) or result[clave] <= 0:
+                    result[clave] = config_default[clave]
+            
             # Calcular tiempo límite si no está definido pero sí las horas/minutos/segundos
             if result["tipo_reloj"] == "TEMPORIZADOR" and result["tiempo_limite"] == config_default["tiempo_limite"]:
                 calculated_time = result["horas"] * 3600 + result["minutos"] * 60 + result["segundos"]
@@ -142,13 +154,9 @@ def save_configuracion(config: Dict[str, Any]) -> bool:
         bool: True si se guardó correctamente, False en caso contrario
     """
     try:
-        # Crear directorio data si no existe
-        os.makedirs("data", exist_ok=True)
-        
-        # Guardar en el archivo principal
+        # Guardar en el archivo principal (crea data/ si no existe)
         config_file_path = "data/configuracion.json"
-        with open(config_file_path, 'w', encoding='utf-8') as file:
-            json.dump(config, file, indent=4, ensure_ascii=False)
+        escribir_json_atomico(config_file_path, config, indent=4)
         
         print(f"[CONFIG] Configuración guardada en {config_file_path}")
         return True
@@ -0,0 +1,267 @@
+"""
+Diario de jugadas de solo anexado.
+
+Cada jugada (colocar, borrar) y cada deshacer/rehacer se anexa como una
+línea JSON al diario y se sincroniza con fsync, así que queda en disco a
+costo O(1) sin reescribir el tablero completo. El guardado completo
+(instantánea) se escribe de vez en cuando y registra en "diario_hasta" el
+número de la última jugada que incluye; al compactar, el diario conserva
+solo las jugadas posteriores. La instantánea puede escribirse desde otro
+hilo (logic.autoguardado) mientras la interfaz sigue anexando jugadas.
+
+Para recuperar la partida después de un cierre inesperado se lee la
+instantánea y se reproducen encima las jugadas del diario con número
+mayor que "diario_hasta". Una línea incompleta al final del archivo (el
+proceso murió mientras la escribía) se descarta y el diario se reescribe sin
+ella antes de anexar jugadas nuevas. Compactar también reescribe el diario
+en un archivo temporal que reemplaza al original, así que un cierre a mitad
+de camino deja el diario anterior completo. La reescritura se hace sin el
+bloqueo del diario: registrar no espera a la compactación, y las jugadas
+que llegan mientras tanto se agregan al temporal antes de reemplazar.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .persistencia import _sincronizar_directorio, escribir_bytes_atomico
+
+
+DIARIO_FILE = "data/kakuro2025_autoguardado.diario"
+
+EVENTOS = ("jugada", "borrar", "deshacer", "rehacer")
+_CAMPOS = ("fila", "columna", "valor_anterior", "valor_nuevo")
+
+
+class DiarioJugadas:
+    """
+    Archivo JSON-lines con las jugadas posteriores a la última instantánea.
+
+    Las jugadas se numeran de forma creciente entre compactaciones; el número
+    de la última registrada está en "ultimo".
+    """
+
+    def __init__(self, ruta: str = DIARIO_FILE, sincronizar: bool = True):
+        self.ruta = ruta
+        self.sincronizar = sincronizar
+        self.ultimo = 0  # número de la última jugada registrada
+        self.pendientes = 0  # jugadas registradas desde la última compactación
+        self._archivo = None
+        self._lock = threading.Lock()
+        self._durante_compactacion: Optional[List[str]] = None  # líneas registradas mientras se compacta
+
+    def _abrir(self):
+        if self._archivo is None:
+            directorio = os.path.dirname(self.ruta)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            self._archivo = open(self.ruta, "a", encoding="utf-8")
+        return self._archivo
+
+    def registrar(self, evento: str, jugada: Dict[str, Any]) -> int:
+        """
+        Anexa un evento al diario.
+
+        Args:
+            evento: "jugada", "borrar", "deshacer" o "rehacer"
+            jugada: Dict con "fila", "columna", "valor_anterior" y "valor_nuevo"
+
+        Returns:
+            int: Número asignado al evento
+
+        Raises:
+            ValueError: Si el evento no es válido
+            OSError: Si no se puede escribir el diario
+        """
+        if evento not in EVENTOS:
+            raise ValueError(f"Evento de diario inválido: {evento}")
+
+        with self._lock:
+            numero = self.ultimo + 1
+            linea = {"n": numero, "evento": evento}
+            linea.update((campo, jugada.get(campo)) for campo in _CAMPOS)
+
+            texto = json.dumps(linea, ensure_ascii=False) + "\n"
+            archivo = self._abrir()
+            archivo.write(texto)
+            archivo.flush()
+            if self.sincronizar:
+                os.fsync(archivo.fileno())
+
+            self.ultimo = numero
+            self.pendientes += 1
+            if self._durante_compactacion is not None:
+                self._durante_compactacion.append(texto)
+            return numero
+
+    def leer(self, desde: int = 0) -> List[Dict[str, Any]]:
+        """
+        Lee los eventos con número mayor que desde.
+
+        También continúa la numeración a partir del último evento leído, para
+        que las jugadas nuevas se anexen detrás de las recuperadas.
+
+        Args:
+            desde: "diario_hasta" de la instantánea cargada
+
+        Returns:
+            List[Dict]: Eventos en orden de registro
+        """
+        with self._lock:
+            eventos, completo = self._leer_todo()
+            if not completo:
+                # Sin esto, la próxima jugada se pegaría a la línea cortada
+                self._reescribir(eventos)
+            eventos = [evento for evento in eventos if evento["n"] > desde]
+            self.ultimo = max([desde, self.ultimo] + [evento["n"] for evento in eventos])
+            self.pendientes = len(eventos)
+            return eventos
+
+    def _leer_todo(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Lee los eventos válidos del diario.
+
+        Returns:
+            (eventos, completo): completo es False si el archivo termina en
+            una línea cortada o sin salto de línea
+        """
+        eventos = []
+        try:
+            with open(self.ruta, "rb") as f:
+                for linea in f:
+                    try:
+                        evento = json.loads(linea.decode("utf-8"))
+                    except ValueError:
+                        return eventos, False  # línea cortada por un cierre inesperado
+                    if _es_evento(evento):
+                        eventos.append(evento)
+                    if not linea.endswith(b"\n"):
+                        return eventos, False
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[DIARIO] No se pudo leer {self.ruta}: {e}")
+        return eventos, True
+
+    def _reescribir(self, eventos: List[Dict[str, Any]]) -> None:
+        """Reemplaza el diario (de forma atómica) por los eventos dados."""
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+        datos = "".join(json.dumps(evento, ensure_ascii=False) + "\n" for evento in eventos)
+        escribir_bytes_atomico(self.ruta, datos.encode("utf-8"))
+
+    def vaciar(self, hasta: Optional[int] = None) -> None:
+        """
+        Descarta las jugadas ya incluidas en una instantánea; la numeración
+        no se reinicia.
+
+        El diario se lee y se reescribe en un temporal sin tomar el bloqueo;
+        el bloqueo solo se toma para anotar la última jugada y, al final,
+        para agregar las jugadas registradas mientras tanto y reemplazar el
+        archivo.
+
+        Args:
+            hasta: "diario_hasta" de la instantánea escrita. Las jugadas
+                posteriores, anexadas mientras se escribía, se conservan.
+                Por defecto se descartan todas las registradas hasta ahora.
+
+        Raises:
+            OSError: Si no se puede reescribir; el diario anterior queda completo
+        """
+        with self._lock:
+            limite = self.ultimo
+            self._durante_compactacion = []
+
+        directorio = os.path.dirname(os.path.abspath(self.ruta))
+        temporal = None
+        try:
+            conservar = []
+            if hasta is not None and hasta < limite:
+                conservar = [evento for evento in self._leer_todo()[0] if hasta < evento["n"] <= limite]
+
+            os.makedirs(directorio, exist_ok=True)
+            fd, temporal = tempfile.mkstemp(prefix=f".{os.path.basename(self.ruta)}.", suffix=".tmp", dir=directorio)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("".join(json.dumps(evento, ensure_ascii=False) + "\n" for evento in conservar))
+                f.flush()
+                os.fsync(f.fileno())
+
+                with self._lock:
+                    # Solo las jugadas registradas durante la compactación
+                    nuevas = self._durante_compactacion
+                    f.write("".join(nuevas))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    os.replace(temporal, self.ruta)
+                    temporal = None
+                    if self._archivo is not None:
+                        self._archivo.close()
+                        self._archivo = None
+                    self.pendientes = len(conservar) + len(nuevas)
+            _sincronizar_directorio(directorio)
+        finally:
+            with self._lock:
+                self._durante_compactacion = None
+            if temporal is not None:
+                try:
+                    os.remove(temporal)
+                except OSError:
+                    pass
+
+    def cerrar(self) -> None:
+        """Cierra el archivo del diario."""
+        with self._lock:
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
+
+
+def _es_evento(evento: Any) -> bool:
+    return isinstance(evento, dict) and isinstance(evento.get("n"), int)
+
+
+def reproducir(eventos: List[Dict[str, Any]], tablero: List[List[Optional[int]]],
+               jugadas: List[Dict[str, Any]], rehacer: List[Dict[str, Any]]) -> int:
+    """
+    Aplica eventos del diario sobre un tablero y sus historiales, con el mismo
+    efecto que tuvieron en la interfaz.
+
+    Args:
+        eventos: Eventos leídos con DiarioJugadas.leer
+        tablero: Matriz de valores, se modifica en el lugar
+        jugadas: Historial de deshacer, se modifica en el lugar
+        rehacer: Historial de rehacer, se modifica en el lugar
+
+    Returns:
+        int: Número de eventos aplicados
+    """
+    aplicados = 0
+    for evento in eventos:
+        jugada = {campo: evento.get(campo) for campo in _CAMPOS}
+        fila, columna = jugada["fila"], jugada["columna"]
+        if not (isinstance(fila, int) and isinstance(columna, int)
+                and 0 <= fila < len(tablero) and 0 <= columna < len(tablero[fila])):
+            continue
+
+        tipo = evento.get("evento")
+        if tipo in ("jugada", "borrar"):
+            tablero[fila][columna] = jugada["valor_nuevo"]
+            jugadas.append(jugada)
+            rehacer.clear()
+        elif tipo == "deshacer":
+            if jugadas:
+                jugadas.pop()
+            tablero[fila][columna] = jugada["valor_anterior"]
+            rehacer.append(jugada)
+        elif tipo == "rehacer":
+            if rehacer:
+                rehacer.pop()
+            tablero[fila][columna] = jugada["valor_nuevo"]
+            jugadas.append(jugada)
+        else:
+            continue
+        aplicados += 1
+    return aplicados
@@ -0,0 +1,125 @@
+"""
+Seguimiento incremental del estado de las corridas de una partida.
+
+En lugar de recorrer todo estado_tablero después de cada jugada, cada
+corrida guarda su suma parcial, la máscara de dígitos usados y cuántas
+casillas tiene llenas. Una jugada solo actualiza las corridas que pasan
+por la casilla modificada y la comprobación de victoria es O(1).
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .indice_partida import IndicePartida
+
+
+class EstadoRuns:
+    """
+    Estado incremental de las corridas (filas y columnas) de una partida.
+    """
+
+    def __init__(self, claves: List[Dict], indice: Optional[IndicePartida] = None):
+        if indice is None:
+            indice = IndicePartida(claves)
+        self.indice = indice
+        self.claves_runs: List[int] = indice.sumas_runs  # suma objetivo de cada corrida
+        self.largos: List[int] = [len(celdas) for celdas in indice.celdas_runs]
+
+        total = len(self.claves_runs)
+        self.sumas = [0] * total
+        self.llenas = [0] * total
+        self.usados = [0] * total  # máscara de dígitos presentes (bit d = dígito d)
+        self.repetidos = [0] * total
+        self.conteos = [[0] * 10 for _ in range(total)]
+        self.correctas = [False] * total
+        self.total_correctas = 0
+        self.valores: Dict[Tuple[int, int], int] = {}
+
+    def colocar(self, fila: int, columna: int, valor: Optional[int]) -> None:
+        """
+        Registra el nuevo valor de una casilla (None para borrarla).
+
+        Args:
+            fila: Fila de la casilla (base 0)
+            columna: Columna de la casilla (base 0)
+            valor: Dígito colocado o None
+        """
+        coord = (fila, columna)
+        celda_id = self.indice.id_celda.get(coord)
+        if celda_id is None:
+            return
+        runs = self.indice.runs_de_celda[celda_id]
+
+        anterior = self.valores.get(coord)
+        if anterior == valor:
+            return
+
+        if valor is None:
+            del self.valores[coord]
+        else:
+            self.valores[coord] = valor
+
+        for run_id in runs:
+            if anterior is not None:
+                self._quitar(run_id, anterior)
+            if valor is not None:
+                self._agregar(run_id, valor)
+            self._actualizar_correcta(run_id)
+
+    def cargar_tablero(self, estado_tablero: List[List[Optional[int]]]) -> None:
+        """Sincroniza el estado con una matriz completa (p. ej. al cargar una partida)."""
+        for fila, columna in self.indice.coordenadas:
+            valor = None
+            if fila < len(estado_tablero) and columna < len(estado_tablero[fila]):
+                valor = estado_tablero[fila][columna]
+            self.colocar(fila, columna, valor if isinstance(valor, int) and 1 <= valor <= 9 else None)
+
+    def completa(self) -> bool:
+        """Verifica en O(1) si todas las corridas están llenas y son correctas."""
+        return bool(self.claves_runs) and self.total_correctas == len(self.claves_runs)
+
+    def conflictos(self, fila: int, columna: int) -> List[int]:
+        """
+        Devuelve las corridas de la casilla que ya no pueden cumplirse:
+        tienen dígitos repetidos o su suma parcial supera la clave.
+        Solo revisa las (a lo sumo) dos corridas que pasan por la casilla.
+        """
+        celda_id = self.indice.id_celda.get((fila, columna))
+        if celda_id is None:
+            return []
+        return [
+            run_id for run_id in self.indice.runs_de_celda[celda_id]
+            if self.repetidos[run_id] or self.sumas[run_id] > self.claves_runs[run_id]
+        ]
+
+    def run_correcta(self, run_id: int) -> bool:
+        """Indica si una corrida está llena, sin repetidos y con la suma exacta."""
+        return self.correctas[run_id]
+
+    def _agregar(self, run_id: int, valor: int) -> None:
+        conteo = self.conteos[run_id]
+        if conteo[valor]:
+            self.repetidos[run_id] += 1
+        conteo[valor] += 1
+        self.usados[run_id] |= 1 << valor
+        self.sumas[run_id] += valor
+        self.llenas[run_id] += 1
+
+    def _quitar(self, run_id: int, valor: int) -> None:
+        conteo = self.conteos[run_id]
+        conteo[valor] -= 1
+        if conteo[valor]:
+            self.repetidos[run_id] -= 1
+        else:
+            self.usados[run_id] &= ~(1 << valor)
+        self.sumas[run_id] -= valor
+        self.llenas[run_id] -= 1
+
+    def _actualizar_correcta(self, run_id: int) -> None:
+        correcta = (
+            self.llenas[run_id] == self.largos[run_id]
+            and self.repetidos[run_id] == 0
+            and self.sumas[run_id] == self.claves_runs[run_id]
+        )
+        if correcta != self.correctas[run_id]:
+            self.correctas[run_id] = correcta
+            self.total_correctas += 1 if correcta else -1
@@ -5,68 +5,147 @@ Controla el flujo del juego y el estado actual
 
 from .validator import KakuroValidator
 from .pila_jugadas import PilaJugadas
+from .partida_loader import dimensiones_partida, load_random_partida
+from .indice_partida import IndicePartida
+from .estado_runs import EstadoRuns
+from .board import Board
 
 
 class GameManager:
     def __init__(self):
         self.validator = KakuroValidator()
         self.pila_jugadas = PilaJugadas()
-        self.current_board = None
+        self.partida_data = None
+        self.indice = None  # Índice casilla <-> corridas de la partida
+        self.filas = 0  # Dimensiones del tablero de la partida actual
+        self.columnas = 0
+        self.estado_runs = None  # Sumas parciales y corridas satisfechas
+        self.current_board = None  # Board compacto: un byte por casilla (0 = vacía)
+        self.celdas_llenas = 0
         self.game_state = "menu"  # menu, playing, paused, completed
         self.current_level = None
         self.score = 0
         self.time_elapsed = 0
-    
-    def start_new_game(self, level):
-        """Inicia una nueva partida"""
-        self.current_level = level
+
+    def start_new_game(self, level, partida_data=None):
+        """
+        Inicia una nueva partida.
+        Si no se indica partida_data se carga una partida aleatoria del nivel.
+        """
+        if partida_data is None:
+            partida_data = load_random_partida(level)
+            if partida_data is None:
+                return False
+
+        self.partida_data = partida_data
+        self.current_level = partida_data.get("nivel_de_dificultad", level)
         self.game_state = "playing"
         self.score = 0
         self.time_elapsed = 0
-        # TODO: Cargar tablero del nivel
+
+        claves = partida_data.get("claves", [])
+        self.indice = IndicePartida(claves)
+        self.estado_runs = EstadoRuns(claves, indice=self.indice)
+        self.filas, self.columnas = dimensiones_partida(partida_data)
+        self.current_board = Board(self.filas, self.columnas, self.indice)
+        self.celdas_llenas = 0
         self.pila_jugadas.clear()
-    
+        return True
+
+    def get_value(self, row, col):
+        """Devuelve el valor de una casilla blanca o None si está vacía"""
+        if self.indice is None or (row, col) not in self.indice.id_celda:
+            return None
+        return self.current_board.get(row, col)
+
     def make_move(self, row, col, value):
         """Realiza una jugada"""
         if self.game_state != "playing":
             return False
-        
+
         # Validar la jugada
         if not self.validator.validate_cell_value(value):
             return False
-        
-        # Guardar jugada en la pila
-        self.pila_jugadas.push((row, col, self.current_board[row][col]))
-        
-        # Aplicar la jugada
-        self.current_board[row][col] = value
-        
-        # Verificar si el juego está completo
-        if self.is_game_complete():
-            self.game_state = "completed"
-        
-        return True
-    
+
+        return self._registrar_jugada(row, col, value)
+
+    def clear_cell(self, row, col):
+        """Borra el valor de una casilla"""
+        if self.game_state != "playing":
+            return False
+
+        return self._registrar_jugada(row, col, None)
+
     def undo_move(self):
         """Deshace la última jugada"""
         if self.pila_jugadas.is_empty():
             return False
-        
-        row, col, previous_value = self.pila_jugadas.pop()
-        self.current_board[row][col] = previous_value
+
+        row, col, previous_value, _ = self.pila_jugadas.pop()
+        self._set_cell(row, col, previous_value)
+        if self.game_state == "completed" and not self.is_game_complete():
+            self.game_state = "playing"
         return True
-    
+
+    def redo_move(self):
+        """Rehace la última jugada deshecha"""
+        if not self.pila_jugadas.can_redo():
+            return False
+
+        row, col, _, value = self.pila_jugadas.redo()
+        self._set_cell(row, col, value)
+        if self.is_game_complete():
+            self.game_state = "completed"
+        return True
+
     def is_game_complete(self):
-        """Verifica si el juego está completo"""
-        # TODO: Implementar verificación de completitud
-        return False
-    
+        """Verifica en O(1) si todas las casillas están llenas y todas las corridas se cumplen"""
+        if self.indice is None or self.indice.total_celdas == 0:
+            return False
+        return self.celdas_llenas == self.indice.total_celdas and self.estado_runs.completa()
+
+    def _registrar_jugada(self, row, col, value):
+        """Guarda la jugada en la pila y la aplica"""
+        if self.indice is None or (row, col) not in self.indice.id_celda:
+            return False
+
+        previous_value = self.get_value(row, col)
+        if previous_value == value:
+            return True
+
+        # Guardar jugada en la pila
+        self.pila_jugadas.push((row, col, previous_value, value))
+
+        # Aplicar la jugada
+        self._set_cell(row, col, value)
+
+        # Verificar si el juego está completo
+        if self.is_game_complete():
+            self.game_state = "completed"
+
+        return True
+
+    def _set_cell(self, row, col, value):
+        """Actualiza el tablero compacto y los contadores de completitud"""
+        previous_value = self.current_board.set(row, col, value)
+
+        if previous_value and not value:
+            self.celdas_llenas -= 1
+        elif value and not previous_value:
+            self.celdas_llenas += 1
+
+        self.estado_runs.colocar(row, col, value)
+
+    def snapshot(self):
+        """Devuelve una copia del tablero actual (copia de memoria)"""
+        return self.current_board.copy() if self.current_board is not None else None
+
     def pause_game(self):
         """Pausa el juego"""
         if self.game_state == "playing":
             self.game_state = "paused"
-    
+
     def resume_game(self):
         """Reanuda el juego"""
         if self.game_state == "paused":
-            self.game_state = "playing" 
\ No newline at end of file
+            self.game_state = "playing"
@@ -0,0 +1,367 @@
+"""
+Generador de partidas de Kakuro con solución única.
+
+Una partida se genera en tres pasos:
+
+1. Diseño: se eligen las casillas negras del interior con simetría central y
+   se corrigen las corridas de una casilla o de más de 9, quedándose con la
+   región blanca conexa más grande.
+2. Relleno: se asigna un dígito a cada casilla blanca sin repetir dentro de
+   sus corridas (búsqueda con el criterio de menos candidatos primero).
+3. Claves: las sumas se derivan del relleno y KakuroSolver comprueba que la
+   partida tiene una única solución; si encuentra otra, se ennegrece una
+   casilla en la que difieren y se vuelve a comprobar.
+
+La salida usa el esquema de kakuro2025_partidas.json (tablero, sumas_filas,
+sumas_columnas, solucion), con las sumas en la casilla clave a la izquierda
+o encima de cada corrida.
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from .solver import KakuroSolver
+
+
+DIFICULTADES = ["facil", "normal", "dificil", "experto"]
+
+# Tamaño por defecto y proporción de casillas negras del interior por dificultad
+PARAMETROS_DIFICULTAD = {
+    "facil": {"filas": 5, "columnas": 5, "densidad_negras": 0.30},
+    "normal": {"filas": 7, "columnas": 7, "densidad_negras": 0.28},
+    "dificil": {"filas": 9, "columnas": 9, "densidad_negras": 0.25},
+    "experto": {"filas": 9, "columnas": 9, "densidad_negras": 0.20},
+}
+
+NOMBRES_DIFICULTAD = {"facil": "Fácil", "normal": "Normal", "dificil": "Difícil", "experto": "Experto"}
+
+MAX_INTENTOS_DISENO = 200
+MAX_NODOS_RELLENO = 5000
+MAX_PASOS_REPARACION = 60
+MAX_NODOS_VERIFICACION = 2000
+PASOS_POR_ENNEGRECER = 8
+
+
+def _segmentos(blancas: List[List[bool]], horizontal: bool) -> List[List[Tuple[int, int]]]:
+    """Corridas maximales de casillas blancas en filas (o columnas)."""
+    filas = len(blancas)
+    columnas = len(blancas[0])
+    externas, internas = (filas, columnas) if horizontal else (columnas, filas)
+    segmentos = []
+    for i in range(externas):
+        actual = []
+        for j in range(internas):
+            f, c = (i, j) if horizontal else (j, i)
+            if blancas[f][c]:
+                actual.append((f, c))
+            else:
+                if actual:
+                    segmentos.append(actual)
+                actual = []
+        if actual:
+            segmentos.append(actual)
+    return segmentos
+
+
+def _region_mayor(blancas: List[List[bool]]) -> List[Tuple[int, int]]:
+    """Casillas de la mayor región blanca conexa (vecindad de 4)."""
+    filas = len(blancas)
+    columnas = len(blancas[0])
+    vistas = set()
+    mayor: List[Tuple[int, int]] = []
+    for f in range(filas):
+        for c in range(columnas):
+            if not blancas[f][c] or (f, c) in vistas:
+                continue
+            region = []
+            pendientes = [(f, c)]
+            vistas.add((f, c))
+            while pendientes:
+                cf, cc = pendientes.pop()
+                region.append((cf, cc))
+                for nf, nc in ((cf + 1, cc), (cf - 1, cc), (cf, cc + 1), (cf, cc - 1)):
+                    if 0 <= nf < filas and 0 <= nc < columnas and blancas[nf][nc] and (nf, nc) not in vistas:
+                        vistas.add((nf, nc))
+                        pendientes.append((nf, nc))
+            if len(region) > len(mayor):
+                mayor = region
+    return mayor
+
+
+def generar_diseno(filas: int, columnas: int, densidad_negras: float,
+                   rng: random.Random) -> Optional[List[List[bool]]]:
+    """
+    Genera la distribución de casillas blancas (True) y negras (False).
+
+    La primera fila y la primera columna son siempre negras porque alojan
+    las claves. Toda casilla blanca queda en una corrida horizontal y una
+    vertical de entre 2 y 9 casillas.
+
+    Returns:
+        Matriz de booleanos, o None si el diseño quedó demasiado vacío
+    """
+    blancas = [[False] * columnas for _ in range(filas)]
+    for f in range(1, filas):
+        for c in range(1, columnas):
+            # Simetría central dentro del interior: (f, c) <-> (filas - f, columnas - c)
+            sf, sc = filas - f, columnas - c
+            if (sf, sc) < (f, c):
+                blancas[f][c] = blancas[sf][sc]
+            else:
+                blancas[f][c] = rng.random() >= densidad_negras
+
+    return blancas if _reparar_diseno(blancas, rng) else None
+
+
+def _ennegrecer(blancas: List[List[bool]], f: int, c: int) -> None:
+    """Vuelve negra una casilla y su simétrica."""
+    filas = len(blancas)
+    columnas = len(blancas[0])
+    blancas[f][c] = False
+    sf, sc = filas - f, columnas - c
+    if 1 <= sf < filas and 1 <= sc < columnas:
+        blancas[sf][sc] = False
+
+
+def _reparar_diseno(blancas: List[List[bool]], rng: random.Random) -> bool:
+    """
+    Corrige corridas de 1 o más de 9 casillas y descarta las regiones
+    blancas menores hasta que el diseño es válido.
+
+    Returns:
+        bool: False si quedaron menos del 40% de casillas interiores blancas
+    """
+    filas = len(blancas)
+    columnas = len(blancas[0])
+    cambiado = True
+    while cambiado:
+        cambiado = False
+        for horizontal in (True, False):
+            for segmento in _segmentos(blancas, horizontal):
+                if len(segmento) == 1:
+                    _ennegrecer(blancas, *segmento[0])
+                    cambiado = True
+                elif len(segmento) > 9:
+                    _ennegrecer(blancas, *segmento[rng.randrange(2, len(segmento) - 2)])
+                    cambiado = True
+
+        if not cambiado:
+            region = set(_region_mayor(blancas))
+            for f in range(filas):
+                for c in range(columnas):
+                    if blancas[f][c] and (f, c) not in region:
+                        blancas[f][c] = False
+                        cambiado = True
+
+    total_blancas = sum(fila.count(True) for fila in blancas)
+    return total_blancas * 5 >= (filas - 1) * (columnas - 1) * 2
+
+
+def _ordenar_opciones(opciones: List[int], rng: random.Random) -> List[int]:
+    """
+    Orden aleatorio que favorece los dígitos extremos: las sumas de
+    corridas con 1, 2, 8 o 9 tienen menos combinaciones y la partida
+    resultante tiene menos soluciones alternativas.
+    """
+    return sorted(opciones, key=lambda d: rng.random() / (1 + abs(d - 5)))
+
+
+def rellenar(blancas: List[List[bool]], rng: random.Random, max_nodos: int = MAX_NODOS_RELLENO,
+             fijos: Optional[Dict[Tuple[int, int], int]] = None) -> Optional[Dict[Tuple[int, int], int]]:
+    """
+    Asigna dígitos a las casillas blancas sin repetir dentro de cada corrida.
+
+    Args:
+        blancas: Distribución de casillas blancas
+        rng: Generador aleatorio
+        max_nodos: Límite de nodos de la búsqueda
+        fijos: Casillas que conservan su dígito (solo se rellenan las demás)
+
+    Returns:
+        Dict {(fila, columna): dígito}, o None si se agotó el límite de nodos
+    """
+    runs_de_celda: Dict[Tuple[int, int], List[int]] = {}
+    segmentos = _segmentos(blancas, True) + _segmentos(blancas, False)
+    for run_id, segmento in enumerate(segmentos):
+        for coord in segmento:
+            runs_de_celda.setdefault(coord, []).append(run_id)
+
+    usados = [0] * len(segmentos)
+    valores: Dict[Tuple[int, int], int] = {}
+    for coord, digito in (fijos or {}).items():
+        valores[coord] = digito
+        for run_id in runs_de_celda[coord]:
+            usados[run_id] |= 1 << digito
+    pendientes = [coord for coord in runs_de_celda if coord not in valores]
+    nodos = 0
+
+    def libres(coord: Tuple[int, int]) -> List[int]:
+        ocupados = 0
+        for run_id in runs_de_celda[coord]:
+            ocupados |= usados[run_id]
+        return [d for d in range(1, 10) if not ocupados & (1 << d)]
+
+    def buscar() -> bool:
+        nonlocal nodos
+        if not pendientes:
+            return True
+        nodos += 1
+        if nodos > max_nodos:
+            return False
+
+        # Casilla con menos dígitos libres primero
+        mejor = min(range(len(pendientes)), key=lambda i: len(libres(pendientes[i])))
+        coord = pendientes[mejor]
+        opciones = _ordenar_opciones(libres(coord), rng)
+
+        pendientes[mejor] = pendientes[-1]
+        pendientes.pop()
+        for digito in opciones:
+            bit = 1 << digito
+            for run_id in runs_de_celda[coord]:
+                usados[run_id] |= bit
+            valores[coord] = digito
+            if buscar():
+                return True
+            for run_id in runs_de_celda[coord]:
+                usados[run_id] &= ~bit
+            del valores[coord]
+        pendientes.append(coord)
+        pendientes[mejor], pendientes[-1] = pendientes[-1], pendientes[mejor]
+        return False
+
+    return valores if buscar() else None
+
+
+def construir_partida(blancas: List[List[bool]], valores: Dict[Tuple[int, int], int],
+                      dificultad: str = "facil", partida_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Deriva tablero, sumas y solución en el esquema de kakuro2025_partidas.json.
+
+    Args:
+        blancas: Distribución de casillas blancas
+        valores: Dígito de cada casilla blanca
+        dificultad: "facil", "normal", "dificil" o "experto"
+        partida_id: Id de la partida (opcional)
+    """
+    filas = len(blancas)
+    columnas = len(blancas[0])
+    tablero = [["#"] * columnas for _ in range(filas)]
+    solucion = [["#"] * columnas for _ in range(filas)]
+    sumas_filas: List[List[Optional[int]]] = [[None] * columnas for _ in range(filas)]
+    sumas_columnas: List[List[Optional[int]]] = [[None] * columnas for _ in range(filas)]
+
+    for f in range(filas):
+        for c in range(columnas):
+            if blancas[f][c]:
+                tablero[f][c] = "?"
+                solucion[f][c] = str(valores[(f, c)])
+
+    for horizontal, sumas in ((True, sumas_filas), (False, sumas_columnas)):
+        for segmento in _segmentos(blancas, horizontal):
+            f, c = segmento[0]
+            clave_f, clave_c = (f, c - 1) if horizontal else (f - 1, c)
+            tablero[clave_f][clave_c] = "\\"
+            solucion[clave_f][clave_c] = "\\"
+            sumas[clave_f][clave_c] = sum(valores[coord] for coord in segmento)
+
+    partida: Dict[str, Any] = {}
+    if partida_id is not None:
+        partida["id"] = partida_id
+        partida["nombre"] = f"Kakuro {NOMBRES_DIFICULTAD.get(dificultad, dificultad)} {partida_id}"
+    total_blancas = len(valores)
+    partida.update({
+        "dificultad": dificultad,
+        "tamaño": {"filas": filas, "columnas": columnas},
+        "tablero": tablero,
+        "sumas_filas": sumas_filas,
+        "sumas_columnas": sumas_columnas,
+        "solucion": solucion,
+        "tiempo_estimado": 60 + 15 * total_blancas,
+    })
+    return partida
+
+
+def _claves(partida: Dict[str, Any]) -> List[Dict]:
+    from .partida_loader import _convert_partida_format
+
+    convertida = _convert_partida_format(partida)
+    return convertida["claves"] if convertida else []
+
+
+def generar_partida(dificultad: str = "facil", filas: Optional[int] = None,
+                    columnas: Optional[int] = None, semilla: Optional[int] = None,
+                    max_intentos: int = MAX_INTENTOS_DISENO) -> Optional[Dict[str, Any]]:
+    """
+    Genera una partida con solución única.
+
+    Si el relleno admite otra solución se repara donde difieren: casi
+    siempre se vuelven a rellenar solo esas casillas, y cada
+    PASOS_POR_ENNEGRECER pasos (o si no hay otro relleno) se vuelve negra
+    una de ellas con su simétrica, lo que acorta las corridas ambiguas. Si
+    la verificación supera MAX_NODOS_VERIFICACION se ennegrece una casilla
+    cualquiera: la partida está demasiado abierta para resolverla a mano.
+
+    Args:
+        dificultad: "facil", "normal", "dificil" o "experto"
+        filas: Filas del tablero, incluida la fila de claves (por defecto según dificultad)
+        columnas: Columnas del tablero (por defecto según dificultad)
+        semilla: Semilla para reproducir la partida; también forma su id
+        max_intentos: Diseños a probar antes de rendirse
+
+    Returns:
+        Dict con la partida en el esquema de kakuro2025_partidas.json, o None
+    """
+    parametros = PARAMETROS_DIFICULTAD.get(dificultad, PARAMETROS_DIFICULTAD["facil"])
+    filas = filas or parametros["filas"]
+    columnas = columnas or parametros["columnas"]
+    rng = random.Random(semilla)
+    partida_id = f"{dificultad}_g{semilla}" if semilla is not None else None
+
+    for _ in range(max_intentos):
+        blancas = generar_diseno(filas, columnas, parametros["densidad_negras"], rng)
+        if blancas is None:
+            continue
+        valores = rellenar(blancas, rng)
+        if valores is None:
+            continue
+
+        for paso in range(MAX_PASOS_REPARACION):
+            partida = construir_partida(blancas, valores, dificultad, partida_id)
+            solver = KakuroSolver(_claves(partida))
+            soluciones = solver.count_solutions(limite=2, max_nodos=MAX_NODOS_VERIFICACION)
+            if soluciones == 1 and not solver.interrumpida:
+                return partida
+
+            if solver.interrumpida:
+                # Demasiado abierta para decidir: acortar una corrida al azar
+                diferentes = set(valores)
+                ennegrecer = True
+            else:
+                diferentes = {
+                    coord
+                    for solucion in solver.solutions()
+                    for coord, digito in solucion.items()
+                    if digito != valores.get(coord)
+                }
+                ennegrecer = paso % PASOS_POR_ENNEGRECER == PASOS_POR_ENNEGRECER - 1
+            if not diferentes:
+                break
+
+            nuevos = None
+            if not ennegrecer:
+                fijos = {coord: d for coord, d in valores.items() if coord not in diferentes}
+                nuevos = rellenar(blancas, rng, MAX_NODOS_RELLENO, fijos)
+            if nuevos is None:
+                _ennegrecer(blancas, *rng.choice(sorted(diferentes)))
+                if not _reparar_diseno(blancas, rng):
+                    break
+                nuevos = {coord: d for coord, d in valores.items() if blancas[coord[0]][coord[1]]}
+            valores = nuevos
+    return None
+
+
+def generar_tarea(argumentos: Tuple[str, Optional[int], Optional[int], int]) -> Optional[Dict[str, Any]]:
+    """Punto de entrada para ProcessPoolExecutor: (dificultad, filas, columnas, semilla)."""
+    dificultad, filas, columnas, semilla = argumentos
+    return generar_partida(dificultad, filas, columnas, semilla)
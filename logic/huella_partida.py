@@ -0,0 +1,128 @@
+"""
+Huella canónica de partidas e índice de huellas en disco.
+
+Dos partidas son la misma si tienen las mismas claves, aunque vengan de
+catálogos distintos o una sea la transpuesta de la otra (cambiar filas por
+columnas convierte cada clave de fila en una de columna y viceversa). La
+huella se calcula sobre las claves ordenadas y se toma la menor entre la
+partida y su transpuesta, así que ambas dan la misma huella.
+
+El índice guarda una línea "<huella> <id>" por partida en un archivo de
+solo anexado. Se lee una vez al abrirlo y luego cada consulta es una
+búsqueda en un dict, así que los procesos de importación y generación
+descartan repetidas en O(1).
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, List, Optional
+
+
+HUELLAS_FILE = "data/kakuro2025_huellas.idx"
+
+
+def _forma_canonica(claves: List[Dict], transpuesta: bool) -> bytes:
+    registros = []
+    for clave in claves:
+        if clave["casillas"] <= 0:
+            continue  # las celdas negras no definen la partida
+        tipo, fila, columna = clave["tipo_de_clave"], clave["fila"], clave["columna"]
+        if transpuesta:
+            tipo = "C" if tipo == "F" else "F"
+            fila, columna = columna, fila
+        registros.append((fila, columna, tipo, clave["clave"], clave["casillas"]))
+    registros.sort()
+    return ";".join(f"{f},{c},{t},{s},{n}" for f, c, t, s, n in registros).encode("ascii")
+
+
+def huella_claves(claves: List[Dict]) -> str:
+    """
+    Calcula la huella canónica de unas claves.
+
+    Args:
+        claves: Claves de la partida (formato de _convert_partida_format)
+
+    Returns:
+        str: Huella hexadecimal, igual para la partida y su transpuesta
+    """
+    forma = min(_forma_canonica(claves, False), _forma_canonica(claves, True))
+    return hashlib.sha1(forma).hexdigest()
+
+
+def huella_partida(partida: Dict[str, Any]) -> Optional[str]:
+    """
+    Calcula la huella de una partida del catálogo o ya convertida.
+
+    Returns:
+        str: Huella de la partida, o None si no se puede convertir
+    """
+    claves = partida.get("claves")
+    if claves is None:
+        from .partida_loader import _convert_partida_format
+
+        convertida = _convert_partida_format(partida)
+        if not convertida:
+            return None
+        claves = convertida["claves"]
+    return huella_claves(claves)
+
+
+class IndiceHuellas:
+    """
+    Conjunto de huellas con su id de partida, persistido en un archivo de
+    solo anexado (o solo en memoria si no se indica ruta).
+
+    Las huellas agregadas quedan pendientes hasta guardar(), para que el
+    índice no registre partidas que al final no se escribieron en el catálogo.
+    """
+
+    def __init__(self, ruta: Optional[str] = HUELLAS_FILE):
+        self.ruta = ruta
+        self._ids: Dict[str, str] = {}
+        self._pendientes: List[str] = []
+
+        if ruta and os.path.exists(ruta):
+            with open(ruta, "r", encoding="utf-8") as f:
+                for linea in f:
+                    huella, _, partida_id = linea.rstrip("\n").partition(" ")
+                    if huella:
+                        self._ids.setdefault(huella, partida_id)
+
+    def __contains__(self, huella: str) -> bool:
+        return huella in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def existe(self) -> bool:
+        """Indica si el índice ya tiene archivo en disco."""
+        return bool(self.ruta) and os.path.exists(self.ruta)
+
+    def buscar(self, huella: str) -> Optional[str]:
+        """Devuelve el id de la partida registrada con esa huella (o None)."""
+        return self._ids.get(huella)
+
+    def agregar(self, huella: str, partida_id: str) -> bool:
+        """
+        Registra una huella si no estaba.
+
+        Returns:
+            bool: True si se agregó, False si la partida ya estaba (repetida)
+        """
+        if huella in self._ids:
+            return False
+        self._ids[huella] = partida_id
+        self._pendientes.append(f"{huella} {partida_id}\n")
+        return True
+
+    def guardar(self) -> None:
+        """Anexa al archivo las huellas agregadas desde el último guardado."""
+        if not self.ruta or not self._pendientes:
+            self._pendientes.clear()
+            return
+        directorio = os.path.dirname(self.ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.writelines(self._pendientes)
+        self._pendientes.clear()
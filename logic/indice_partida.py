@@ -0,0 +1,111 @@
+"""
+Índice de casillas y corridas de una partida.
+
+Las claves solo guardan la posición de la clave y la cantidad de casillas,
+así que para saber a qué corridas pertenece una casilla habría que recorrer
+los desplazamientos de todas las claves. Este índice se construye una sola
+vez al cargar la partida y responde en O(1) qué corridas pasan por una
+casilla y qué casillas forman cada corrida.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class IndicePartida:
+    """
+    Índice casilla -> corridas y corrida -> casillas de una partida.
+
+    Las casillas se identifican por un entero consecutivo (id de casilla) y
+    por su coordenada (fila, columna) en base 0, igual que estado_tablero.
+    """
+
+    def __init__(self, claves: List[Dict]):
+        self.coordenadas: List[Tuple[int, int]] = []  # id de casilla -> (fila, columna)
+        self.id_celda: Dict[Tuple[int, int], int] = {}
+
+        self.tipos_runs: List[str] = []  # "F" (fila) o "C" (columna)
+        self.sumas_runs: List[int] = []
+        self.origenes_runs: List[Tuple[int, int]] = []  # posición de la clave
+        self.celdas_runs: List[Tuple[int, ...]] = []  # ids de casilla de cada corrida
+
+        horizontal: List[Optional[int]] = []
+        vertical: List[Optional[int]] = []
+
+        # Dimensiones mínimas del tablero que contiene todas las claves y casillas
+        self.filas = 0
+        self.columnas = 0
+
+        for clave in claves:
+            casillas = clave["casillas"]
+            if casillas <= 0:
+                continue
+
+            fila = clave["fila"] - 1
+            columna = clave["columna"] - 1
+            tipo = clave["tipo_de_clave"]
+            if tipo == "F":
+                celdas = [(fila, columna + k) for k in range(1, casillas + 1)]
+            else:
+                celdas = [(fila + k, columna) for k in range(1, casillas + 1)]
+
+            ultima_fila, ultima_columna = celdas[-1]
+            self.filas = max(self.filas, ultima_fila + 1)
+            self.columnas = max(self.columnas, ultima_columna + 1)
+
+            run_id = len(self.sumas_runs)
+            ids = []
+            for coord in celdas:
+                celda_id = self.id_celda.get(coord)
+                if celda_id is None:
+                    celda_id = len(self.coordenadas)
+                    self.id_celda[coord] = celda_id
+                    self.coordenadas.append(coord)
+                    horizontal.append(None)
+                    vertical.append(None)
+                if tipo == "F":
+                    horizontal[celda_id] = run_id
+                else:
+                    vertical[celda_id] = run_id
+                ids.append(celda_id)
+
+            self.tipos_runs.append(tipo)
+            self.sumas_runs.append(clave["clave"])
+            self.origenes_runs.append((fila, columna))
+            self.celdas_runs.append(tuple(ids))
+
+        self.horizontal = horizontal
+        self.vertical = vertical
+        self.runs_de_celda: List[Tuple[int, ...]] = [
+            tuple(r for r in (h, v) if r is not None)
+            for h, v in zip(horizontal, vertical)
+        ]
+
+    @property
+    def total_celdas(self) -> int:
+        """Número de casillas blancas de la partida."""
+        return len(self.coordenadas)
+
+    @property
+    def total_runs(self) -> int:
+        """Número de corridas (claves con casillas) de la partida."""
+        return len(self.sumas_runs)
+
+    def runs_de(self, fila: int, columna: int) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Devuelve las corridas que pasan por una casilla.
+
+        Returns:
+            Tuple: (corrida horizontal, corrida vertical); None si no existe
+        """
+        celda_id = self.id_celda.get((fila, columna))
+        if celda_id is None:
+            return None, None
+        return self.horizontal[celda_id], self.vertical[celda_id]
+
+    def celdas_de_run(self, run_id: int) -> List[Tuple[int, int]]:
+        """Devuelve las coordenadas (base 0) de las casillas de una corrida."""
+        return [self.coordenadas[i] for i in self.celdas_runs[run_id]]
+
+    def es_blanca(self, fila: int, columna: int) -> bool:
+        """Indica si la casilla pertenece a alguna corrida."""
+        return (fila, columna) in self.id_celda
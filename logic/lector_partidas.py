@@ -0,0 +1,173 @@
+"""
+Lectura incremental de catálogos de partidas.
+
+json.load necesita el archivo completo en memoria y además construye todas
+las partidas a la vez, lo que con catálogos de cientos de MB dispara el uso
+de memoria. Este lector recorre el archivo por bloques y entrega las partidas
+una a una, así que en memoria solo está el bloque actual y la partida que se
+está decodificando.
+
+Formatos admitidos:
+- {"partidas": [...], ...}  (el formato de kakuro2025_partidas.json)
+- [...]                     (lista de partidas)
+- JSON Lines (.jsonl): una partida por línea
+"""
+
+import json
+from contextlib import closing
+from itertools import islice
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+
+TAMANO_BLOQUE = 1 << 16
+
+_ESPACIOS = " \t\r\n"
+
+
+class _Lector:
+    """Búfer sobre un archivo de texto con decodificación de un valor a la vez."""
+
+    def __init__(self, archivo: TextIO, tam_bloque: int):
+        self.archivo = archivo
+        self.tam_bloque = tam_bloque
+        self.buf = ""
+        self.pos = 0
+        self.fin = False
+        self.decoder = json.JSONDecoder()
+
+    def _leer_mas(self) -> bool:
+        if self.fin:
+            return False
+        bloque = self.archivo.read(self.tam_bloque)
+        if not bloque:
+            self.fin = True
+            return False
+        # Descartar lo ya consumido para que el búfer no crezca con el archivo
+        self.buf = self.buf[self.pos:] + bloque
+        self.pos = 0
+        return True
+
+    def siguiente_caracter(self) -> Optional[str]:
+        """Devuelve el siguiente carácter que no sea espacio, sin consumirlo."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _ESPACIOS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._leer_mas():
+                return None
+
+    def consumir(self, esperado: str) -> None:
+        caracter = self.siguiente_caracter()
+        if caracter != esperado:
+            raise ValueError(f"Se esperaba '{esperado}' y se encontró {caracter!r}")
+        self.pos += 1
+
+    def valor(self) -> Any:
+        """Decodifica el siguiente valor JSON completo, leyendo bloques si hace falta."""
+        self.siguiente_caracter()
+        while True:
+            try:
+                valor, fin = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._leer_mas():
+                    continue
+                raise
+            # Un número al final del búfer puede seguir en el próximo bloque
+            if fin == len(self.buf) and self._leer_mas():
+                continue
+            self.pos = fin
+            return valor
+
+
+def _iterar_lista(lector: _Lector) -> Iterator[Dict[str, Any]]:
+    lector.consumir("[")
+    if lector.siguiente_caracter() == "]":
+        lector.pos += 1
+        return
+    while True:
+        yield lector.valor()
+        caracter = lector.siguiente_caracter()
+        lector.pos += 1
+        if caracter == "]":
+            return
+        if caracter != ",":
+            raise ValueError(f"Se esperaba ',' o ']' y se encontró {caracter!r}")
+
+
+def _iterar_json(lector: _Lector) -> Iterator[Dict[str, Any]]:
+    inicio = lector.siguiente_caracter()
+    if inicio == "[":
+        yield from _iterar_lista(lector)
+        return
+    if inicio != "{":
+        raise ValueError("Formato de archivo de partidas no válido")
+
+    # Objeto: saltar las claves que no son "partidas" sin guardarlas
+    lector.consumir("{")
+    if lector.siguiente_caracter() == "}":
+        return
+    while True:
+        clave = lector.valor()
+        lector.consumir(":")
+        if clave == "partidas" and lector.siguiente_caracter() == "[":
+            yield from _iterar_lista(lector)
+        else:
+            lector.valor()
+        caracter = lector.siguiente_caracter()
+        lector.pos += 1
+        if caracter == "}":
+            return
+        if caracter != ",":
+            raise ValueError(f"Se esperaba ',' o '}}' y se encontró {caracter!r}")
+
+
+def _iterar_json_lines(archivo: TextIO) -> Iterator[Dict[str, Any]]:
+    for numero, linea in enumerate(archivo, 1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            yield json.loads(linea)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Línea {numero} no válida: {e}") from e
+
+
+def iterar_partidas(ruta: str, tam_bloque: int = TAMANO_BLOQUE) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre un catálogo de partidas entregando una partida a la vez.
+
+    Args:
+        ruta: Archivo .json ({"partidas": [...]} o lista) o .jsonl
+        tam_bloque: Caracteres leídos por bloque
+
+    Yields:
+        Dict[str, Any]: Cada partida en el formato del archivo
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato válido
+        OSError: Si el archivo no se puede leer
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        if ruta.endswith(".jsonl"):
+            yield from _iterar_json_lines(archivo)
+        else:
+            yield from _iterar_json(_Lector(archivo, tam_bloque))
+
+
+def leer_partida(ruta: str, posicion: int, tam_bloque: int = TAMANO_BLOQUE) -> Optional[Dict[str, Any]]:
+    """
+    Lee solo la partida `posicion` (base 0) de un catálogo.
+
+    Las partidas anteriores se decodifican y se descartan de a una, así que
+    la memoria usada es la de una partida.
+
+    Returns:
+        Dict[str, Any]: La partida, o None si el catálogo tiene menos partidas
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato válido
+        OSError: Si el archivo no se puede leer
+    """
+    with closing(iterar_partidas(ruta, tam_bloque)) as partidas:
+        return next(islice(partidas, posicion, None), None)
@@ -0,0 +1,87 @@
+"""
+Registro liviano de metadatos de una partida.
+
+Para filtrar, contar o listar partidas alcanza con el id, el nivel, el
+tamaño, la cantidad de corridas y el tiempo estimado. MetaPartida guarda
+solo eso y decodifica las claves (tablero y sumas) la primera vez que se
+llama a cargar(), es decir, cuando de verdad empieza un juego con ella.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+
+class MetaPartida:
+    """
+    Metadatos de una partida con decodificación diferida de sus claves.
+    """
+
+    __slots__ = ("id", "nivel", "partida", "filas", "columnas", "corridas", "tiempo_estimado",
+                 "_decodificar", "_datos")
+
+    def __init__(self, partida_id: str, nivel: str, partida: int, filas: int, columnas: int,
+                 corridas: int, tiempo_estimado: Optional[int],
+                 decodificar: Callable[[], Optional[Dict[str, Any]]]):
+        self.id = partida_id
+        self.nivel = nivel
+        self.partida = partida  # posición (base 1) dentro del nivel
+        self.filas = filas
+        self.columnas = columnas
+        self.corridas = corridas
+        self.tiempo_estimado = tiempo_estimado
+        self._decodificar = decodificar
+        self._datos = None
+
+    @property
+    def cargada(self) -> bool:
+        """Indica si las claves ya se decodificaron."""
+        return self._datos is not None
+
+    def cargar(self) -> Optional[Dict[str, Any]]:
+        """
+        Decodifica la partida completa (solo la primera vez).
+
+        Returns:
+            Dict en el formato de _convert_partida_format más "id",
+            o None si la partida no se puede decodificar
+        """
+        if self._datos is None and self._decodificar is not None:
+            datos = self._decodificar()
+            self._decodificar = None  # libera la partida original
+            if datos:
+                datos["nivel_de_dificultad"] = self.nivel
+                datos["partida"] = self.partida
+                datos["id"] = self.id
+            self._datos = datos
+        return self._datos
+
+    def resumen(self) -> Dict[str, Any]:
+        """Metadatos como dict, para listados en la interfaz."""
+        return {
+            "id": self.id,
+            "nivel_de_dificultad": self.nivel,
+            "partida": self.partida,
+            "tamaño": {"filas": self.filas, "columnas": self.columnas},
+            "corridas": self.corridas,
+            "tiempo_estimado": self.tiempo_estimado,
+        }
+
+
+def contar_corridas(tablero: List[List[str]]) -> int:
+    """
+    Cuenta las corridas de un tablero del catálogo sin leer las sumas.
+
+    Una casilla de clave ("\\") abre una corrida horizontal si a su derecha
+    hay una casilla blanca ("?") y una vertical si la hay debajo.
+    """
+    corridas = 0
+    ultima_fila = len(tablero) - 1
+    for i, fila in enumerate(tablero):
+        ultima_columna = len(fila) - 1
+        for j, celda in enumerate(fila):
+            if celda != "\\":
+                continue
+            if j < ultima_columna and fila[j + 1] == "?":
+                corridas += 1
+            if i < ultima_fila and j < len(tablero[i + 1]) and tablero[i + 1][j] == "?":
+                corridas += 1
+    return corridas
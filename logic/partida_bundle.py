@@ -0,0 +1,235 @@
+"""
+Formato binario compilado para catálogos de partidas.
+
+Convierte data/kakuro2025_partidas.json (o un archivo con el mismo esquema)
+en un paquete binario que se puede abrir con mmap y del que solo se
+decodifica la partida que se va a jugar, sin parsear todo el JSON.
+
+Estructura del archivo (little-endian):
+
+    Cabecera      "<4sHHI"   magia b"KKB1", versión, número de niveles, total de partidas
+    Niveles       "<II"      por nivel (orden de NIVELES): primera entrada y cantidad
+    Offsets       "<I"       por partida: posición absoluta de su registro
+    Registros     "<BBHB"    filas, columnas, número de claves, largo del id
+                  id         bytes UTF-8
+                  claves     4 bytes cada una: tipo|fila, columna, clave, casillas
+
+En el byte tipo|fila el bit 7 indica columna ("C") y los 7 bits bajos la
+fila (base 1), así que cada clave ocupa exactamente 4 bytes.
+
+Uso:
+    python -m logic.partida_bundle [entrada.json] [salida.kkb]
+"""
+
+import hashlib
+import struct
+import sys
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .meta_partida import MetaPartida
+from .persistencia import escribir_bytes_atomico
+
+
+MAGIA = b"KKB1"
+VERSION = 1
+NIVELES = ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"]
+BUNDLE_FILE = "data/kakuro2025_partidas.kkb"
+
+_CABECERA = struct.Struct("<4sHHI")
+_NIVEL = struct.Struct("<II")
+_OFFSET = struct.Struct("<I")
+_REGISTRO = struct.Struct("<BBHB")
+_CLAVE = struct.Struct("<BBBB")
+
+_BIT_COLUMNA = 0x80
+
+
+def _dimensiones(partida: Dict[str, Any]) -> Tuple[int, int]:
+    tamano = partida.get("tamaño") or {}
+    tablero = partida.get("tablero") or []
+    filas = tamano.get("filas") or len(tablero)
+    columnas = tamano.get("columnas") or (len(tablero[0]) if tablero else 0)
+    return filas, columnas
+
+
+def _codificar_registro(partida_id: str, filas: int, columnas: int, claves: List[Dict]) -> bytes:
+    id_bytes = partida_id.encode("utf-8")[:255]
+    if not 0 <= filas <= 0xFF or not 0 <= columnas <= 0xFF or len(claves) > 0xFFFF:
+        raise ValueError(f"Partida {partida_id} fuera de rango para el formato binario: "
+                         f"{filas}x{columnas}, {len(claves)} claves")
+    partes = [_REGISTRO.pack(filas, columnas, len(claves), len(id_bytes)), id_bytes]
+    for clave in claves:
+        fila = clave["fila"]
+        if (not 1 <= fila <= 0x7F or not 0 <= clave["columna"] <= 0xFF
+                or not 0 <= clave["clave"] <= 0xFF or not 0 <= clave["casillas"] <= 0xFF):
+            raise ValueError(f"Clave fuera de rango para el formato binario: {clave}")
+        tipo_fila = fila | (_BIT_COLUMNA if clave["tipo_de_clave"] == "C" else 0)
+        partes.append(_CLAVE.pack(tipo_fila, clave["columna"], clave["clave"], clave["casillas"]))
+    return b"".join(partes)
+
+
+def compilar_bundle(partidas: Iterable[Dict[str, Any]], ruta_salida: str = BUNDLE_FILE) -> Dict[str, int]:
+    """
+    Compila una lista de partidas (formato JSON) en un paquete binario.
+
+    Args:
+        partidas: Partidas tal como aparecen en kakuro2025_partidas.json
+            (puede ser un iterador, p. ej. iterar_partidas)
+        ruta_salida: Archivo binario a generar. Se reemplaza de forma
+            atómica, así que los juegos que lo tienen abierto con mmap siguen
+            viendo el paquete anterior completo.
+
+    Returns:
+        Dict[str, int]: Cantidad de partidas compiladas por nivel
+
+    Raises:
+        ValueError: Si alguna partida no cabe en el formato binario
+        OSError: Si no se puede escribir el archivo
+    """
+    from .partida_loader import _convert_partida_format
+
+    por_nivel: Dict[str, List[bytes]] = {nivel: [] for nivel in NIVELES}
+    for posicion, partida in enumerate(partidas):
+        convertida = _convert_partida_format(partida)
+        if not convertida or convertida["nivel_de_dificultad"] not in por_nivel:
+            continue
+        filas, columnas = _dimensiones(partida)
+        partida_id = str(partida.get("id", f"partida_{posicion + 1}"))
+        por_nivel[convertida["nivel_de_dificultad"]].append(
+            _codificar_registro(partida_id, filas, columnas, convertida["claves"])
+        )
+
+    total = sum(len(registros) for registros in por_nivel.values())
+    inicio_registros = _CABECERA.size + _NIVEL.size * len(NIVELES) + _OFFSET.size * total
+
+    tabla_niveles = []
+    offsets = []
+    registros = []
+    posicion = inicio_registros
+    for nivel in NIVELES:
+        tabla_niveles.append(_NIVEL.pack(len(offsets), len(por_nivel[nivel])))
+        for registro in por_nivel[nivel]:
+            offsets.append(_OFFSET.pack(posicion))
+            registros.append(registro)
+            posicion += len(registro)
+    if posicion > 0xFFFFFFFF:
+        raise ValueError("El catálogo es demasiado grande para el formato binario")
+
+    escribir_bytes_atomico(ruta_salida, b"".join(
+        [_CABECERA.pack(MAGIA, VERSION, len(NIVELES), total)] + tabla_niveles + offsets + registros
+    ))
+
+    return {nivel: len(por_nivel[nivel]) for nivel in NIVELES}
+
+
+class LectorBundle:
+    """
+    Acceso de solo lectura a un paquete binario (un buffer o un mmap).
+    Solo se decodifica el registro que se pide.
+    """
+
+    def __init__(self, datos):
+        self.datos = datos
+        magia, version, num_niveles, self.total = _CABECERA.unpack_from(datos, 0)
+        if magia != MAGIA or version != VERSION:
+            raise ValueError("El archivo no es un paquete de partidas válido")
+
+        self.niveles: Dict[str, Tuple[int, int]] = {}
+        for i in range(num_niveles):
+            primera, cantidad = _NIVEL.unpack_from(datos, _CABECERA.size + i * _NIVEL.size)
+            if i < len(NIVELES):
+                self.niveles[NIVELES[i]] = (primera, cantidad)
+        self._inicio_offsets = _CABECERA.size + num_niveles * _NIVEL.size
+        self._firmas: Dict[str, str] = {}
+
+    def cantidad(self, nivel: str) -> int:
+        """Número de partidas del nivel."""
+        return self.niveles.get(nivel, (0, 0))[1]
+
+    def firma(self, nivel: str) -> str:
+        """
+        Huella de las partidas del nivel (su tramo de la tabla de offsets y
+        el tamaño de su último registro), para detectar catálogos recompilados.
+        """
+        if nivel not in self._firmas:
+            primera, cantidad = self.niveles.get(nivel, (0, 0))
+            inicio = self._inicio_offsets + primera * _OFFSET.size
+            resumen = hashlib.sha1(nivel.encode("utf-8"))
+            resumen.update(bytes(self.datos[inicio:inicio + cantidad * _OFFSET.size]))
+            resumen.update(str(len(self.datos)).encode("ascii"))
+            self._firmas[nivel] = resumen.hexdigest()
+        return self._firmas[nivel]
+
+    def _cabecera_registro(self, nivel: str, posicion: int) -> Optional[Tuple[int, int, int, str, int]]:
+        """Lee (filas, columnas, número de claves, id, offset de las claves) de un registro."""
+        primera, cantidad = self.niveles.get(nivel, (0, 0))
+        if not 0 <= posicion < cantidad:
+            return None
+
+        datos = self.datos
+        (offset,) = _OFFSET.unpack_from(datos, self._inicio_offsets + (primera + posicion) * _OFFSET.size)
+        filas, columnas, num_claves, largo_id = _REGISTRO.unpack_from(datos, offset)
+        offset += _REGISTRO.size
+        partida_id = bytes(datos[offset:offset + largo_id]).decode("utf-8")
+        return filas, columnas, num_claves, partida_id, offset + largo_id
+
+    def meta(self, nivel: str, posicion: int) -> Optional[MetaPartida]:
+        """
+        Metadatos de la partida `posicion` (base 0) sin decodificar sus claves.
+
+        El formato binario no guarda el tiempo estimado, así que queda en None.
+        """
+        cabecera = self._cabecera_registro(nivel, posicion)
+        if cabecera is None:
+            return None
+        filas, columnas, num_claves, partida_id, _ = cabecera
+        return MetaPartida(partida_id, nivel, posicion + 1, filas, columnas, num_claves, None,
+                           partial(self.leer, nivel, posicion))
+
+    def leer(self, nivel: str, posicion: int) -> Optional[Dict[str, Any]]:
+        """
+        Decodifica la partida `posicion` (base 0) del nivel.
+
+        Returns:
+            Dict en el formato de _convert_partida_format más "id" y "tamaño",
+            o None si la posición no existe
+        """
+        cabecera = self._cabecera_registro(nivel, posicion)
+        if cabecera is None:
+            return None
+        filas, columnas, num_claves, partida_id, offset = cabecera
+        datos = self.datos
+
+        claves = []
+        for tipo_fila, columna, valor, casillas in _CLAVE.iter_unpack(datos[offset:offset + num_claves * _CLAVE.size]):
+            claves.append({
+                "tipo_de_clave": "C" if tipo_fila & _BIT_COLUMNA else "F",
+                "fila": tipo_fila & ~_BIT_COLUMNA,
+                "columna": columna,
+                "clave": valor,
+                "casillas": casillas
+            })
+
+        return {
+            "nivel_de_dificultad": nivel,
+            "partida": posicion + 1,
+            "id": partida_id,
+            "tamaño": {"filas": filas, "columnas": columnas},
+            "claves": claves
+        }
+
+
+if __name__ == "__main__":
+    from .lector_partidas import iterar_partidas
+    from .partida_loader import PARTIDAS_FILE
+
+    entrada = sys.argv[1] if len(sys.argv) > 1 else PARTIDAS_FILE
+    salida = sys.argv[2] if len(sys.argv) > 2 else BUNDLE_FILE
+
+    try:
+        conteo = compilar_bundle(iterar_partidas(entrada), salida)
+    except (ValueError, OSError) as e:
+        print(f"[BUNDLE] Error al compilar {entrada}: {e}")
+        sys.exit(1)
+    print(f"[BUNDLE] {sum(conteo.values())} partidas compiladas en {salida}: {conteo}")
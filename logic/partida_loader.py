@@ -3,54 +3,68 @@ Módulo para cargar partidas aleatorias del juego Kakuro desde archivo JSON.
 
 Este módulo se encarga de leer el archivo de partidas del juego,
 filtrar por nivel de dificultad y devolver partidas aleatorias
-sin repetir hasta que se agoten todas las disponibles.
+sin repetir hasta que se agoten todas las disponibles. El orden de
+sorteo de cada nivel se guarda en disco (ver bolsa_partidas), así que
+se conserva entre ejecuciones y entre jugadores de la misma instalación.
 """
 
-import json
-import random
+import hashlib
+import mmap
 import os
-from typing import Dict, List, Optional, Any
+from functools import partial
+from typing import Dict, List, Optional, Any, Tuple
 
+from .bolsa_partidas import BOLSAS_DIR, BolsaPartidas
+from .lector_partidas import iterar_partidas, leer_partida
+from .meta_partida import MetaPartida, contar_corridas
+from .partida_bundle import BUNDLE_FILE, LectorBundle
+
+
+# Índice por nivel con los metadatos de las partidas, y el mtime del archivo con el que se construyó
+_indice_niveles = None
+_indice_mtime = None
+_firmas_niveles = {}  # nivel -> huella de los ids del nivel (para las bolsas)
+
+# Bolsas persistentes de sorteo sin reposición
+_bolsa = None
+
+# Paquete binario abierto con mmap: (ruta, mtime, archivo, mapa, lector)
+_bundle_abierto = None
 
-# Variables internas para trackear partidas usadas
-_used_partidas = {
-    "FÁCIL": set(),
-    "MEDIO": set(),
-    "DIFÍCIL": set(),
-    "EXPERTO": set()
-}
 
-_partidas_cache = None
-_partidas_shuffled = False
+PARTIDAS_FILE = "data/kakuro2025_partidas.json"
+NIVELES = ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"]
+TAMANO_POR_DEFECTO = 9  # Tablero de las partidas sin claves (modo demo)
+
+# Mapeo de dificultades del archivo a niveles del juego
+DIFICULTADES = {
+    "facil": "FÁCIL",
+    "normal": "MEDIO",
+    "dificil": "DIFÍCIL",
+    "experto": "EXPERTO"
+}
 
 
-def _load_partidas_file() -> Optional[List[Dict[str, Any]]]:
+def _load_partidas_file(config_file_path: str = PARTIDAS_FILE) -> Optional[List[Dict[str, Any]]]:
     """
     Carga el archivo de partidas desde JSON.
     
+    Args:
+        config_file_path: Ruta del archivo de partidas
+    
     Returns:
         List[Dict[str, Any]]: Lista de partidas cargadas, o None si hay error
     """
     try:
-        config_file_path = "data/kakuro2025_partidas.json"
         
         if not os.path.exists(config_file_path):
             print(f"Archivo de partidas no encontrado: {config_file_path}")
             return None
         
-        with open(config_file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-        
-        # Extraer la lista de partidas
-        if isinstance(data, dict) and "partidas" in data:
-            return data["partidas"]
-        elif isinstance(data, list):
-            return data
-        else:
-            print("Formato de archivo de partidas no válido")
-            return None
+        # Lectura incremental: no se carga el texto completo del archivo
+        return list(iterar_partidas(config_file_path))
             
-    except (json.JSONDecodeError, IOError, OSError) as e:
+    except (ValueError, IOError, OSError) as e:
         print(f"Error al cargar el archivo de partidas: {e}")
         return None
     except Exception as e:
@@ -58,6 +72,112 @@ def _load_partidas_file() -> Optional[List[Dict[str, Any]]]:
         return None
 
 
+def indexar_partidas_por_nivel(config_file_path: str = PARTIDAS_FILE) -> Optional[Dict[str, List[str]]]:
+    """
+    Construye en una sola pasada el índice nivel -> ids de partida.
+    
+    Las partidas se leen una a una, así que la memoria usada es la de los
+    ids y no la del catálogo completo.
+    
+    Args:
+        config_file_path: Ruta del archivo de partidas (.json o .jsonl)
+    
+    Returns:
+        Dict[str, List[str]]: Ids de partida por nivel, o None si hay error
+    """
+    indice = {nivel: [] for nivel in NIVELES}
+    try:
+        for posicion, partida in enumerate(iterar_partidas(config_file_path)):
+            nivel = DIFICULTADES.get(str(partida.get("dificultad", "")).lower(), "FÁCIL")
+            indice[nivel].append(str(partida.get("id", f"partida_{posicion + 1}")))
+    except (ValueError, OSError) as e:
+        print(f"Error al indexar el archivo de partidas: {e}")
+        return None
+    return indice
+
+
+def dimensiones_partida(partida: Optional[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Devuelve las dimensiones (filas, columnas) del tablero de una partida.
+    
+    Usa el campo "tamaño" de la partida (o su "tablero" en el formato del
+    archivo) y lo amplía si alguna clave queda fuera, de modo que sirve
+    también para partidas guardadas antes de que existiera "tamaño".
+    
+    Args:
+        partida: Partida en formato de archivo o en formato esperado
+    
+    Returns:
+        Tuple[int, int]: (filas, columnas) incluidas la fila y la columna de claves
+    """
+    if not partida:
+        return TAMANO_POR_DEFECTO, TAMANO_POR_DEFECTO
+    
+    tamano = partida.get("tamaño") or {}
+    tablero = partida.get("tablero") or []
+    filas = tamano.get("filas") or len(tablero)
+    columnas = tamano.get("columnas") or (len(tablero[0]) if tablero else 0)
+    
+    # Cada clave ocupa su posición y las casillas de su corrida
+    for clave in partida.get("claves") or []:
+        if clave.get("tipo_de_clave") == "C":
+            filas = max(filas, clave["fila"] + clave["casillas"])
+            columnas = max(columnas, clave["columna"])
+        else:
+            filas = max(filas, clave["fila"])
+            columnas = max(columnas, clave["columna"] + clave["casillas"])
+    
+    if not filas or not columnas:
+        return TAMANO_POR_DEFECTO, TAMANO_POR_DEFECTO
+    return filas, columnas
+
+
+def metadatos_partida(partida: Dict[str, Any], posicion: int, ruta: str) -> Optional[MetaPartida]:
+    """
+    Construye el registro liviano de una partida del catálogo.
+    
+    Solo se leen la dificultad, el id, el tamaño, el tiempo estimado y las
+    casillas de clave del tablero (para contar corridas). El registro no
+    guarda la partida: MetaPartida.cargar() la vuelve a leer del catálogo
+    por su posición y recién entonces decodifica las sumas.
+    
+    Args:
+        partida: Partida en formato del archivo
+        posicion: Posición (base 0) de la partida en el catálogo
+        ruta: Catálogo del que se leyó la partida
+    
+    Returns:
+        MetaPartida, o None si la partida no tiene tablero o sumas
+    """
+    tablero = partida.get("tablero")
+    if not tablero or not partida.get("sumas_filas") or not partida.get("sumas_columnas"):
+        return None
+    
+    nivel = DIFICULTADES.get(str(partida.get("dificultad", "")).lower(), "FÁCIL")
+    filas, columnas = dimensiones_partida(partida)
+    partida_id = str(partida.get("id", f"partida_{posicion + 1}"))
+    return MetaPartida(
+        partida_id, nivel, 1, filas, columnas,
+        contar_corridas(tablero), partida.get("tiempo_estimado"),
+        partial(_releer_partida, ruta, posicion, partida_id)
+    )
+
+
+def _releer_partida(ruta: str, posicion: int, partida_id: str) -> Optional[Dict[str, Any]]:
+    """Vuelve a leer una partida del catálogo por su posición y la convierte."""
+    try:
+        partida = leer_partida(ruta, posicion)
+    except (ValueError, OSError) as e:
+        print(f"[PARTIDAS] No se pudo leer la partida {partida_id}: {e}")
+        return None
+    
+    # El catálogo pudo cambiar después de construir el índice
+    if partida is None or str(partida.get("id", f"partida_{posicion + 1}")) != partida_id:
+        print(f"[PARTIDAS] La partida {partida_id} ya no está en {ruta}")
+        return None
+    return _convert_partida_format(partida)
+
+
 def _convert_partida_format(partida: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Convierte una partida del formato actual al formato esperado.
@@ -69,17 +189,9 @@ def _convert_partida_format(partida: Dict[str, Any]) -> Optional[Dict[str, Any]]
         Dict con la partida en formato esperado, o None si no se puede convertir
     """
     try:
-        # Mapeo de dificultades
-        dificultad_mapping = {
-            "facil": "FÁCIL",
-            "normal": "MEDIO", 
-            "dificil": "DIFÍCIL",
-            "experto": "EXPERTO"
-        }
-        
         # Obtener dificultad
         dificultad_original = partida.get("dificultad", "").lower()
-        nivel = dificultad_mapping.get(dificultad_original, "FÁCIL")
+        nivel = DIFICULTADES.get(dificultad_original, "FÁCIL")
         
         # Extraer información del tablero
         tablero = partida.get("tablero", [])
@@ -142,9 +254,12 @@ def _convert_partida_format(partida: Dict[str, Any]) -> Optional[Dict[str, Any]]
                             "casillas": casillas
                         })
         
+        filas, columnas = dimensiones_partida(partida)
+        
         return {
             "nivel_de_dificultad": nivel,
             "partida": partida_num,
+            "tamaño": {"filas": filas, "columnas": columnas},
             "claves": claves
         }
         
@@ -153,6 +268,178 @@ def _convert_partida_format(partida: Dict[str, Any]) -> Optional[Dict[str, Any]]
         return None
 
 
+def _get_indice_niveles() -> Optional[Dict[str, List[MetaPartida]]]:
+    """
+    Devuelve el índice por nivel con los metadatos de las partidas.
+    
+    El índice se construye una sola vez y se reconstruye solo si cambia el
+    mtime del archivo de partidas. Cada partida se guarda como MetaPartida,
+    sin la partida original: se relee del archivo y se decodifica recién al
+    cargarla para jugar.
+    
+    Returns:
+        Dict[str, List[MetaPartida]]: Metadatos de las partidas por nivel, o None si hay error
+    """
+    global _indice_niveles, _indice_mtime, _firmas_niveles
+    
+    try:
+        mtime = os.path.getmtime(PARTIDAS_FILE)
+    except OSError:
+        mtime = None
+    
+    if _indice_niveles is not None and mtime == _indice_mtime:
+        return _indice_niveles
+    
+    if _indice_niveles is not None:
+        print("[PARTIDAS] El archivo de partidas cambió, reconstruyendo índice...")
+    
+    if mtime is None:
+        print(f"Archivo de partidas no encontrado: {PARTIDAS_FILE}")
+        _indice_niveles = None
+        return None
+    
+    indice = {nivel: [] for nivel in NIVELES}
+    firmas = {nivel: hashlib.sha1(nivel.encode("utf-8")) for nivel in NIVELES}
+    try:
+        for posicion, partida in enumerate(iterar_partidas(PARTIDAS_FILE)):
+            meta = metadatos_partida(partida, posicion, PARTIDAS_FILE)
+            if meta:
+                partidas_nivel = indice.setdefault(meta.nivel, [])
+                meta.partida = len(partidas_nivel) + 1
+                partidas_nivel.append(meta)
+                firmas.setdefault(meta.nivel, hashlib.sha1(meta.nivel.encode("utf-8")))
+                firmas[meta.nivel].update(meta.id.encode("utf-8") + b"\0")
+    except (ValueError, OSError) as e:
+        print(f"Error al cargar el archivo de partidas: {e}")
+        _indice_niveles = None
+        return None
+    
+    _indice_niveles = indice
+    _indice_mtime = mtime
+    _firmas_niveles = {nivel: resumen.hexdigest() for nivel, resumen in firmas.items()}
+    return _indice_niveles
+
+
+def _get_bolsa() -> BolsaPartidas:
+    """Devuelve las bolsas de sorteo (se recrean si cambia BOLSAS_DIR)."""
+    global _bolsa
+    
+    if _bolsa is None or _bolsa.directorio != BOLSAS_DIR:
+        _bolsa = BolsaPartidas(BOLSAS_DIR)
+    return _bolsa
+
+
+def _get_lector_bundle(ruta: str = None) -> Optional[LectorBundle]:
+    """
+    Devuelve un lector sobre el paquete binario mapeado en memoria.
+    
+    El archivo se abre con mmap una sola vez y se vuelve a mapear solo si
+    cambia su mtime; el sistema operativo carga únicamente las páginas que
+    se leen.
+    
+    Args:
+        ruta: Ruta del paquete (por defecto BUNDLE_FILE)
+    
+    Returns:
+        LectorBundle, o None si el paquete no existe o no es válido
+    """
+    global _bundle_abierto
+    
+    ruta = ruta or BUNDLE_FILE
+    try:
+        mtime = os.path.getmtime(ruta)
+    except OSError:
+        return None
+    
+    if _bundle_abierto is not None:
+        ruta_abierta, mtime_abierto, archivo, mapa, lector = _bundle_abierto
+        if ruta_abierta == ruta and mtime_abierto == mtime:
+            return lector
+        _cerrar_bundle()
+    
+    try:
+        archivo = open(ruta, 'rb')
+        try:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            lector = LectorBundle(mapa)
+        except Exception:
+            archivo.close()
+            raise
+    except (ValueError, OSError) as e:
+        print(f"Error al abrir el paquete de partidas {ruta}: {e}")
+        return None
+    
+    _bundle_abierto = (ruta, mtime, archivo, mapa, lector)
+    return lector
+
+
+def _cerrar_bundle() -> None:
+    """Libera el mapeo del paquete binario si está abierto."""
+    global _bundle_abierto
+    
+    if _bundle_abierto is not None:
+        _, _, archivo, mapa, lector = _bundle_abierto
+        lector.datos = None
+        mapa.close()
+        archivo.close()
+        _bundle_abierto = None
+
+
+def _bundle_vigente() -> Optional[LectorBundle]:
+    """
+    Devuelve el lector del paquete binario si existe y no es más viejo
+    que el JSON de partidas; si no, None para usar el JSON.
+    """
+    try:
+        bundle_mtime = os.path.getmtime(BUNDLE_FILE)
+    except OSError:
+        return None
+    
+    try:
+        if os.path.getmtime(PARTIDAS_FILE) > bundle_mtime:
+            return None
+    except OSError:
+        pass
+    
+    return _get_lector_bundle(BUNDLE_FILE)
+
+
+def load_random_partida_bundle(nivel: str, ruta: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Sortea una partida del nivel desde el paquete binario.
+    
+    Solo se decodifica el registro sorteado; el resto del catálogo no se
+    lee ni se mantiene en memoria. El sorteo usa la bolsa persistente del
+    nivel, así que no se repiten partidas hasta agotarlas.
+    
+    Args:
+        nivel: Nivel de dificultad ("FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO")
+        ruta: Ruta del paquete (por defecto BUNDLE_FILE)
+    
+    Returns:
+        Dict con la partida en formato esperado (más "id" y "tamaño"),
+        o None si no hay partidas disponibles
+    
+    Raises:
+        OSError: Si no se puede guardar la bolsa del nivel (ver BolsaPartidas.sacar)
+    """
+    if nivel not in NIVELES:
+        print(f"Nivel no válido: {nivel}")
+        return None
+    
+    lector = _get_lector_bundle(ruta)
+    if lector is None:
+        return None
+    
+    cantidad = lector.cantidad(nivel)
+    if cantidad == 0:
+        print(f"No hay partidas disponibles para el nivel: {nivel}")
+        return None
+    
+    posicion = _get_bolsa().sacar(nivel, cantidad, lector.firma(nivel))
+    return lector.leer(nivel, posicion)
+
+
 def reset_partidas(nivel: Optional[str] = None) -> None:
     """
     Resetea las partidas usadas para un nivel específico o todos los niveles.
@@ -160,81 +447,54 @@ def reset_partidas(nivel: Optional[str] = None) -> None:
     Args:
         nivel: Nivel a resetear ("FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO") o None para todos
     """
-    global _used_partidas, _partidas_shuffled
-    
-    if nivel is None:
-        # Resetear todos los niveles
-        for nivel_key in _used_partidas:
-            _used_partidas[nivel_key].clear()
-        _partidas_shuffled = False
-    elif nivel in _used_partidas:
-        # Resetear solo el nivel especificado
-        _used_partidas[nivel].clear()
-        _partidas_shuffled = False
+    if nivel is None or nivel in NIVELES:
+        _get_bolsa().vaciar(nivel)
 
 
 def load_random_partida(nivel: str) -> Optional[Dict[str, Any]]:
     """
     Carga una partida aleatoria para el nivel especificado.
     
+    Las partidas se sacan de la bolsa persistente del nivel: el sorteo es
+    O(1) y no se repite ninguna partida hasta que se agotan todas.
+    
     Args:
         nivel: Nivel de dificultad ("FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO")
         
     Returns:
         Dict con la partida en formato esperado, o None si no hay partidas disponibles
+    
+    Raises:
+        OSError: Si no se puede guardar la bolsa del nivel (ver BolsaPartidas.sacar)
         
     Example:
         >>> partida = load_random_partida("FÁCIL")
         >>> print(partida["nivel_de_dificultad"])
         "FÁCIL"
     """
-    global _partidas_cache, _partidas_shuffled, _used_partidas
-    
     # Validar nivel
-    if nivel not in ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"]:
+    if nivel not in NIVELES:
         print(f"Nivel no válido: {nivel}")
         return None
     
-    # Cargar partidas si no están en caché
-    if _partidas_cache is None:
-        _partidas_cache = _load_partidas_file()
-        if _partidas_cache is None:
-            return None
+    # Si hay un paquete binario compilado al día, sortear desde él
+    if _bundle_vigente() is not None:
+        return load_random_partida_bundle(nivel, BUNDLE_FILE)
+    
+    # Partidas del nivel ya convertidas (el índice se construye una sola vez)
+    indice = _get_indice_niveles()
+    if indice is None:
+        return None
     
-    # Filtrar partidas por nivel
-    partidas_nivel = []
-    for partida in _partidas_cache:
-        converted_partida = _convert_partida_format(partida)
-        if converted_partida and converted_partida["nivel_de_dificultad"] == nivel:
-            partidas_nivel.append(converted_partida)
+    partidas_nivel = indice.get(nivel, [])
     
     if not partidas_nivel:
         print(f"No hay partidas disponibles para el nivel: {nivel}")
         return None
     
-    # Mezclar partidas solo una vez por ejecución
-    if not _partidas_shuffled:
-        random.shuffle(partidas_nivel)
-        _partidas_shuffled = True
-    
-    # Buscar una partida no usada
-    for partida in partidas_nivel:
-        partida_id = f"{partida['nivel_de_dificultad']}_{partida['partida']}"
-        if partida_id not in _used_partidas[nivel]:
-            _used_partidas[nivel].add(partida_id)
-            return partida
-    
-    # Si todas las partidas han sido usadas, resetear y devolver la primera
-    print(f"Todas las partidas del nivel {nivel} han sido usadas. Reseteando...")
-    reset_partidas(nivel)
-    
-    if partidas_nivel:
-        partida = partidas_nivel[0]
-        partida_id = f"{partida['nivel_de_dificultad']}_{partida['partida']}"
-        _used_partidas[nivel].add(partida_id)
-        return partida
-    
-    return None
+    # Solo la partida sorteada se decodifica
+    posicion = _get_bolsa().sacar(nivel, len(partidas_nivel), _firmas_niveles[nivel])
+    return partidas_nivel[posicion].cargar()
 
 
 def get_available_partidas_count(nivel: str) -> int:
@@ -247,20 +507,39 @@ def get_available_partidas_count(nivel: str) -> int:
     Returns:
         Número de partidas disponibles
     """
-    global _partidas_cache
+    lector = _bundle_vigente()
+    if lector is not None:
+        return lector.cantidad(nivel)
+    
+    indice = _get_indice_niveles()
+    if indice is None:
+        return 0
+    
+    return len(indice.get(nivel, []))
+
+
+def listar_partidas(nivel: str) -> List[MetaPartida]:
+    """
+    Devuelve los metadatos de las partidas de un nivel (para listados).
     
-    if _partidas_cache is None:
-        _partidas_cache = _load_partidas_file()
-        if _partidas_cache is None:
-            return 0
+    No decodifica ninguna partida: cada MetaPartida trae id, tamaño,
+    corridas y tiempo estimado, y se carga con MetaPartida.cargar().
+    
+    Args:
+        nivel: Nivel de dificultad
+        
+    Returns:
+        List[MetaPartida]: Partidas del nivel en orden del catálogo
+    """
+    lector = _bundle_vigente()
+    if lector is not None:
+        return [lector.meta(nivel, posicion) for posicion in range(lector.cantidad(nivel))]
     
-    partidas_nivel = []
-    for partida in _partidas_cache:
-        converted_partida = _convert_partida_format(partida)
-        if converted_partida and converted_partida["nivel_de_dificultad"] == nivel:
-            partidas_nivel.append(converted_partida)
+    indice = _get_indice_niveles()
+    if indice is None:
+        return []
     
-    return len(partidas_nivel)
+    return list(indice.get(nivel, []))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,185 @@
+"""
+Capa común de escritura segura de archivos.
+
+Varias instancias del juego pueden compartir el mismo directorio data/.
+Para que un cierre inesperado o un segundo proceso no dejen un archivo
+truncado o mezclado:
+
+- Las escrituras van a un archivo temporal en el mismo directorio, se
+  sincronizan con fsync y se renombran sobre el destino con os.replace,
+  que es atómico: los lectores ven el archivo anterior o el nuevo completo.
+- Los ciclos leer-modificar-escribir toman un bloqueo advisory sobre
+  "<archivo>.lock" (fcntl en POSIX, msvcrt en Windows).
+- Los errores transitorios (p. ej. el destino abierto por otro proceso en
+  Windows, o el bloqueo ocupado) se reintentan con espera exponencial
+  acotada.
+"""
+
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+REINTENTOS = 5
+ESPERA_INICIAL = 0.02  # segundos; se duplica en cada reintento
+ESPERA_BLOQUEO = 5.0  # segundos máximos esperando un bloqueo
+
+
+def _reintentar(operacion: Callable[[], Any], reintentos: int = REINTENTOS) -> Any:
+    """Ejecuta la operación reintentando los OSError con espera exponencial."""
+    espera = ESPERA_INICIAL
+    for intento in range(reintentos + 1):
+        try:
+            return operacion()
+        except OSError:
+            if intento == reintentos:
+                raise
+            time.sleep(espera)
+            espera *= 2
+
+
+def _sincronizar_directorio(directorio: str) -> None:
+    # Asegura que el renombrado quede en disco (no disponible en Windows)
+    if fcntl is None:
+        return
+    fd = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def escribir_bytes_atomico(ruta: str, datos: bytes) -> None:
+    """
+    Reemplaza el contenido de un archivo de forma atómica.
+
+    Raises:
+        OSError: Si la escritura sigue fallando después de los reintentos
+    """
+    directorio = os.path.dirname(os.path.abspath(ruta))
+    os.makedirs(directorio, exist_ok=True)
+
+    def escribir():
+        fd, temporal = tempfile.mkstemp(prefix=f".{os.path.basename(ruta)}.", suffix=".tmp", dir=directorio)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(datos)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, ruta)
+        except BaseException:
+            try:
+                os.remove(temporal)
+            except OSError:
+                pass
+            raise
+        _sincronizar_directorio(directorio)
+
+    _reintentar(escribir)
+
+
+def escribir_json_atomico(ruta: str, datos: Any, indent: Optional[int] = 2) -> None:
+    """
+    Guarda datos como JSON (UTF-8) de forma atómica.
+
+    Raises:
+        OSError: Si la escritura sigue fallando después de los reintentos
+        TypeError: Si los datos no se pueden serializar
+    """
+    texto = json.dumps(datos, indent=indent, ensure_ascii=False)
+    escribir_bytes_atomico(ruta, texto.encode("utf-8"))
+
+
+def leer_json(ruta: str, por_defecto: Any = None) -> Any:
+    """
+    Lee un archivo JSON.
+
+    Returns:
+        Los datos del archivo, o por_defecto si no existe o no es JSON válido
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return por_defecto
+    except (ValueError, OSError) as e:
+        print(f"[PERSISTENCIA] No se pudo leer {ruta}: {e}")
+        return por_defecto
+
+
+def _tomar_bloqueo(fd: int) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _soltar_bloqueo(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def bloqueo_archivo(ruta: str, espera_maxima: float = ESPERA_BLOQUEO) -> Iterator[None]:
+    """
+    Bloqueo exclusivo advisory sobre "<ruta>.lock" entre procesos.
+
+    Raises:
+        TimeoutError: Si el bloqueo no se obtiene dentro de espera_maxima
+    """
+    ruta_bloqueo = ruta + ".lock"
+    directorio = os.path.dirname(os.path.abspath(ruta_bloqueo))
+    os.makedirs(directorio, exist_ok=True)
+
+    fd = os.open(ruta_bloqueo, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        limite = time.monotonic() + espera_maxima
+        espera = ESPERA_INICIAL
+        while not _tomar_bloqueo(fd):
+            if time.monotonic() >= limite:
+                raise TimeoutError(f"No se pudo bloquear {ruta}")
+            time.sleep(espera)
+            espera = min(espera * 2, 0.5)
+        try:
+            yield
+        finally:
+            _soltar_bloqueo(fd)
+    finally:
+        os.close(fd)
+
+
+def actualizar_json(ruta: str, actualizar: Callable[[Any], Any], por_defecto: Any = None,
+                    indent: Optional[int] = 2) -> Any:
+    """
+    Lee, modifica y guarda un archivo JSON con el bloqueo del archivo tomado,
+    de modo que dos procesos no pierdan los cambios del otro.
+
+    Args:
+        ruta: Archivo JSON
+        actualizar: Recibe los datos actuales (o por_defecto) y devuelve los nuevos
+        por_defecto: Datos si el archivo no existe o no es válido
+
+    Returns:
+        Los datos guardados
+    """
+    with bloqueo_archivo(ruta):
+        datos = actualizar(leer_json(ruta, por_defecto))
+        escribir_json_atomico(ruta, datos, indent=indent)
+    return datos
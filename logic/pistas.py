@@ -0,0 +1,204 @@
+"""
+Motor de pistas con explicación lógica.
+
+Mantiene de forma incremental, para cada corrida, las combinaciones que
+todavía son posibles con los dígitos colocados, y para cada casilla sus
+candidatos propagados. Con ese estado una pista es un recorrido lineal de
+las casillas vacías buscando, en este orden:
+
+- "combinacion_unica": la corrida solo admite una combinación y la otra
+  corrida de la casilla deja un único dígito de esa combinación.
+- "interseccion": los dígitos que admiten la corrida horizontal y la
+  vertical de la casilla se cruzan en un único dígito.
+- "candidato_unico": tras propagar las restricciones del tablero a la
+  casilla solo le queda un candidato.
+
+No se resuelve el tablero: colocar un dígito solo recalcula las dos
+corridas afectadas y propaga desde ellas.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .combinaciones import combinaciones, digitos
+from .indice_partida import IndicePartida
+from .solver import KakuroSolver, MASCARA_COMPLETA
+
+
+_POPCOUNT = [bin(m).count("1") for m in range(1 << 10)]
+_DIGITO = {1 << d: d for d in range(1, 10)}
+
+
+class MotorPistas:
+    """
+    Estado de candidatos incremental para dar pistas sobre una partida.
+    """
+
+    def __init__(self, indice: IndicePartida):
+        self.indice = indice
+        self._solver = KakuroSolver([], indice=indice)
+        self.valores = [0] * indice.total_celdas
+
+        # Combinaciones posibles de cada corrida y unión de sus dígitos
+        self.combos_runs: List[Tuple[int, ...]] = [()] * indice.total_runs
+        self.permitidos_runs: List[int] = [0] * indice.total_runs
+        for run_id in range(indice.total_runs):
+            self._actualizar_run(run_id)
+
+        self.candidatos: List[int] = []
+        self.consistente = True
+        self._recalcular_candidatos()
+
+    def colocar(self, fila: int, columna: int, valor: Optional[int]) -> None:
+        """
+        Registra una jugada (None para borrar) y actualiza el estado.
+
+        Colocar un dígito en una casilla vacía propaga solo desde sus dos
+        corridas; borrar o sustituir un dígito vuelve a propagar todo el
+        tablero porque los candidatos eliminados pueden volver a ser válidos.
+        """
+        celda_id = self.indice.id_celda.get((fila, columna))
+        if celda_id is None:
+            return
+
+        anterior = self.valores[celda_id]
+        nuevo = valor or 0
+        if anterior == nuevo:
+            return
+
+        self.valores[celda_id] = nuevo
+        runs = self.indice.runs_de_celda[celda_id]
+        for run_id in runs:
+            self._actualizar_run(run_id)
+
+        bit = 1 << nuevo
+        if anterior == 0 and self.consistente and self.candidatos[celda_id] & bit:
+            self.candidatos[celda_id] = bit
+            self.consistente = self._solver.propagar(self.candidatos, runs)
+        else:
+            self._recalcular_candidatos()
+
+    def cargar_valores(self, valores: Dict[Tuple[int, int], int]) -> None:
+        """Sincroniza el motor con todas las casillas llenas de una vez."""
+        for coord, celda_id in self.indice.id_celda.items():
+            valor = valores.get(coord)
+            self.valores[celda_id] = valor if isinstance(valor, int) and 1 <= valor <= 9 else 0
+        for run_id in range(self.indice.total_runs):
+            self._actualizar_run(run_id)
+        self._recalcular_candidatos()
+
+    def candidatos_de(self, fila: int, columna: int) -> List[int]:
+        """Devuelve los candidatos actuales de una casilla."""
+        celda_id = self.indice.id_celda.get((fila, columna))
+        if celda_id is None:
+            return []
+        return digitos(self.candidatos[celda_id])
+
+    def pista(self) -> Optional[Dict[str, Any]]:
+        """
+        Busca la siguiente casilla que se puede deducir lógicamente.
+
+        Returns:
+            Dict con "fila", "columna" (base 0), "valor", "regla" y
+            "explicacion"; o None si no hay deducción disponible o los
+            dígitos colocados son contradictorios
+        """
+        if not self.consistente:
+            return None
+
+        indice = self.indice
+        vacias = [i for i, v in enumerate(self.valores) if not v]
+
+        # 1. Combinación única en una corrida, filtrada por la corrida cruzada
+        for celda_id in vacias:
+            horizontal = indice.horizontal[celda_id]
+            vertical = indice.vertical[celda_id]
+            for run_id, otro in ((horizontal, vertical), (vertical, horizontal)):
+                if run_id is None or len(self.combos_runs[run_id]) != 1:
+                    continue
+                combo = self.combos_runs[run_id][0]
+                mascara = combo & self._permitido(otro)
+                if _POPCOUNT[mascara] == 1:
+                    explicacion = (
+                        f"La {self._describir_run(run_id)} solo admite la combinación "
+                        f"{self._formatear(combo)}"
+                    )
+                    if otro is not None and mascara != combo:
+                        explicacion += (
+                            f" y la {self._describir_run(otro)} solo permite "
+                            f"{self._formatear(self._permitido(otro))}"
+                        )
+                    return self._crear_pista(celda_id, mascara, "combinacion_unica", explicacion)
+
+        # 2. Intersección de los dígitos permitidos por ambas corridas
+        for celda_id in vacias:
+            horizontal = indice.horizontal[celda_id]
+            vertical = indice.vertical[celda_id]
+            if horizontal is None or vertical is None:
+                continue
+            mascara = self.permitidos_runs[horizontal] & self.permitidos_runs[vertical]
+            if _POPCOUNT[mascara] == 1:
+                explicacion = (
+                    f"La {self._describir_run(horizontal)} permite "
+                    f"{self._formatear(self.permitidos_runs[horizontal])} y la "
+                    f"{self._describir_run(vertical)} permite "
+                    f"{self._formatear(self.permitidos_runs[vertical])}; solo coinciden en un dígito"
+                )
+                return self._crear_pista(celda_id, mascara, "interseccion", explicacion)
+
+        # 3. Candidato único tras propagar las restricciones del tablero
+        for celda_id in vacias:
+            mascara = self.candidatos[celda_id]
+            if _POPCOUNT[mascara] == 1:
+                explicacion = (
+                    "Al descartar los dígitos que ya no caben en las corridas vecinas, "
+                    "a esta casilla solo le queda un candidato"
+                )
+                return self._crear_pista(celda_id, mascara, "candidato_unico", explicacion)
+
+        return None
+
+    def _actualizar_run(self, run_id: int) -> None:
+        """Recalcula las combinaciones posibles de una corrida con sus dígitos colocados."""
+        usado = 0
+        resto = self.indice.sumas_runs[run_id]
+        abiertas = 0
+        for celda_id in self.indice.celdas_runs[run_id]:
+            valor = self.valores[celda_id]
+            if valor:
+                usado |= 1 << valor
+                resto -= valor
+            else:
+                abiertas += 1
+
+        combos = tuple(c for c in combinaciones(resto, abiertas) if not c & usado)
+        permitido = 0
+        for combo in combos:
+            permitido |= combo
+        self.combos_runs[run_id] = combos
+        self.permitidos_runs[run_id] = permitido
+
+    def _recalcular_candidatos(self) -> None:
+        self.candidatos = [1 << v if v else MASCARA_COMPLETA for v in self.valores]
+        self.consistente = self._solver.propagar(self.candidatos)
+
+    def _permitido(self, run_id: Optional[int]) -> int:
+        return MASCARA_COMPLETA if run_id is None else self.permitidos_runs[run_id]
+
+    def _describir_run(self, run_id: int) -> str:
+        tipo = "fila" if self.indice.tipos_runs[run_id] == "F" else "columna"
+        fila, columna = self.indice.origenes_runs[run_id]
+        return f"{tipo} con clave {self.indice.sumas_runs[run_id]} en ({fila + 1}, {columna + 1})"
+
+    def _formatear(self, mascara: int) -> str:
+        return "{" + ", ".join(str(d) for d in digitos(mascara)) + "}"
+
+    def _crear_pista(self, celda_id: int, mascara: int, regla: str, explicacion: str) -> Dict[str, Any]:
+        fila, columna = self.indice.coordenadas[celda_id]
+        valor = _DIGITO[mascara]
+        return {
+            "fila": fila,
+            "columna": columna,
+            "valor": valor,
+            "regla": regla,
+            "explicacion": f"{explicacion}: la casilla ({fila + 1}, {columna + 1}) es {valor}.",
+        }
@@ -0,0 +1,222 @@
+"""
+Pool de partidas precargadas por nivel.
+
+Cargar una partida implica leer el catálogo (o el paquete binario),
+convertirla y construir su índice de corridas. El pool mantiene en memoria
+`por_nivel` partidas ya convertidas e indexadas de cada nivel y las repone
+desde un hilo de fondo, así que empezar un juego nuevo solo saca una
+partida de una cola.
+
+Las partidas se sacan de las bolsas persistentes de partida_loader al
+reponer el pool: las que quedan precargadas al cerrar el juego cuentan
+como jugadas. Si el catálogo no tiene partidas de un nivel, el hilo las
+genera con logic.generador en un proceso aparte: generar es puro cálculo y
+en un hilo competiría por el GIL con la interfaz.
+
+La interfaz no espera al pool: pide el nivel con pedir() y consulta
+disponibles() / sin_partidas() desde after() hasta que haya una partida.
+"""
+
+import multiprocessing
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from .indice_partida import IndicePartida
+from .partida_loader import NIVELES, load_random_partida
+
+
+POR_NIVEL = 2
+
+_DIFICULTAD_DE_NIVEL = {"FÁCIL": "facil", "MEDIO": "normal", "DIFÍCIL": "dificil", "EXPERTO": "experto"}
+
+
+class PartidaPreparada:
+    """Partida convertida junto con su índice de corridas ya construido."""
+
+    __slots__ = ("partida", "indice")
+
+    def __init__(self, partida: Dict, indice: Optional[IndicePartida] = None):
+        self.partida = partida
+        self.indice = indice if indice is not None else IndicePartida(partida.get("claves", []))
+
+
+def generar_partida_nivel(nivel: str) -> Optional[Dict]:
+    """Genera una partida del nivel y la devuelve ya convertida (o None)."""
+    from .generador import generar_partida
+    from .partida_loader import _convert_partida_format
+
+    partida = generar_partida(_DIFICULTAD_DE_NIVEL.get(nivel, "facil"), semilla=random.randrange(1 << 31))
+    if partida is None:
+        return None
+    convertida = _convert_partida_format(partida)
+    if convertida:
+        convertida["nivel_de_dificultad"] = nivel
+        convertida["id"] = partida["id"]
+    return convertida
+
+
+class PoolPartidas:
+    """
+    Colas de partidas preparadas por nivel con reposición en segundo plano.
+    """
+
+    def __init__(self, por_nivel: int = POR_NIVEL,
+                 cargador: Callable[[str], Optional[Dict]] = load_random_partida,
+                 generador: Optional[Callable[[str], Optional[Dict]]] = generar_partida_nivel,
+                 generar_en_proceso: bool = True):
+        """
+        Args:
+            por_nivel: Partidas preparadas por nivel
+            cargador: Carga una partida convertida del catálogo (o None)
+            generador: Genera una partida convertida si el catálogo no tiene el nivel
+            generar_en_proceso: Ejecutar el generador en un proceso aparte
+                (el generador debe poder serializarse con pickle)
+        """
+        self.por_nivel = por_nivel
+        self.cargador = cargador
+        self.generador = generador
+        self.generar_en_proceso = generar_en_proceso
+        self._procesos = None
+        self._colas: Dict[str, deque] = {nivel: deque() for nivel in NIVELES}
+        self._sin_partidas = set()  # niveles que no se pudieron reponer
+        self._pedidos = set()  # niveles por los que alguien está esperando
+        self._condicion = threading.Condition()
+        self._activo = False
+        self._hilo = None
+
+    def iniciar(self) -> None:
+        """Arranca el hilo de reposición (si no estaba corriendo)."""
+        with self._condicion:
+            if self._activo:
+                return
+            self._activo = True
+        self._hilo = threading.Thread(target=self._reponer, name="pool-partidas", daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout: float = 1.0) -> None:
+        """Detiene el hilo de reposición."""
+        with self._condicion:
+            self._activo = False
+            self._condicion.notify_all()
+        if self._hilo is not None:
+            self._hilo.join(timeout=timeout)
+            self._hilo = None
+        if self._procesos is not None:
+            self._procesos.shutdown(wait=False, cancel_futures=True)
+            self._procesos = None
+
+    def disponibles(self, nivel: str) -> int:
+        """Partidas preparadas en este momento para el nivel."""
+        with self._condicion:
+            return len(self._colas.get(nivel, ()))
+
+    def sin_partidas(self, nivel: str) -> bool:
+        """Indica si el último intento de reponer el nivel no encontró partidas."""
+        with self._condicion:
+            return nivel not in self._colas or (nivel in self._sin_partidas and not self._colas[nivel])
+
+    def pedir(self, nivel: str) -> None:
+        """
+        Pide al hilo que prepare una partida del nivel antes que las demás.
+        No bloquea; el resultado se consulta con disponibles() y sin_partidas().
+        """
+        with self._condicion:
+            if nivel not in self._colas:
+                return
+            self._sin_partidas.discard(nivel)
+            self._pedidos.add(nivel)
+            self._condicion.notify_all()
+
+    def obtener(self, nivel: str, esperar: float = 0.0) -> Optional[PartidaPreparada]:
+        """
+        Saca una partida preparada del nivel.
+
+        Args:
+            nivel: Nivel de dificultad
+            esperar: Segundos que se espera a que el hilo reponga si la cola
+                está vacía (0 = no esperar)
+
+        Returns:
+            PartidaPreparada, o None si no hay ninguna lista. En ese caso el
+            llamador puede cargar la partida directamente.
+        """
+        if nivel not in self._colas:
+            return None
+
+        with self._condicion:
+            self._sin_partidas.discard(nivel)
+            cola = self._colas[nivel]
+            if not cola and esperar > 0 and self._activo:
+                self._pedidos.add(nivel)
+                self._condicion.notify_all()
+                self._condicion.wait_for(lambda: cola or nivel in self._sin_partidas, timeout=esperar)
+                self._pedidos.discard(nivel)
+            preparada = cola.popleft() if cola else None
+            if preparada is not None:
+                self._pedidos.discard(nivel)
+            self._condicion.notify_all()
+        return preparada
+
+    def _generar(self, nivel: str) -> Optional[Dict]:
+        if not self.generar_en_proceso:
+            return self.generador(nivel)
+        if self._procesos is None:
+            # spawn: no se hace fork de un proceso con Tk y otros hilos activos
+            self._procesos = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        return self._procesos.submit(self.generador, nivel).result()
+
+    def _preparar(self, nivel: str) -> Optional[PartidaPreparada]:
+        partida = self.cargador(nivel)
+        if partida is None and self.generador is not None:
+            partida = self._generar(nivel)
+        return PartidaPreparada(partida) if partida else None
+
+    def _siguiente_nivel(self) -> Optional[str]:
+        # Primero los niveles que alguien está esperando
+        for nivel in self._pedidos:
+            if not self._colas[nivel] and nivel not in self._sin_partidas:
+                return nivel
+        for nivel in NIVELES:
+            if len(self._colas[nivel]) < self.por_nivel and nivel not in self._sin_partidas:
+                return nivel
+        return None
+
+    def _reponer(self) -> None:
+        """Bucle del hilo: completa las colas y espera a que se saque una partida."""
+        while True:
+            with self._condicion:
+                nivel = self._siguiente_nivel()
+                while self._activo and nivel is None:
+                    self._condicion.wait()
+                    nivel = self._siguiente_nivel()
+                if not self._activo:
+                    return
+
+            try:
+                preparada = self._preparar(nivel)
+            except Exception as e:
+                print(f"[POOL] Error al preparar una partida de {nivel}: {e}")
+                preparada = None
+
+            with self._condicion:
+                if preparada is None:
+                    self._sin_partidas.add(nivel)
+                else:
+                    self._colas[nivel].append(preparada)
+                self._condicion.notify_all()
+
+
+_pool = None
+
+
+def obtener_pool(por_nivel: int = POR_NIVEL) -> PoolPartidas:
+    """Devuelve el pool compartido de la aplicación, arrancándolo la primera vez."""
+    global _pool
+
+    if _pool is None:
+        _pool = PoolPartidas(por_nivel)
+        _pool.iniciar()
+    return _pool
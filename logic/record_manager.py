@@ -1,16 +1,50 @@
 """
-Módulo para manejar la lectura, escritura y consulta del archivo de récords.
+Módulo para manejar la lectura, escritura y consulta de los récords.
 Este módulo gestiona los mejores tiempos de los jugadores por nivel de dificultad.
+
+Los récords se guardan en una base SQLite (ver almacen_records) a través
+del servicio único de récords (ver servicio_records), que también usan
+SaveLoadManager y FileManager. La primera vez que se abre la base se
+importan los récords de los archivos JSON anteriores.
 """
 
-import json
-import os
-from datetime import datetime
 from typing import List, Dict, Any, Optional
 
+from .almacen_records import RECORDS_DB, AlmacenRecords
+from .servicio_records import ServicioRecords
+
 
-RECORDS_FILE = "data/kakuro2025_record.json"
+# Formatos anteriores, solo para migrar
+RECORDS_FILE = "data/kakuro2025_record.json"  # record_manager
+RECORDS_LISTA_FILE = "data/kakuro2025_récords.json"  # SaveLoadManager y FileManager
 NIVELES = ["FÁCIL", "MEDIO", "DIFÍCIL", "EXPERTO"]
+TOP_RECORDS = 3
+
+# Servicio abierto (se reabre si cambia RECORDS_DB)
+_servicio = None
+
+
+def obtener_servicio() -> ServicioRecords:
+    """Devuelve el servicio de récords, migrando los JSON anteriores al abrir la base."""
+    global _servicio
+    
+    if _servicio is None or _servicio.almacen.ruta != RECORDS_DB:
+        if _servicio is not None:
+            _servicio.almacen.cerrar()
+        almacen = AlmacenRecords(RECORDS_DB)
+        for ruta in (RECORDS_FILE, RECORDS_LISTA_FILE):
+            almacen.migrar_json(ruta)
+        _servicio = ServicioRecords(almacen)
+    return _servicio
+
+
+def cerrar_servicio() -> None:
+    """Cierra la base de récords (se vuelve a abrir en el próximo uso)."""
+    global _servicio
+    
+    if _servicio is not None:
+        _servicio.almacen.cerrar()
+        _servicio = None
 
 
 def guardar_record(nombre_jugador: str, nivel: str, tiempo_usado: int) -> bool:
@@ -30,59 +64,23 @@ def guardar_record(nombre_jugador: str, nivel: str, tiempo_usado: int) -> bool:
         print("[RECORDS] Datos inválidos, no se guarda récord.")
         return False
 
-    # Crear el registro del récord
-    record = {
-        "jugador": nombre_jugador,
-        "tiempo": tiempo_usado,
-        "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    }
-
-    # Cargar datos existentes
-    data = {}
-
-    if os.path.exists(RECORDS_FILE):
-        try:
-            with open(RECORDS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            print(f"[RECORDS] Error leyendo archivo: {e}")
-            data = {}
-
-    # Inicializar nivel si no existe
-    if nivel not in data:
-        data[nivel] = []
-
-    # Agregar nuevo récord
-    data[nivel].append(record)
-    
-    # Ordenar por tiempo ascendente (mejor tiempo primero)
-    data[nivel].sort(key=lambda r: r["tiempo"])
-    
-    # Solo mantener los 3 mejores
-    data[nivel] = data[nivel][:3]
-
-    # Guardar en archivo
     try:
-        # Crear directorio si no existe
-        os.makedirs(os.path.dirname(RECORDS_FILE), exist_ok=True)
-        
-        with open(RECORDS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        
+        obtener_servicio().registrar(nombre_jugador, nivel, tiempo_usado)
         print(f"[RECORDS] Récord guardado exitosamente para {nombre_jugador} en nivel {nivel}")
         return True
         
     except Exception as e:
-        print(f"[RECORDS] Error escribiendo archivo: {e}")
+        print(f"[RECORDS] Error guardando récord: {e}")
         return False
 
 
-def obtener_top_records(nivel: str) -> List[Dict[str, Any]]:
+def obtener_top_records(nivel: str, n: int = TOP_RECORDS) -> List[Dict[str, Any]]:
     """
-    Devuelve la lista de los mejores 3 récords para un nivel dado.
+    Devuelve la lista de los mejores récords para un nivel dado.
     
     Args:
         nivel (str): Nivel de dificultad
+        n (int): Cantidad de récords (por defecto los 3 mejores)
         
     Returns:
         List[Dict[str, Any]]: Lista de récords ordenados por tiempo
@@ -91,26 +89,36 @@ def obtener_top_records(nivel: str) -> List[Dict[str, Any]]:
         print(f"[RECORDS] Nivel inválido: {nivel}")
         return []
 
-    if not os.path.exists(RECORDS_FILE):
-        print("[RECORDS] Archivo de récords no existe")
-        return []
-
     try:
-        with open(RECORDS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            records = data.get(nivel, [])
-            
-            # Ordenar por tiempo para asegurar orden correcto
-            records.sort(key=lambda r: r["tiempo"])
-            
-            print(f"[RECORDS] Cargados {len(records)} récords para nivel {nivel}")
-            return records
+        records = obtener_servicio().top(nivel, n)
+        print(f"[RECORDS] Cargados {len(records)} récords para nivel {nivel}")
+        return records
             
     except Exception as e:
         print(f"[RECORDS] Error cargando récords: {e}")
         return []
 
 
+def obtener_historial_jugador(nombre_jugador: str, nivel: Optional[str] = None,
+                              limite: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Devuelve los récords de un jugador, del más reciente al más antiguo.
+    
+    Args:
+        nombre_jugador (str): Nombre del jugador
+        nivel (str): Filtrar por nivel de dificultad (opcional)
+        limite (int): Número máximo de récords (opcional)
+        
+    Returns:
+        List[Dict[str, Any]]: Récords con "nivel", "tiempo" y "fecha"
+    """
+    try:
+        return obtener_servicio().historial(nombre_jugador, nivel, limite)
+    except Exception as e:
+        print(f"[RECORDS] Error cargando historial: {e}")
+        return []
+
+
 def formatear_tiempo(segundos: int) -> str:
     """
     Convierte segundos a formato legible HH:MM:SS.
@@ -139,15 +147,11 @@ def verificar_nuevo_record(nivel: str, tiempo_usado: int) -> bool:
     Returns:
         bool: True si es un nuevo récord, False en caso contrario
     """
-    records = obtener_top_records(nivel)
-    
-    if not records:
-        return True  # Es el primer récord
-    
-    # Verificar si el tiempo es mejor que el peor de los 3 mejores
-    peor_tiempo = records[-1]["tiempo"] if len(records) >= 3 else float('inf')
+    if nivel not in NIVELES:
+        return False
     
-    return tiempo_usado < peor_tiempo
+    # Verificar si el tiempo es mejor que el peor de los 3 mejores (desde memoria)
+    return obtener_servicio().es_record(nivel, tiempo_usado, TOP_RECORDS)
 
 
 def obtener_estadisticas_nivel(nivel: str) -> Dict[str, Any]:
@@ -190,22 +194,11 @@ def limpiar_records_nivel(nivel: str) -> bool:
     Returns:
         bool: True si se eliminaron exitosamente, False en caso contrario
     """
-    if not os.path.exists(RECORDS_FILE):
-        return True
-
     try:
-        with open(RECORDS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        if nivel in data:
-            del data[nivel]
-        
-        with open(RECORDS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
-        
+        obtener_servicio().limpiar(nivel)
         print(f"[RECORDS] Récords del nivel {nivel} eliminados")
         return True
         
     except Exception as e:
         print(f"[RECORDS] Error eliminando récords: {e}")
-        return False 
\ No newline at end of file
+        return False
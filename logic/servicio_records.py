@@ -0,0 +1,130 @@
+"""
+Servicio único de tabla de récords.
+
+Centraliza los récords que antes guardaban por separado record_manager
+(top 3 en kakuro2025_record.json), SaveLoadManager.save_record (top 10 en
+kakuro2025_récords.json, sin EXPERTO) y FileManager.agregar_records. Todos
+escriben ahora en un AlmacenRecords (SQLite) a través de este servicio: el
+del juego en data/, o el del data_dir con el que se creó el FileManager.
+
+Por nivel se mantiene en memoria un montículo con los K mejores tiempos.
+Registrar un récord lo inserta en la base (escritura inmediata) y actualiza
+el montículo en O(log K); las consultas de top se responden desde memoria
+sin leer ni ordenar archivos. Si otro proceso escribe en la base (cambia
+su data_version), los montículos se vuelven a leer.
+"""
+
+import heapq
+import itertools
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .almacen_records import AlmacenRecords
+
+
+TOP_K = 10  # récords por nivel que se mantienen en memoria
+
+
+class ServicioRecords:
+    """
+    Tabla de récords con caché top-K por nivel y escritura inmediata.
+    """
+
+    def __init__(self, almacen: AlmacenRecords, k: int = TOP_K):
+        self.almacen = almacen
+        self.k = k
+        # nivel -> montículo de (-tiempo, -orden, récord): la raíz es el peor del top
+        self._tops: Dict[str, List] = {}
+        self._orden = itertools.count()
+        self._version = almacen.version()
+        self._lock = threading.Lock()
+
+    def registrar(self, jugador: str, nivel: str, tiempo: int) -> bool:
+        """
+        Guarda un récord en la base y en el top del nivel.
+
+        Returns:
+            bool: True si el récord entró en el top K del nivel
+        """
+        fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self._validar_cache()
+            top = self._top(nivel)  # se lee antes de insertar para no contar el récord dos veces
+            self.almacen.agregar(jugador, nivel, tiempo, fecha)
+            return self._insertar(top, {"jugador": jugador, "tiempo": int(tiempo), "fecha": fecha})
+
+    def top(self, nivel: str, n: int = 3) -> List[Dict[str, Any]]:
+        """
+        Devuelve los n mejores récords del nivel (menor tiempo primero).
+
+        Hasta K se responde desde memoria; para más se consulta la base.
+        """
+        if n > self.k:
+            return self.almacen.top(nivel, n)
+        with self._lock:
+            self._validar_cache()
+            mejores = sorted(self._top(nivel), reverse=True)[:n]
+        return [dict(record) for _, _, record in mejores]
+
+    def es_record(self, nivel: str, tiempo: int, n: int = 3) -> bool:
+        """Indica si un tiempo entraría en los n mejores del nivel."""
+        mejores = self.top(nivel, n)
+        return len(mejores) < n or tiempo < mejores[-1]["tiempo"]
+
+    def historial(self, jugador: str, nivel: Optional[str] = None,
+                  limite: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Récords de un jugador (ver AlmacenRecords.historial)."""
+        return self.almacen.historial(jugador, nivel, limite)
+
+    def limpiar(self, nivel: str) -> None:
+        """Elimina los récords del nivel en la base y en memoria."""
+        with self._lock:
+            self.almacen.eliminar_nivel(nivel)
+            self._tops[nivel] = []
+
+    def _top(self, nivel: str) -> List:
+        top = self._tops.get(nivel)
+        if top is None:
+            top = []
+            for record in self.almacen.top(nivel, self.k):
+                self._insertar(top, record)
+            self._tops[nivel] = top
+        return top
+
+    def _insertar(self, top: List, record: Dict[str, Any]) -> bool:
+        entrada = (-record["tiempo"], -next(self._orden), record)
+        if len(top) < self.k:
+            heapq.heappush(top, entrada)
+            return True
+        if entrada > top[0]:
+            heapq.heapreplace(top, entrada)
+            return True
+        return False
+
+    def _validar_cache(self) -> None:
+        version = self.almacen.version()
+        if version != self._version:
+            self._tops.clear()
+            self._version = version
+
+
+def fila_lista(record: Dict[str, Any], nivel: str) -> Dict[str, Any]:
+    """
+    Convierte un récord del servicio al formato de la lista de récords que
+    devolvían SaveLoadManager.get_records y FileManager.load_records.
+
+    Returns:
+        Dict con "fecha", "jugador", "nivel_dificultad", "tiempo_transcurrido"
+        y "tiempo_formato" (MM:SS, o HH:MM:SS desde una hora)
+    """
+    segundos = int(record["tiempo"])
+    horas, resto = divmod(segundos, 3600)
+    minutos, segs = divmod(resto, 60)
+    return {
+        "fecha": record.get("fecha", ""),
+        "jugador": record["jugador"],
+        "nivel_dificultad": nivel,
+        "tiempo_transcurrido": segundos,
+        "tiempo_formato": f"{horas:02}:{minutos:02}:{segs:02}" if horas else f"{minutos:02}:{segs:02}",
+    }
@@ -0,0 +1,338 @@
+"""
+Motor de resolución de tableros Kakuro.
+
+Este módulo resuelve partidas a partir de la lista de claves que genera
+partida_loader._convert_partida_format. Cada casilla blanca guarda sus
+candidatos como una máscara de bits (bit d = dígito d), las restricciones
+de cada corrida (run) se propagan hasta un punto fijo y la búsqueda elige
+siempre la casilla con menos candidatos (MRV).
+
+Para validar catálogos también puede contar soluciones deteniéndose en
+cuanto encuentra la segunda, sin enumerar el resto del espacio.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .combinaciones import combinaciones
+from .indice_partida import IndicePartida
+
+
+# Máscara con los dígitos 1-9 (bits 1..9)
+MASCARA_COMPLETA = 0b1111111110
+
+# Tablas auxiliares para trabajar con máscaras sin recorrer bits
+_POPCOUNT = [bin(m).count("1") for m in range(1 << 10)]
+_DIGITO = {1 << d: d for d in range(1, 10)}
+
+
+class KakuroSolver:
+    """
+    Resuelve una partida Kakuro por propagación de restricciones
+    y búsqueda con retroceso.
+    """
+
+    def __init__(self, claves: List[Dict], indice: Optional[IndicePartida] = None):
+        if indice is None:
+            indice = IndicePartida(claves)
+        self.coordenadas = indice.coordenadas  # id de casilla -> (fila, columna)
+        self.runs: List[Tuple[int, Tuple[int, ...]]] = list(zip(indice.sumas_runs, indice.celdas_runs))
+        self.runs_de_celda = indice.runs_de_celda
+
+        # Estadísticas de la última búsqueda
+        self.nodos = 0
+        self.rondas_propagacion = 0
+        self.tiempo = 0.0
+        self.interrumpida = False  # True si la búsqueda se cortó por max_nodos
+        self._max_nodos: Optional[int] = None
+        self._soluciones: List[List[int]] = []
+
+    def solve(self) -> Optional[Dict[Tuple[int, int], int]]:
+        """
+        Resuelve la partida.
+
+        Returns:
+            Dict[(fila, columna), int]: Dígito de cada casilla blanca (base 0),
+            o None si la partida no tiene solución
+        """
+        if not self._resolver(limite=1):
+            return None
+        return self._como_diccionario(self._soluciones[0])
+
+    def count_solutions(self, limite: int = 2, max_nodos: Optional[int] = None) -> int:
+        """
+        Cuenta las soluciones de la partida hasta llegar a `limite`.
+
+        Con el límite por defecto basta para saber si la solución es única:
+        la búsqueda se detiene en cuanto aparece la segunda.
+
+        Args:
+            limite: Soluciones a partir de las cuales se detiene la búsqueda
+            max_nodos: Nodos de búsqueda permitidos; si se superan la búsqueda
+                se corta y `interrumpida` queda en True
+
+        Returns:
+            int: Número de soluciones encontradas (como máximo `limite`)
+        """
+        return self._resolver(limite, max_nodos)
+
+    def is_unique(self) -> bool:
+        """Verifica que la partida tenga exactamente una solución."""
+        return self.count_solutions(limite=2) == 1
+
+    def first_solution(self) -> Optional[Dict[Tuple[int, int], int]]:
+        """Devuelve la primera solución encontrada en la última búsqueda."""
+        if not self._soluciones:
+            return None
+        return self._como_diccionario(self._soluciones[0])
+
+    def solutions(self) -> List[Dict[Tuple[int, int], int]]:
+        """Devuelve las soluciones encontradas por la última búsqueda."""
+        return [self._como_diccionario(solucion) for solucion in self._soluciones]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Devuelve las estadísticas de la última búsqueda.
+
+        Returns:
+            Dict con "nodos", "rondas_propagacion", "tiempo" (segundos)
+            y "soluciones"
+        """
+        return {
+            "nodos": self.nodos,
+            "rondas_propagacion": self.rondas_propagacion,
+            "tiempo": self.tiempo,
+            "soluciones": len(self._soluciones),
+        }
+
+    def propagar(self, candidatos: List[int], runs=None) -> bool:
+        """
+        Reduce en sitio una lista de candidatos (una máscara por casilla)
+        hasta un punto fijo, sin búsqueda.
+
+        Args:
+            candidatos: Máscaras por id de casilla; las casillas fijas tienen un solo bit
+            runs: Corridas a revisar primero (por defecto todas)
+
+        Returns:
+            bool: False si los candidatos son contradictorios
+        """
+        return self._propagar(candidatos, range(len(self.runs)) if runs is None else runs)
+
+    def _resolver(self, limite: int, max_nodos: Optional[int] = None) -> int:
+        """Ejecuta la búsqueda guardando hasta `limite` soluciones."""
+        inicio = time.perf_counter()
+        self.nodos = 0
+        self.rondas_propagacion = 0
+        self.interrumpida = False
+        self._max_nodos = max_nodos
+        self._soluciones = []
+
+        candidatos = [MASCARA_COMPLETA] * len(self.coordenadas)
+        if self._propagar(candidatos, range(len(self.runs))):
+            self._buscar(candidatos, limite)
+
+        self.tiempo = time.perf_counter() - inicio
+        return len(self._soluciones)
+
+    def _como_diccionario(self, solucion: List[int]) -> Dict[Tuple[int, int], int]:
+        return {self.coordenadas[i]: _DIGITO[m] for i, m in enumerate(solucion)}
+
+    def _propagar(self, candidatos: List[int], pendientes) -> bool:
+        """
+        Reduce los candidatos hasta un punto fijo.
+
+        Args:
+            candidatos: Máscaras por casilla (se modifican en sitio)
+            pendientes: Corridas que deben revisarse
+
+        Returns:
+            bool: False si se encontró una contradicción
+        """
+        runs = self.runs
+        runs_de_celda = self.runs_de_celda
+        cola = list(pendientes)
+        en_cola = [False] * len(runs)
+        for run_id in cola:
+            en_cola[run_id] = True
+
+        while cola:
+            run_id = cola.pop()
+            en_cola[run_id] = False
+            self.rondas_propagacion += 1
+            suma, indices = runs[run_id]
+
+            # Separar casillas fijas de casillas abiertas
+            usado = 0
+            resto = suma
+            abiertas = []
+            for idx in indices:
+                m = candidatos[idx]
+                if _POPCOUNT[m] == 1:
+                    if m & usado:
+                        return False
+                    usado |= m
+                    resto -= _DIGITO[m]
+                else:
+                    abiertas.append(idx)
+
+            if not abiertas:
+                if resto != 0:
+                    return False
+                continue
+
+            # Unión de candidatos abiertos para descartar combinaciones imposibles
+            union = 0
+            for idx in abiertas:
+                union |= candidatos[idx]
+
+            permitido = 0
+            for combo in combinaciones(resto, len(abiertas)):
+                if combo & usado or combo & ~union:
+                    continue
+                valido = True
+                for idx in abiertas:
+                    if not candidatos[idx] & combo:
+                        valido = False
+                        break
+                if valido:
+                    permitido |= combo
+
+            if not permitido:
+                return False
+
+            cambio = False
+            for idx in abiertas:
+                m = candidatos[idx]
+                nuevo = m & permitido
+                if nuevo != m:
+                    if not nuevo:
+                        return False
+                    candidatos[idx] = nuevo
+                    cambio = True
+                    for otro in runs_de_celda[idx]:
+                        if not en_cola[otro]:
+                            en_cola[otro] = True
+                            cola.append(otro)
+
+            if cambio and not en_cola[run_id]:
+                en_cola[run_id] = True
+                cola.append(run_id)
+
+        return True
+
+    def _buscar(self, candidatos: List[int], limite: int) -> bool:
+        """
+        Búsqueda con retroceso eligiendo la casilla con menos candidatos.
+
+        Returns:
+            bool: True cuando ya se encontraron `limite` soluciones
+            (o se superó el límite de nodos)
+        """
+        self.nodos += 1
+        if self._max_nodos is not None and self.nodos > self._max_nodos:
+            self.interrumpida = True
+            return True
+
+        mejor = -1
+        mejor_cuenta = 10
+        for idx, m in enumerate(candidatos):
+            cuenta = _POPCOUNT[m]
+            if 1 < cuenta < mejor_cuenta:
+                mejor = idx
+                mejor_cuenta = cuenta
+                if cuenta == 2:
+                    break
+
+        if mejor < 0:
+            self._soluciones.append(candidatos)
+            return len(self._soluciones) >= limite
+
+        m = candidatos[mejor]
+        while m:
+            bit = m & -m
+            m ^= bit
+            copia = list(candidatos)
+            copia[mejor] = bit
+            if self._propagar(copia, self.runs_de_celda[mejor]):
+                if self._buscar(copia, limite):
+                    return True
+
+        return False
+
+
+def _corrida_imposible(claves: List[Dict]) -> Optional[str]:
+    """
+    Busca una corrida cuya suma no se puede formar con sus casillas.
+
+    Returns:
+        str: Descripción de la primera corrida imposible, o None si no hay
+    """
+    for clave in claves:
+        if clave["casillas"] > 0 and not combinaciones(clave["clave"], clave["casillas"]):
+            return (f"corrida {clave['tipo_de_clave']} en ({clave['fila']}, {clave['columna']}): "
+                    f"la suma {clave['clave']} no se puede formar con {clave['casillas']} casillas")
+    return None
+
+
+def verificar_partida(partida: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Verifica una partida en el formato de kakuro2025_partidas.json.
+
+    Cuenta sus soluciones (deteniéndose en la segunda) y comprueba que la
+    única solución coincida con la cuadrícula "solucion" incluida.
+
+    Args:
+        partida: Partida tal como aparece en el archivo de partidas
+
+    Returns:
+        Dict con "id", "soluciones" (0, 1 o 2), "unica", "coincide_solucion"
+        (None si la partida no trae solución) y las estadísticas de búsqueda.
+        Si la partida no se puede convertir, no tiene corridas o alguna
+        corrida tiene una suma imposible para sus casillas, el dict trae
+        "error" y 0 soluciones.
+    """
+    from .partida_loader import _convert_partida_format
+
+    convertida = _convert_partida_format(partida)
+    claves = convertida["claves"] if convertida else []
+    error = None
+    if convertida is None:
+        error = "partida inválida"
+    elif not any(clave["casillas"] > 0 for clave in claves):
+        # Un tablero sin corridas "se resuelve" con la asignación vacía; no es una partida
+        error = "partida sin corridas"
+    else:
+        error = _corrida_imposible(claves)
+    if error:
+        return {
+            "id": partida.get("id"),
+            "soluciones": 0,
+            "unica": False,
+            "coincide_solucion": None,
+            "error": error,
+        }
+
+    solver = KakuroSolver(claves)
+    soluciones = solver.count_solutions(limite=2)
+
+    coincide = None
+    cuadricula = partida.get("solucion")
+    if cuadricula and soluciones:
+        encontrada = solver.first_solution()
+        try:
+            coincide = all(
+                str(valor) == str(cuadricula[fila][columna])
+                for (fila, columna), valor in encontrada.items()
+            )
+        except (IndexError, TypeError):
+            coincide = False
+
+    resultado = {
+        "id": partida.get("id"),
+        "soluciones": soluciones,
+        "unica": soluciones == 1,
+        "coincide_solucion": coincide,
+    }
+    resultado.update(solver.get_stats())
+    return resultado
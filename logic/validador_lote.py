@@ -0,0 +1,112 @@
+"""
+Validación vectorizada de muchos tableros de una misma partida.
+
+Se precalcula una matriz de pertenencia corrida x casilla a partir del
+índice de la partida; con ella las sumas y los dígitos repetidos de todas
+las corridas de N tableros se calculan con operaciones de NumPy en lugar
+de bucles de Python por tablero.
+
+NumPy es una dependencia opcional: solo se necesita para este módulo.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+from .indice_partida import IndicePartida
+
+
+class ValidadorLote:
+    """
+    Valida lotes de tableros de una misma partida.
+    """
+
+    def __init__(self, claves: List[Dict], indice: Optional[IndicePartida] = None):
+        if np is None:
+            raise ImportError("La validación por lotes requiere NumPy (pip install numpy)")
+
+        if indice is None:
+            indice = IndicePartida(claves)
+        self.indice = indice
+
+        coordenadas = indice.coordenadas
+        self.filas = np.array([f for f, _ in coordenadas], dtype=np.intp)
+        self.columnas = np.array([c for _, c in coordenadas], dtype=np.intp)
+
+        # Matriz de pertenencia: membresia[r, c] = 1 si la casilla c está en la corrida r
+        self.membresia = np.zeros((indice.total_runs, indice.total_celdas), dtype=np.int32)
+        for run_id, celdas in enumerate(indice.celdas_runs):
+            self.membresia[run_id, list(celdas)] = 1
+
+        self.objetivos = np.array(indice.sumas_runs, dtype=np.int32)
+        self.largos = self.membresia.sum(axis=1)
+
+    def validar(self, tableros) -> Tuple["np.ndarray", List["np.ndarray"]]:
+        """
+        Valida N tableros completos.
+
+        Args:
+            tableros: Arreglo de enteros de forma (N, filas, columnas); las
+                casillas vacías valen 0
+
+        Returns:
+            Tuple: (veredictos, runs_fallidas) donde veredictos es un arreglo
+            booleano de forma (N,) y runs_fallidas[i] contiene los ids de las
+            corridas que fallan en el tablero i
+        """
+        tableros = np.asarray(tableros, dtype=np.int32)
+        if tableros.ndim != 3:
+            raise ValueError("Se esperaba un arreglo de forma (N, filas, columnas)")
+        if self.indice.total_celdas and (
+            self.filas.max() >= tableros.shape[1] or self.columnas.max() >= tableros.shape[2]
+        ):
+            raise ValueError("Los tableros son más pequeños que la partida")
+
+        estado = self.estado_runs(tableros)
+        return estado["veredictos"], [np.flatnonzero(~fila) for fila in estado["runs_correctas"]]
+
+    def estado_runs(self, tableros) -> Dict[str, "np.ndarray"]:
+        """
+        Calcula el estado de cada corrida de cada tablero.
+
+        Returns:
+            Dict con "sumas" (N, R), "repetidos" (N, R), "llenas" (N, R),
+            "runs_correctas" (N, R) y "veredictos" (N,)
+        """
+        valores = np.asarray(tableros, dtype=np.int32)[:, self.filas, self.columnas]  # (N, C)
+        en_rango = (valores >= 1) & (valores <= 9)
+        valores = np.where(en_rango, valores, 0)
+
+        transpuesta = self.membresia.T
+        sumas = valores @ transpuesta  # (N, R)
+        llenas = en_rango.astype(np.int32) @ transpuesta
+
+        # Conteo de cada dígito por corrida: (N, C, 10) x (C, R) -> (N, R, 10)
+        uno_caliente = (valores[:, :, None] == np.arange(10, dtype=np.int32)).astype(np.int32)
+        conteos = np.einsum("ncd,rc->nrd", uno_caliente, self.membresia)
+        repetidos = (conteos[:, :, 1:] > 1).any(axis=2)
+
+        runs_correctas = (sumas == self.objetivos) & (llenas == self.largos) & ~repetidos
+        return {
+            "sumas": sumas,
+            "repetidos": repetidos,
+            "llenas": llenas,
+            "runs_correctas": runs_correctas,
+            "veredictos": runs_correctas.all(axis=1),
+        }
+
+
+def tableros_a_arreglo(tableros: List[List[List[Optional[int]]]]) -> "np.ndarray":
+    """
+    Convierte una lista de matrices estilo estado_tablero (con None) en un
+    arreglo de enteros de forma (N, filas, columnas).
+    """
+    if np is None:
+        raise ImportError("La validación por lotes requiere NumPy (pip install numpy)")
+    return np.array(
+        [[[v if isinstance(v, int) else 0 for v in fila] for fila in tablero] for tablero in tableros],
+        dtype=np.int32,
+    )
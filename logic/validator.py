@@ -3,15 +3,28 @@ Validación de jugadas según las reglas del Kakuro
 Verifica que las jugadas cumplan con las restricciones del juego
 """
 
+from .combinaciones import SUMA_MAXIMA, combinaciones, digitos
+from .solver import KakuroSolver
+
 
 class KakuroValidator:
     def __init__(self):
-        self.max_sum = 45  # Suma máxima posible con números 1-9
+        self.max_sum = SUMA_MAXIMA  # Suma máxima posible con números 1-9
     
     def validate_cell_value(self, value):
         """Valida que el valor de una celda sea válido"""
         return isinstance(value, int) and 1 <= value <= 9
     
+    def validate_position(self, row, col, rows, cols):
+        """Valida que una posición (base 0) esté dentro de un tablero de rows x cols"""
+        return 0 <= row < rows and 0 <= col < cols
+
+    def validate_board_shape(self, board, rows, cols):
+        """Valida que una matriz estilo estado_tablero tenga rows filas de cols valores"""
+        if not isinstance(board, list) or len(board) != rows:
+            return False
+        return all(isinstance(fila, list) and len(fila) == cols for fila in board)
+
     def validate_row_sum(self, row_values, target_sum):
         """Valida que la suma de una fila sea correcta"""
         if not row_values or target_sum is None:
@@ -26,12 +39,70 @@ class KakuroValidator:
         
         # Verificar que la suma no excede el objetivo
         current_sum = sum(valid_values)
-        return current_sum <= target_sum
+        if current_sum > target_sum:
+            return False
+        
+        # Verificar que las casillas vacías aún se pueden completar
+        resumen = self._resumen_corrida(row_values, target_sum)
+        if resumen is None:
+            return False
+        usado, vacias, restante = resumen
+        if vacias == 0:
+            return restante == 0
+        return any(not combo & usado for combo in combinaciones(restante, vacias))
     
     def validate_column_sum(self, col_values, target_sum):
         """Valida que la suma de una columna sea correcta"""
         return self.validate_row_sum(col_values, target_sum)
     
+    def valid_digits(self, values, target_sum):
+        """Devuelve los dígitos que aún pueden colocarse en las casillas vacías de una corrida"""
+        resumen = self._resumen_corrida(values, target_sum)
+        if resumen is None:
+            return []
+        usado, vacias, restante = resumen
+        permitido = 0
+        for combo in combinaciones(restante, vacias):
+            if not combo & usado:
+                permitido |= combo
+        return digitos(permitido)
+    
+    def _resumen_corrida(self, values, target_sum):
+        """Devuelve (máscara usada, casillas vacías, suma restante) o None si hay valores inválidos"""
+        usado = 0
+        vacias = 0
+        restante = target_sum
+        for v in values:
+            if v is None or v == 0:
+                vacias += 1
+            elif self.validate_cell_value(v):
+                usado |= 1 << v
+                restante -= v
+            else:
+                return None
+        return usado, vacias, restante
+    
+    def solve(self, claves):
+        """Resuelve la partida descrita por sus claves (ver KakuroSolver.solve)"""
+        return KakuroSolver(claves).solve()
+    
+    def validate_batch(self, claves, boards):
+        """
+        Valida N tableros de la misma partida en forma vectorizada (requiere NumPy).
+        
+        Args:
+            claves: Claves de la partida
+            boards: Arreglo (N, filas, columnas) o lista de matrices estilo estado_tablero
+        
+        Returns:
+            Tuple: (veredicto por tablero, ids de corridas fallidas por tablero)
+        """
+        from .validador_lote import ValidadorLote, tableros_a_arreglo
+        
+        if isinstance(boards, list):
+            boards = tableros_a_arreglo(boards)
+        return ValidadorLote(claves).validar(boards)
+    
     def is_complete_solution(self, board, row_sums, col_sums):
         """Verifica si la solución está completa y es correcta"""
         # TODO: Implementar validación completa
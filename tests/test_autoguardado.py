@@ -0,0 +1,157 @@
+"""
+Pruebas para el autoguardado en segundo plano
+Test unitarios para logic.autoguardado
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.autoguardado import Autoguardado
+
+
+class EscritorLento:
+    """Escritor que se queda bloqueado en la primera escritura hasta que se libera."""
+
+    def __init__(self):
+        self.escritos = []
+        self.hilos = set()
+        self.empezo = threading.Event()
+        self.liberar = threading.Event()
+
+    def __call__(self, datos):
+        self.hilos.add(threading.current_thread().name)
+        self.empezo.set()
+        self.liberar.wait(5)
+        self.escritos.append(datos)
+
+
+class TestAutoguardado(unittest.TestCase):
+    def test_une_escrituras_pendientes(self):
+        """Prueba que las instantáneas que llegan durante una escritura se unen en una sola"""
+        escritor = EscritorLento()
+        autoguardado = Autoguardado(escritor)
+        try:
+            autoguardado.guardar({"version": 1})
+            self.assertTrue(escritor.empezo.wait(5))
+
+            # Llegan tres instantáneas mientras se escribe la primera
+            for version in (2, 3, 4):
+                autoguardado.guardar({"version": version})
+            escritor.liberar.set()
+            self.assertTrue(autoguardado.esperar(5))
+
+            self.assertEqual(escritor.escritos, [{"version": 1}, {"version": 4}])
+            self.assertEqual(autoguardado.escritas, 2)
+            self.assertEqual(autoguardado.descartadas, 2)
+            self.assertEqual(escritor.hilos, {"autoguardado"})
+        finally:
+            escritor.liberar.set()
+            autoguardado.detener()
+
+    def test_frecuencia_por_jugadas(self):
+        """Prueba que se pide una instantánea cada cada_jugadas jugadas"""
+        autoguardado = Autoguardado(lambda datos: None, intervalo=3600, cada_jugadas=3)
+        self.assertEqual([autoguardado.registrar_jugada() for _ in range(3)], [False, False, True])
+        self.assertFalse(autoguardado.vencido())
+
+    def test_frecuencia_por_tiempo(self):
+        """Prueba que el intervalo solo vence si hay jugadas sin guardar"""
+        autoguardado = Autoguardado(lambda datos: None, intervalo=0, cada_jugadas=100)
+        self.assertFalse(autoguardado.vencido())
+        self.assertTrue(autoguardado.registrar_jugada())
+        autoguardado.guardar({})
+        try:
+            self.assertFalse(autoguardado.vencido())
+        finally:
+            autoguardado.detener()
+
+    def test_error_no_detiene_el_hilo(self):
+        """Prueba que un error al escribir no detiene las escrituras siguientes"""
+        escritos = []
+
+        def escribir(datos):
+            if datos["falla"]:
+                raise OSError("disco lleno")
+            escritos.append(datos)
+
+        autoguardado = Autoguardado(escribir)
+        try:
+            autoguardado.guardar({"falla": True})
+            self.assertTrue(autoguardado.esperar(5))
+            autoguardado.guardar({"falla": False})
+            self.assertTrue(autoguardado.esperar(5))
+        finally:
+            autoguardado.detener()
+        self.assertEqual(escritos, [{"falla": False}])
+        self.assertEqual(autoguardado.escritas, 1)
+
+    def test_resultado_de_cada_instantanea(self):
+        """Prueba que resultado() informa cuándo quedó escrita cada instantánea y si falló"""
+        escritor = EscritorLento()
+        autoguardado = Autoguardado(escritor)
+        try:
+            primera = autoguardado.guardar({"version": 1})
+            self.assertTrue(escritor.empezo.wait(5))
+            segunda = autoguardado.guardar({"version": 2})
+            tercera = autoguardado.guardar({"version": 3})
+            self.assertIsNone(autoguardado.resultado(primera))
+
+            escritor.liberar.set()
+            self.assertTrue(autoguardado.esperar(5))
+            # La segunda se descartó, pero la tercera la incluye
+            for numero in (primera, segunda, tercera):
+                self.assertEqual(autoguardado.resultado(numero), (True, None))
+        finally:
+            escritor.liberar.set()
+            autoguardado.detener()
+
+    def test_resultado_con_error(self):
+        """Prueba que resultado() devuelve el error de la escritura fallida"""
+        error = OSError("disco lleno")
+
+        def escribir(datos):
+            raise error
+
+        autoguardado = Autoguardado(escribir)
+        try:
+            numero = autoguardado.guardar({})
+            self.assertTrue(autoguardado.esperar(5))
+            self.assertEqual(autoguardado.resultado(numero), (False, error))
+        finally:
+            autoguardado.detener()
+
+    def test_resultado_no_cambia_con_escrituras_posteriores(self):
+        """Prueba que el resultado de una instantánea es el de su escritura y no el de la última"""
+        def escribir(datos):
+            if datos["falla"]:
+                raise OSError("disco lleno")
+
+        autoguardado = Autoguardado(escribir)
+        try:
+            numeros = []
+            for falla in (False, True, False):
+                numeros.append(autoguardado.guardar({"falla": falla}))
+                self.assertTrue(autoguardado.esperar(5))
+        finally:
+            autoguardado.detener()
+        self.assertEqual([autoguardado.resultado(numero)[0] for numero in numeros], [True, False, True])
+
+    def test_detener_escribe_pendiente(self):
+        """Prueba que detener escribe la última instantánea antes de terminar"""
+        escritor = EscritorLento()
+        autoguardado = Autoguardado(escritor)
+        autoguardado.guardar({"version": 1})
+        self.assertTrue(escritor.empezo.wait(5))
+        autoguardado.guardar({"version": 2})
+        escritor.liberar.set()
+        autoguardado.detener()
+        self.assertEqual(escritor.escritos, [{"version": 1}, {"version": 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Pruebas para el tablero compacto
+Test unitarios para Board
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.board import Board
+from logic.indice_partida import IndicePartida
+from tests.test_solver import SOLUCION_6X6, claves_de
+
+
+class TestBoard(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial para cada prueba"""
+        self.indice = IndicePartida(claves_de(SOLUCION_6X6))
+        self.board = Board.from_indice(self.indice)
+    
+    def test_dimensiones(self):
+        """Prueba que el tablero toma las dimensiones de la partida"""
+        self.assertEqual((self.board.filas, self.board.columnas), (6, 6))
+        self.assertEqual(len(self.board.celdas), 36)
+    
+    def test_slots(self):
+        """Prueba que Board no tiene diccionario de atributos"""
+        self.assertFalse(hasattr(self.board, "__dict__"))
+    
+    def test_set_get_y_mascaras(self):
+        """Prueba que las máscaras por corrida siguen las jugadas"""
+        horizontal, vertical = self.indice.runs_de(2, 1)
+        self.board.set(2, 1, 8)
+        self.board.set(2, 2, 9)
+        self.assertEqual(self.board.get(2, 1), 8)
+        self.assertEqual(self.board.mascara_run(horizontal), (1 << 8) | (1 << 9))
+        self.assertEqual(self.board.mascara_run(vertical), 1 << 8)
+        
+        self.assertEqual(self.board.set(2, 1, None), 8)
+        self.assertIsNone(self.board.get(2, 1))
+        self.assertEqual(self.board.mascara_run(horizontal), 1 << 9)
+    
+    def test_mascara_con_repetidos(self):
+        """Prueba que borrar un dígito repetido no lo quita de la máscara"""
+        horizontal, _ = self.indice.runs_de(2, 1)
+        self.board.set(2, 1, 4)
+        self.board.set(2, 2, 4)
+        self.board.set(2, 1, None)
+        self.assertEqual(self.board.mascara_run(horizontal), 1 << 4)
+    
+    def test_copy_independiente(self):
+        """Prueba que la copia no comparte casillas ni máscaras"""
+        self.board.set(1, 1, 9)
+        copia = self.board.copy()
+        copia.set(1, 1, 3)
+        self.assertEqual(self.board.get(1, 1), 9)
+        self.assertEqual(copia.get(1, 1), 3)
+        self.assertNotEqual(self.board.mascaras_runs, copia.mascaras_runs)
+    
+    def test_matriz_y_bytes(self):
+        """Prueba la conversión a matriz estilo estado_tablero y a bytes"""
+        matriz = [[v if isinstance(v, int) else None for v in fila] for fila in SOLUCION_6X6]
+        board = Board.from_matrix(matriz, self.indice)
+        self.assertEqual(board.to_matrix(), matriz)
+        
+        self.board.load_bytes(board.to_bytes())
+        self.assertEqual(self.board, board)
+        self.assertEqual(list(self.board.mascaras_runs), list(board.mascaras_runs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Pruebas para las bolsas persistentes de partidas
+Test unitarios para logic.bolsa_partidas
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.bolsa_partidas import BolsaPartidas
+
+
+@contextmanager
+def bloqueo_ocupado(ruta):
+    raise TimeoutError(f"No se pudo bloquear {ruta}")
+    yield
+
+
+class TestBolsaPartidas(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directorio = os.path.join(self.tmpdir.name, "bolsas")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_sin_repetir_hasta_vaciar(self):
+        """Prueba que cada posición sale una vez por bolsa"""
+        bolsa = BolsaPartidas(self.directorio)
+        posiciones = [bolsa.sacar("FÁCIL", 10, "a") for _ in range(10)]
+        self.assertEqual(sorted(posiciones), list(range(10)))
+        self.assertEqual(bolsa.restantes("FÁCIL"), 0)
+        
+        # Al vaciarse se rellena sin empezar por la última partida jugada
+        self.assertNotEqual(bolsa.sacar("FÁCIL", 10, "a"), posiciones[-1])
+        self.assertEqual(bolsa.restantes("FÁCIL"), 9)
+    
+    def test_bloqueo_ocupado(self):
+        """Prueba que sacar y vaciar siguen funcionando si el bloqueo no se obtiene"""
+        bolsa = BolsaPartidas(self.directorio)
+        bolsa.sacar("FÁCIL", 10, "a")
+        with mock.patch("logic.bolsa_partidas.bloqueo_archivo", bloqueo_ocupado):
+            self.assertIsNotNone(bolsa.sacar("FÁCIL", 10, "a"))
+            bolsa.vaciar("FÁCIL")
+        self.assertEqual(bolsa.restantes("FÁCIL"), 0)
+    
+    def test_estado_sin_guardar(self):
+        """Prueba que si el cursor no se puede guardar el sorteo falla sin avanzar"""
+        bolsa = BolsaPartidas(self.directorio)
+        primeras = [bolsa.sacar("FÁCIL", 10, "a") for _ in range(3)]
+        
+        with mock.patch("logic.bolsa_partidas.escribir_json_atomico", side_effect=OSError("disco lleno")):
+            with self.assertRaises(OSError):
+                bolsa.sacar("FÁCIL", 10, "a")
+            with self.assertRaises(OSError):
+                BolsaPartidas(os.path.join(self.tmpdir.name, "otra")).sacar("FÁCIL", 10, "a")
+        self.assertEqual(bolsa.restantes("FÁCIL"), 7)
+        
+        # Tras un reinicio la bolsa sigue donde quedó en disco
+        resto = [BolsaPartidas(self.directorio).sacar("FÁCIL", 10, "a") for _ in range(7)]
+        self.assertEqual(sorted(primeras + resto), list(range(10)))
+    
+    def test_persiste_entre_instancias(self):
+        """Prueba que un reinicio o un segundo jugador continúan la misma bolsa"""
+        primera = BolsaPartidas(self.directorio)
+        segunda = BolsaPartidas(self.directorio)
+        posiciones = []
+        for i in range(8):
+            posiciones.append((primera if i % 2 else segunda).sacar("MEDIO", 8, "a"))
+        self.assertEqual(sorted(posiciones), list(range(8)))
+        
+        reiniciada = BolsaPartidas(self.directorio)
+        self.assertEqual(reiniciada.restantes("MEDIO"), 0)
+    
+    def test_niveles_independientes(self):
+        """Prueba que cada nivel tiene su propia bolsa"""
+        bolsa = BolsaPartidas(self.directorio)
+        bolsa.sacar("FÁCIL", 3, "a")
+        bolsa.sacar("DIFÍCIL", 5, "b")
+        self.assertEqual(bolsa.restantes("FÁCIL"), 2)
+        self.assertEqual(bolsa.restantes("DIFÍCIL"), 4)
+        
+        bolsa.vaciar("FÁCIL")
+        self.assertEqual(bolsa.restantes("FÁCIL"), 0)
+        self.assertEqual(bolsa.restantes("DIFÍCIL"), 4)
+    
+    def test_catalogo_cambiado(self):
+        """Prueba que otra firma u otra cantidad rellena la bolsa"""
+        bolsa = BolsaPartidas(self.directorio)
+        for _ in range(3):
+            bolsa.sacar("EXPERTO", 4, "a")
+        
+        bolsa.sacar("EXPERTO", 4, "b")
+        self.assertEqual(bolsa.restantes("EXPERTO"), 3)
+        bolsa.sacar("EXPERTO", 6, "b")
+        self.assertEqual(bolsa.restantes("EXPERTO"), 5)
+        self.assertIsNone(bolsa.sacar("EXPERTO", 0, "b"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Pruebas para el calificador de dificultad
+Test unitarios para logic.calificador
+"""
+
+import os
+import sys
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.calificador import CalificadorDificultad, calificar_partida, nivel_por_puntaje
+from logic.solver import KakuroSolver
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, SOLUCION_AMBIGUA, claves_de, partida_desde_solucion
+
+
+class TestCalificador(unittest.TestCase):
+    def test_partida_sencilla(self):
+        """Prueba que una partida pequeña se resuelve sin búsqueda y es FÁCIL"""
+        resultado = CalificadorDificultad(claves_de(SOLUCION_3X3)).calificar()
+        self.assertTrue(resultado["resuelta"])
+        self.assertEqual(resultado["retrocesos"], 0)
+        self.assertEqual(resultado["nodos"], 0)
+        self.assertGreater(resultado["tecnicas"]["suma_de_corrida"], 0)
+        self.assertEqual(resultado["nivel"], "FÁCIL")
+    
+    def test_busqueda_cuenta_ramificaciones(self):
+        """Prueba que sin deducción posible se registra la ramificación"""
+        sencilla = CalificadorDificultad(claves_de(SOLUCION_3X3)).calificar()
+        ambigua = CalificadorDificultad(claves_de(SOLUCION_AMBIGUA)).calificar()
+        self.assertTrue(ambigua["resuelta"])
+        self.assertGreaterEqual(ambigua["nodos"], 1)
+        self.assertEqual(ambigua["ramificacion_maxima"], 2)
+        self.assertGreater(ambigua["puntaje"], sencilla["puntaje"])
+    
+    def test_calificar_partida(self):
+        """Prueba la calificación de una partida en formato de archivo"""
+        resultado = calificar_partida(dict(partida_desde_solucion(SOLUCION_6X6, "experto"), id="p1"))
+        self.assertEqual(resultado["id"], "p1")
+        self.assertEqual(resultado["dificultad_original"], "experto")
+        self.assertTrue(resultado["resuelta"])
+        self.assertIn(resultado["dificultad"], ("facil", "normal", "dificil", "experto"))
+    
+    def test_partida_contradictoria(self):
+        """Prueba que una partida sin solución no se marca como resuelta"""
+        claves = claves_de(SOLUCION_3X3)
+        claves[0] = dict(claves[0], clave=40)
+        self.assertFalse(CalificadorDificultad(claves).calificar()["resuelta"])
+    
+    def test_partida_sobrerrestringida(self):
+        """Prueba que un 2x2 con filas 3/3 y columnas 4/4 (sin solución) no se marca como resuelto"""
+        claves = [
+            dict(clave, clave=4) if clave["tipo_de_clave"] == "C" and clave["casillas"] > 0 else clave
+            for clave in claves_de(SOLUCION_AMBIGUA)
+        ]
+        self.assertEqual(KakuroSolver(claves).count_solutions(), 0)
+        self.assertFalse(CalificadorDificultad(claves).calificar()["resuelta"])
+    
+    def test_niveles_por_puntaje(self):
+        """Prueba los umbrales de nivel"""
+        self.assertEqual(nivel_por_puntaje(0), "FÁCIL")
+        self.assertEqual(nivel_por_puntaje(85), "MEDIO")
+        self.assertEqual(nivel_por_puntaje(120), "DIFÍCIL")
+        self.assertEqual(nivel_por_puntaje(500), "EXPERTO")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Pruebas para la tabla de combinaciones
+Test unitarios para logic.combinaciones
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.combinaciones import TABLA_COMBINACIONES, combinaciones, mascara_permitida, digitos
+
+
+class TestCombinaciones(unittest.TestCase):
+    def test_tabla_cubre_todas_las_sumas(self):
+        """Prueba que la tabla tiene una entrada por cada (suma, casillas)"""
+        self.assertEqual(len(TABLA_COMBINACIONES), 46 * 10)
+    
+    def test_combinacion_unica(self):
+        """Prueba sumas con una sola combinación posible"""
+        self.assertEqual([digitos(c) for c in combinaciones(3, 2)], [[1, 2]])
+        self.assertEqual([digitos(c) for c in combinaciones(24, 3)], [[7, 8, 9]])
+        self.assertEqual([digitos(c) for c in combinaciones(45, 9)], [list(range(1, 10))])
+    
+    def test_mascara_permitida(self):
+        """Prueba la unión de dígitos permitidos"""
+        self.assertEqual(digitos(mascara_permitida(10, 2)), [1, 2, 3, 4, 6, 7, 8, 9])
+        self.assertEqual(mascara_permitida(2, 2), 0)
+    
+    def test_fuera_de_rango(self):
+        """Prueba consultas fuera de la tabla"""
+        self.assertEqual(combinaciones(50, 2), ())
+        self.assertEqual(mascara_permitida(-1, 3), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Pruebas para el diario de jugadas
+Test unitarios para logic.diario_jugadas
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.diario_jugadas import DiarioJugadas, reproducir
+
+
+def jugada(fila, columna, anterior, nuevo):
+    return {"fila": fila, "columna": columna, "valor_anterior": anterior, "valor_nuevo": nuevo}
+
+
+class TestDiarioJugadas(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.tmpdir.name, "data", "guardado.diario")
+        self.diario = DiarioJugadas(self.ruta)
+
+    def tearDown(self):
+        self.diario.cerrar()
+        self.tmpdir.cleanup()
+
+    def test_reproducir_jugadas_deshacer_rehacer(self):
+        """Prueba que el diario reproduce el tablero y ambos historiales"""
+        self.diario.registrar("jugada", jugada(0, 0, None, 5))
+        self.diario.registrar("jugada", jugada(0, 1, None, 3))
+        self.diario.registrar("deshacer", jugada(0, 1, None, 3))
+        self.diario.registrar("borrar", jugada(0, 0, 5, None))
+        self.diario.registrar("deshacer", jugada(0, 0, 5, None))
+        self.diario.registrar("rehacer", jugada(0, 0, 5, None))
+        self.diario.registrar("deshacer", jugada(0, 0, 5, None))
+        self.diario.cerrar()
+
+        tablero = [[None, None], [None, None]]
+        jugadas, rehacer = [], []
+        eventos = DiarioJugadas(self.ruta).leer()
+        self.assertEqual(reproducir(eventos, tablero, jugadas, rehacer), 7)
+
+        self.assertEqual(tablero, [[5, None], [None, None]])
+        self.assertEqual(jugadas, [jugada(0, 0, None, 5)])
+        self.assertEqual(rehacer, [jugada(0, 0, 5, None)])
+
+    def test_compactar_no_repite_jugadas(self):
+        """Prueba que las jugadas anteriores a la instantánea no se reproducen"""
+        self.diario.registrar("jugada", jugada(0, 0, None, 5))
+        self.diario.registrar("jugada", jugada(0, 1, None, 3))
+        hasta = self.diario.ultimo
+
+        # Cierre entre escribir la instantánea y vaciar el diario
+        self.assertEqual(DiarioJugadas(self.ruta).leer(desde=hasta), [])
+
+        self.diario.vaciar()
+        self.diario.registrar("jugada", jugada(1, 0, None, 9))
+        self.diario.cerrar()
+
+        recuperado = DiarioJugadas(self.ruta)
+        eventos = recuperado.leer(desde=hasta)
+        self.assertEqual([evento["n"] for evento in eventos], [hasta + 1])
+        # La numeración continúa detrás de lo recuperado
+        self.assertEqual(recuperado.registrar("jugada", jugada(1, 1, None, 1)), hasta + 2)
+        recuperado.cerrar()
+
+    def test_compactar_conserva_jugadas_nuevas(self):
+        """Prueba que compactar conserva las jugadas anexadas mientras se escribía la instantánea"""
+        self.diario.registrar("jugada", jugada(0, 0, None, 5))
+        hasta = self.diario.ultimo
+        self.diario.registrar("jugada", jugada(0, 1, None, 3))
+
+        self.diario.vaciar(hasta=hasta)
+        self.assertEqual(self.diario.pendientes, 1)
+        self.diario.registrar("jugada", jugada(1, 0, None, 9))
+        self.diario.cerrar()
+
+        eventos = DiarioJugadas(self.ruta).leer(desde=hasta)
+        self.assertEqual([evento["valor_nuevo"] for evento in eventos], [3, 9])
+
+    def test_linea_incompleta(self):
+        """Prueba que se descarta una línea cortada al final del diario"""
+        self.diario.registrar("jugada", jugada(0, 0, None, 5))
+        self.diario.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.write('{"n": 2, "evento": "jug')
+
+        eventos = DiarioJugadas(self.ruta).leer()
+        self.assertEqual(len(eventos), 1)
+        self.assertEqual(eventos[0]["valor_nuevo"], 5)
+
+    def test_jugadas_despues_de_una_linea_cortada(self):
+        """Prueba que las jugadas anexadas tras recuperar un diario cortado sobreviven a otro cierre"""
+        for columna in range(3):
+            self.diario.registrar("jugada", jugada(0, columna, None, columna + 1))
+        self.diario.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.write('{"n": 4, "evento": "jug')
+        
+        recuperado = DiarioJugadas(self.ruta)
+        self.assertEqual(len(recuperado.leer()), 3)
+        for columna in range(3):
+            recuperado.registrar("jugada", jugada(1, columna, None, columna + 4))
+        recuperado.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as f:
+            f.write('{"n": 7')
+        
+        eventos = DiarioJugadas(self.ruta).leer()
+        self.assertEqual([evento["n"] for evento in eventos], [1, 2, 3, 4, 5, 6])
+    
+    def test_compactar_fallido_conserva_el_diario(self):
+        """Prueba que si la compactación falla el diario anterior queda completo"""
+        for columna in range(3):
+            self.diario.registrar("jugada", jugada(0, columna, None, columna + 1))
+        with mock.patch("logic.diario_jugadas.os.replace", side_effect=OSError("disco lleno")):
+            with self.assertRaises(OSError):
+                self.diario.vaciar(hasta=1)
+        self.assertEqual(len(DiarioJugadas(self.ruta).leer()), 3)
+        
+        self.diario.vaciar(hasta=1)
+        self.assertEqual([evento["n"] for evento in DiarioJugadas(self.ruta).leer()], [2, 3])
+        self.assertEqual(os.listdir(os.path.dirname(self.ruta)), ["guardado.diario"])
+    
+    def test_registrar_durante_la_compactacion(self):
+        """Prueba que registrar no espera a la compactación y sus jugadas se conservan"""
+        for columna in range(3):
+            self.diario.registrar("jugada", jugada(0, columna, None, columna + 1))
+        
+        leer_todo = self.diario._leer_todo
+        
+        def registrar_mientras_se_lee():
+            # Con el bloqueo tomado durante la lectura, esto se quedaría esperando
+            hilo = threading.Thread(target=self.diario.registrar, args=("jugada", jugada(1, 0, None, 9)))
+            hilo.start()
+            hilo.join(5)
+            self.assertFalse(hilo.is_alive())
+            return leer_todo()
+        
+        with mock.patch.object(self.diario, "_leer_todo", registrar_mientras_se_lee):
+            self.diario.vaciar(hasta=2)
+        self.assertEqual(self.diario.pendientes, 2)
+        self.diario.registrar("jugada", jugada(1, 1, None, 8))
+        self.diario.cerrar()
+        
+        eventos = DiarioJugadas(self.ruta).leer()
+        self.assertEqual([evento["n"] for evento in eventos], [3, 4, 5])
+    
+    def test_evento_invalido(self):
+        """Prueba que un evento desconocido no se registra"""
+        with self.assertRaises(ValueError):
+            self.diario.registrar("mover", jugada(0, 0, None, 5))
+        self.assertEqual(self.diario.ultimo, 0)
+
+    def test_fuera_del_tablero(self):
+        """Prueba que se ignoran jugadas fuera de las dimensiones del tablero"""
+        tablero = [[None]]
+        eventos = [{"n": 1, "evento": "jugada", **jugada(3, 3, None, 4)}]
+        self.assertEqual(reproducir(eventos, tablero, [], []), 0)
+        self.assertEqual(tablero, [[None]])
+
+
+if __name__ == '__main__':
+    unittest.main()
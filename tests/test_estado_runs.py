@@ -0,0 +1,86 @@
+"""
+Pruebas para el seguimiento incremental de corridas
+Test unitarios para EstadoRuns
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.estado_runs import EstadoRuns
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, claves_de
+
+
+class TestEstadoRuns(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial para cada prueba"""
+        self.estado = EstadoRuns(claves_de(SOLUCION_3X3))
+    
+    def llenar(self, solucion):
+        for fila, valores in enumerate(solucion):
+            for columna, valor in enumerate(valores):
+                if isinstance(valor, int):
+                    self.estado.colocar(fila, columna, valor)
+    
+    def test_completa_con_solucion(self):
+        """Prueba que el tablero se detecta completo al colocar la solución"""
+        self.assertFalse(self.estado.completa())
+        self.llenar(SOLUCION_3X3)
+        self.assertTrue(self.estado.completa())
+    
+    def test_valor_incorrecto(self):
+        """Prueba que un valor incorrecto impide la victoria"""
+        self.llenar(SOLUCION_3X3)
+        self.estado.colocar(2, 2, 5)
+        self.assertFalse(self.estado.completa())
+        self.estado.colocar(2, 2, 4)
+        self.assertTrue(self.estado.completa())
+    
+    def test_repetidos(self):
+        """Prueba que los dígitos repetidos se cuentan y se descuentan"""
+        estado = EstadoRuns(claves_de(SOLUCION_6X6))
+        estado.colocar(2, 1, 8)
+        estado.colocar(2, 2, 8)
+        run_id = estado.indice.runs_de(2, 1)[0]
+        self.assertEqual(estado.repetidos[run_id], 1)
+        estado.colocar(2, 2, None)
+        self.assertEqual(estado.repetidos[run_id], 0)
+        self.assertEqual(estado.usados[run_id], 1 << 8)
+        self.assertEqual(estado.sumas[run_id], 8)
+    
+    def test_conflictos(self):
+        """Prueba que solo se reportan las corridas de la casilla con conflicto"""
+        self.estado.colocar(1, 1, 1)
+        self.assertEqual(self.estado.conflictos(1, 1), [])
+        self.estado.colocar(1, 2, 5)
+        horizontal, _ = self.estado.indice.runs_de(1, 2)
+        self.assertEqual(self.estado.conflictos(1, 2), [horizontal])
+    
+    def test_deshacer_rehacer(self):
+        """Prueba que deshacer y rehacer mantienen el estado consistente"""
+        historial = []
+        for fila, columna, valor in [(1, 1, 1), (1, 2, 3), (2, 1, 2), (2, 2, 4)]:
+            historial.append((fila, columna, self.estado.valores.get((fila, columna)), valor))
+            self.estado.colocar(fila, columna, valor)
+        self.assertTrue(self.estado.completa())
+        
+        fila, columna, anterior, nuevo = historial[-1]
+        self.estado.colocar(fila, columna, anterior)
+        self.assertFalse(self.estado.completa())
+        self.assertEqual(self.estado.total_correctas, 2)
+        
+        self.estado.colocar(fila, columna, nuevo)
+        self.assertTrue(self.estado.completa())
+    
+    def test_cargar_tablero(self):
+        """Prueba la sincronización desde una matriz completa"""
+        tablero = [[v if isinstance(v, int) else None for v in fila] for fila in SOLUCION_3X3]
+        self.estado.cargar_tablero(tablero)
+        self.assertTrue(self.estado.completa())
+
+
+if __name__ == '__main__':
+    unittest.main()
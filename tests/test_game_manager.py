@@ -0,0 +1,89 @@
+"""
+Pruebas para el motor de juego sin interfaz
+Test unitarios para GameManager
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.game_manager import GameManager
+from tests.test_solver import SOLUCION_3X3, claves_de
+
+
+class TestGameManager(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial para cada prueba"""
+        self.manager = GameManager()
+        partida = {"nivel_de_dificultad": "FÁCIL", "partida": 1, "claves": claves_de(SOLUCION_3X3)}
+        self.assertTrue(self.manager.start_new_game("FÁCIL", partida))
+    
+    def jugar_solucion(self):
+        for fila, valores in enumerate(SOLUCION_3X3):
+            for columna, valor in enumerate(valores):
+                if isinstance(valor, int):
+                    self.assertTrue(self.manager.make_move(fila, columna, valor))
+    
+    def test_tablero_compacto(self):
+        """Prueba que el tablero guarda un byte por casilla"""
+        self.assertEqual(len(self.manager.current_board.celdas), 9)
+        self.manager.make_move(1, 2, 3)
+        self.assertEqual(self.manager.get_value(1, 2), 3)
+        self.assertIsNone(self.manager.get_value(1, 1))
+    
+    def test_tablero_grande(self):
+        """Prueba que el tablero toma las dimensiones de la partida y no un 9x9 fijo"""
+        claves = [
+            {"tipo_de_clave": "F", "fila": 15, "columna": 12, "clave": 36, "casillas": 8},
+            {"tipo_de_clave": "C", "fila": 11, "columna": 20, "clave": 10, "casillas": 4},
+        ]
+        partida = {"nivel_de_dificultad": "EXPERTO", "partida": 1,
+                   "tamaño": {"filas": 15, "columnas": 20}, "claves": claves}
+        self.assertTrue(self.manager.start_new_game("EXPERTO", partida))
+        self.assertEqual((self.manager.filas, self.manager.columnas), (15, 20))
+        self.assertEqual(len(self.manager.current_board.celdas), 300)
+        self.assertTrue(self.manager.make_move(14, 19, 8))
+        self.assertEqual(self.manager.get_value(14, 19), 8)
+    
+    def test_snapshot(self):
+        """Prueba que la instantánea no cambia con jugadas posteriores"""
+        self.manager.make_move(1, 1, 1)
+        copia = self.manager.snapshot()
+        self.manager.make_move(1, 1, 2)
+        self.assertEqual(copia.get(1, 1), 1)
+        self.assertEqual(self.manager.get_value(1, 1), 2)
+    
+    def test_completar_partida(self):
+        """Prueba que la partida se marca completada con la solución"""
+        self.assertFalse(self.manager.is_game_complete())
+        self.jugar_solucion()
+        self.assertTrue(self.manager.is_game_complete())
+        self.assertEqual(self.manager.game_state, "completed")
+    
+    def test_jugada_en_casilla_no_blanca(self):
+        """Prueba que no se puede jugar sobre una clave"""
+        self.assertFalse(self.manager.make_move(0, 1, 5))
+    
+    def test_deshacer_rehacer(self):
+        """Prueba que deshacer y rehacer actualizan los contadores"""
+        self.jugar_solucion()
+        self.assertTrue(self.manager.undo_move())
+        self.assertEqual(self.manager.celdas_llenas, 3)
+        self.assertEqual(self.manager.game_state, "playing")
+        self.assertTrue(self.manager.redo_move())
+        self.assertTrue(self.manager.is_game_complete())
+    
+    def test_borrar_casilla(self):
+        """Prueba que borrar una casilla deshace la completitud"""
+        self.jugar_solucion()
+        self.manager.game_state = "playing"
+        self.assertTrue(self.manager.clear_cell(2, 2))
+        self.assertFalse(self.manager.is_game_complete())
+        self.assertEqual(self.manager.celdas_llenas, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Pruebas para el generador de partidas
+Test unitarios para logic.generador
+"""
+
+import os
+import sys
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.generador import _segmentos, generar_partida
+from logic.partida_loader import _convert_partida_format
+from logic.solver import verificar_partida
+
+
+class TestGenerador(unittest.TestCase):
+    def test_partida_unica_y_coherente(self):
+        """Prueba que la partida generada tiene solución única y coincide con su solución"""
+        partida = generar_partida("facil", semilla=7)
+        self.assertIsNotNone(partida)
+        
+        resultado = verificar_partida(partida)
+        self.assertTrue(resultado["unica"])
+        self.assertTrue(resultado["coincide_solucion"])
+        self.assertEqual(_convert_partida_format(partida)["nivel_de_dificultad"], "FÁCIL")
+    
+    def test_esquema_y_corridas(self):
+        """Prueba el esquema de salida y que toda corrida tiene entre 2 y 9 casillas"""
+        partida = generar_partida("normal", filas=6, columnas=6, semilla=3)
+        self.assertIsNotNone(partida)
+        self.assertEqual(partida["tamaño"], {"filas": 6, "columnas": 6})
+        self.assertEqual(partida["id"], "normal_g3")
+        for campo in ("tablero", "sumas_filas", "sumas_columnas", "solucion"):
+            self.assertEqual(len(partida[campo]), 6)
+            self.assertTrue(all(len(fila) == 6 for fila in partida[campo]))
+        
+        blancas = [[celda == "?" for celda in fila] for fila in partida["tablero"]]
+        for horizontal in (True, False):
+            for segmento in _segmentos(blancas, horizontal):
+                self.assertTrue(2 <= len(segmento) <= 9)
+                f, c = segmento[0]
+                clave = (f, c - 1) if horizontal else (f - 1, c)
+                self.assertEqual(partida["tablero"][clave[0]][clave[1]], "\\")
+    
+    def test_reproducible(self):
+        """Prueba que la misma semilla genera la misma partida"""
+        self.assertEqual(generar_partida("facil", semilla=11), generar_partida("facil", semilla=11))
+
+
+if __name__ == '__main__':
+    unittest.main()
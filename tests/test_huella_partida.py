@@ -0,0 +1,59 @@
+"""
+Pruebas para la huella canónica de partidas
+Test unitarios para logic.huella_partida
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.huella_partida import IndiceHuellas, huella_claves, huella_partida
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, claves_de, partida_desde_solucion
+
+
+def transpuesta(solucion):
+    return [list(fila) for fila in zip(*solucion)]
+
+
+class TestHuellaPartida(unittest.TestCase):
+    def test_invariante_a_la_transpuesta(self):
+        """Prueba que una partida y su transpuesta tienen la misma huella"""
+        self.assertEqual(huella_claves(claves_de(SOLUCION_6X6)),
+                         huella_claves(claves_de(transpuesta(SOLUCION_6X6))))
+        self.assertNotEqual(huella_claves(claves_de(SOLUCION_6X6)),
+                            huella_claves(claves_de(SOLUCION_3X3)))
+    
+    def test_formatos_de_partida(self):
+        """Prueba que da igual el formato del archivo, el convertido o el orden de las claves"""
+        claves = claves_de(SOLUCION_6X6)
+        self.assertEqual(huella_partida(partida_desde_solucion(SOLUCION_6X6)), huella_claves(claves))
+        self.assertEqual(huella_partida({"claves": list(reversed(claves))}), huella_claves(claves))
+        
+        # Las celdas negras (clave 0, casillas 0) no cambian la huella
+        negra = {"tipo_de_clave": "F", "fila": 1, "columna": 1, "clave": 0, "casillas": 0}
+        self.assertEqual(huella_claves(claves + [negra]), huella_claves(claves))
+    
+    def test_indice_en_disco(self):
+        """Prueba que el índice descarta repetidas y persiste solo lo guardado"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ruta = os.path.join(tmpdir, "huellas.idx")
+            huella = huella_claves(claves_de(SOLUCION_6X6))
+            
+            indice = IndiceHuellas(ruta)
+            self.assertTrue(indice.agregar(huella, "facil_001"))
+            self.assertFalse(indice.agregar(huella, "facil_002"))
+            self.assertFalse(IndiceHuellas(ruta).existe())  # aún pendiente
+            indice.guardar()
+            
+            releido = IndiceHuellas(ruta)
+            self.assertIn(huella, releido)
+            self.assertEqual(releido.buscar(huella), "facil_001")
+            self.assertEqual(len(releido), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Pruebas para el índice de casillas y corridas
+Test unitarios para IndicePartida
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.indice_partida import IndicePartida
+from tests.test_solver import SOLUCION_6X6, claves_de
+
+
+class TestIndicePartida(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial para cada prueba"""
+        self.indice = IndicePartida(claves_de(SOLUCION_6X6))
+    
+    def test_totales(self):
+        """Prueba el número de casillas blancas y corridas"""
+        blancas = sum(isinstance(v, int) for fila in SOLUCION_6X6 for v in fila)
+        self.assertEqual(self.indice.total_celdas, blancas)
+        self.assertEqual(self.indice.total_runs, 15)
+    
+    def test_runs_de_casilla(self):
+        """Prueba que cada casilla conoce su corrida horizontal y vertical"""
+        horizontal, vertical = self.indice.runs_de(2, 3)
+        self.assertEqual(self.indice.tipos_runs[horizontal], "F")
+        self.assertEqual(self.indice.tipos_runs[vertical], "C")
+        self.assertEqual(self.indice.celdas_de_run(horizontal), [(2, 1), (2, 2), (2, 3), (2, 4), (2, 5)])
+        self.assertEqual(self.indice.celdas_de_run(vertical), [(2, 3), (3, 3), (4, 3)])
+        self.assertEqual(self.indice.origenes_runs[vertical], (1, 3))
+    
+    def test_casilla_no_blanca(self):
+        """Prueba consultas sobre casillas negras o de clave"""
+        self.assertEqual(self.indice.runs_de(0, 0), (None, None))
+        self.assertFalse(self.indice.es_blanca(3, 1))
+        self.assertTrue(self.indice.es_blanca(5, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Pruebas para la lectura incremental de catálogos
+Test unitarios para logic.lector_partidas
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.lector_partidas import iterar_partidas, leer_partida
+from logic.partida_loader import indexar_partidas_por_nivel
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, partida_desde_solucion
+
+
+class TestLectorPartidas(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.partidas = [
+            dict(partida_desde_solucion(SOLUCION_3X3, "facil"), id="facil_001"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "normal"), id="normal_001"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "experto"), id="experto_001"),
+        ]
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def _escribir(self, nombre, texto):
+        ruta = os.path.join(self.tmpdir.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(texto)
+        return ruta
+    
+    def test_objeto_con_otras_claves(self):
+        """Prueba el formato {"partidas": [...]} con claves antes y después"""
+        datos = {"version": 12345, "autores": ["a", {"b": [1, 2]}], "partidas": self.partidas, "total": 3}
+        ruta = self._escribir("partidas.json", json.dumps(datos, ensure_ascii=False, indent=2))
+        
+        # Bloques diminutos para cortar tokens y números entre lecturas
+        for tam_bloque in (1, 7, 64, 1 << 16):
+            self.assertEqual(list(iterar_partidas(ruta, tam_bloque)), self.partidas)
+    
+    def test_lista_y_lista_vacia(self):
+        """Prueba el formato de lista simple"""
+        ruta = self._escribir("lista.json", json.dumps(self.partidas))
+        self.assertEqual(list(iterar_partidas(ruta, 5)), self.partidas)
+        
+        ruta = self._escribir("vacia.json", " [ ] ")
+        self.assertEqual(list(iterar_partidas(ruta)), [])
+    
+    def test_json_lines(self):
+        """Prueba el formato JSON Lines"""
+        texto = "\n".join(json.dumps(p, ensure_ascii=False) for p in self.partidas) + "\n\n"
+        ruta = self._escribir("partidas.jsonl", texto)
+        self.assertEqual(list(iterar_partidas(ruta)), self.partidas)
+    
+    def test_leer_partida(self):
+        """Prueba la lectura de una sola partida por su posición"""
+        ruta = self._escribir("partidas.json", json.dumps({"partidas": self.partidas}))
+        self.assertEqual(leer_partida(ruta, 1, 8), self.partidas[1])
+        self.assertIsNone(leer_partida(ruta, 3))
+    
+    def test_archivo_invalido(self):
+        """Prueba que un archivo mal formado produce ValueError"""
+        ruta = self._escribir("roto.json", '{"partidas": [{"id": 1}, {"id": ')
+        with self.assertRaises(ValueError):
+            list(iterar_partidas(ruta, 4))
+        
+        ruta = self._escribir("numero.json", "42")
+        with self.assertRaises(ValueError):
+            list(iterar_partidas(ruta))
+    
+    def test_indice_por_nivel(self):
+        """Prueba el índice nivel -> ids construido en una pasada"""
+        ruta = self._escribir("partidas.json", json.dumps({"partidas": self.partidas + [{"dificultad": "facil"}]}))
+        indice = indexar_partidas_por_nivel(ruta)
+        self.assertEqual(indice["FÁCIL"], ["facil_001", "partida_4"])
+        self.assertEqual(indice["MEDIO"], ["normal_001"])
+        self.assertEqual(indice["DIFÍCIL"], [])
+        self.assertEqual(indice["EXPERTO"], ["experto_001"])
+
+
+if __name__ == '__main__':
+    unittest.main()
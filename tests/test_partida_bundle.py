@@ -0,0 +1,133 @@
+"""
+Pruebas para el paquete binario de partidas
+Test unitarios para logic.partida_bundle y la carga con mmap
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import partida_loader
+from logic.partida_bundle import LectorBundle, compilar_bundle
+from tests.test_partida_loader import escribir_catalogo
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, partida_desde_solucion
+
+
+class TestPartidaBundle(unittest.TestCase):
+    def setUp(self):
+        """Compila un catálogo pequeño en un directorio temporal"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.partidas = [
+            dict(partida_desde_solucion(SOLUCION_3X3, "facil"), id="facil_001"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "facil"), id="facil_002"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "experto"), id="experto_001"),
+        ]
+        self.ruta_json = os.path.join(self.tmpdir.name, "partidas.json")
+        self.ruta_bundle = os.path.join(self.tmpdir.name, "partidas.kkb")
+        escribir_catalogo(self.ruta_json, self.partidas)
+        self.conteo = compilar_bundle(self.partidas, self.ruta_bundle)
+        
+        self._rutas_originales = (partida_loader.PARTIDAS_FILE, partida_loader.BUNDLE_FILE, partida_loader.BOLSAS_DIR)
+        partida_loader.PARTIDAS_FILE = self.ruta_json
+        partida_loader.BUNDLE_FILE = self.ruta_bundle
+        partida_loader.BOLSAS_DIR = os.path.join(self.tmpdir.name, "bolsas")
+    
+    def tearDown(self):
+        partida_loader._cerrar_bundle()
+        partida_loader.PARTIDAS_FILE, partida_loader.BUNDLE_FILE, partida_loader.BOLSAS_DIR = self._rutas_originales
+        partida_loader._indice_niveles = None
+        partida_loader._indice_mtime = None
+        self.tmpdir.cleanup()
+    
+    def test_conteo_por_nivel(self):
+        """Prueba que la tabla de niveles refleja el catálogo"""
+        self.assertEqual(self.conteo, {"FÁCIL": 2, "MEDIO": 0, "DIFÍCIL": 0, "EXPERTO": 1})
+        with open(self.ruta_bundle, "rb") as f:
+            lector = LectorBundle(f.read())
+        self.assertEqual(lector.total, 3)
+        self.assertEqual(lector.cantidad("MEDIO"), 0)
+        self.assertIsNone(lector.leer("MEDIO", 0))
+    
+    def test_ida_y_vuelta(self):
+        """Prueba que las claves decodificadas coinciden con la conversión del JSON"""
+        with open(self.ruta_bundle, "rb") as f:
+            lector = LectorBundle(f.read())
+        
+        for posicion, partida in enumerate(self.partidas[:2]):
+            esperada = partida_loader._convert_partida_format(partida)
+            leida = lector.leer("FÁCIL", posicion)
+            self.assertEqual(leida["claves"], esperada["claves"])
+            self.assertEqual(leida["id"], partida["id"])
+            self.assertEqual(leida["tamaño"], partida["tamaño"])
+    
+    def test_metadatos_sin_decodificar(self):
+        """Prueba que los metadatos salen de la cabecera del registro"""
+        with open(self.ruta_bundle, "rb") as f:
+            lector = LectorBundle(f.read())
+        
+        meta = lector.meta("FÁCIL", 1)
+        self.assertEqual((meta.id, meta.filas, meta.columnas), ("facil_002", 6, 6))
+        self.assertFalse(meta.cargada)
+        self.assertEqual(meta.corridas, len(meta.cargar()["claves"]))
+        self.assertEqual(meta.cargar()["partida"], 2)
+        self.assertIsNone(lector.meta("MEDIO", 0))
+    
+    def test_archivo_invalido(self):
+        """Prueba que un archivo que no es un paquete se rechaza"""
+        with self.assertRaises(ValueError):
+            LectorBundle(b"JSON" + bytes(12))
+    
+    def test_recompilar_no_toca_el_mapeo_abierto(self):
+        """Prueba que recompilar reemplaza el archivo sin modificar el que está mapeado"""
+        import mmap
+        with open(self.ruta_bundle, "rb") as f:
+            mapeo = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            compilar_bundle(self.partidas[2:], self.ruta_bundle)
+            self.assertEqual(LectorBundle(mapeo).total, 3)
+        finally:
+            mapeo.close()
+        with open(self.ruta_bundle, "rb") as f:
+            self.assertEqual(LectorBundle(f.read()).total, 1)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["partidas.json", "partidas.kkb"])
+    
+    def test_partida_fuera_de_rango(self):
+        """Prueba que una partida que no cabe en el formato binario se rechaza con ValueError"""
+        grande = dict(self.partidas[0], tamaño={"filas": 300, "columnas": 3})
+        with self.assertRaises(ValueError):
+            compilar_bundle([grande], self.ruta_bundle)
+        with open(self.ruta_bundle, "rb") as f:
+            self.assertEqual(LectorBundle(f.read()).total, 3)
+    
+    def test_carga_con_mmap(self):
+        """Prueba el sorteo desde el paquete mapeado en memoria"""
+        partida = partida_loader.load_random_partida_bundle("EXPERTO", self.ruta_bundle)
+        self.assertEqual(partida["id"], "experto_001")
+        self.assertIsNone(partida_loader.load_random_partida_bundle("MEDIO", self.ruta_bundle))
+        
+        # Sorteo sin reposición desde el paquete
+        ids = {partida_loader.load_random_partida_bundle("FÁCIL", self.ruta_bundle)["id"] for _ in range(2)}
+        self.assertEqual(ids, {"facil_001", "facil_002"})
+    
+    def test_load_random_partida_usa_el_paquete_vigente(self):
+        """Prueba que load_random_partida prefiere el paquete si no es más viejo que el JSON"""
+        mtime = os.path.getmtime(self.ruta_json) + 10
+        os.utime(self.ruta_bundle, (mtime, mtime))
+        
+        partida = partida_loader.load_random_partida("EXPERTO")
+        self.assertEqual(partida["id"], "experto_001")
+        self.assertIsNone(partida_loader._indice_niveles)
+        
+        # Si el JSON es más nuevo se vuelve a leer el JSON
+        os.utime(self.ruta_json, (mtime + 10, mtime + 10))
+        partida = partida_loader.load_random_partida("EXPERTO")
+        self.assertEqual(partida["id"], "experto_001")
+        self.assertIsNotNone(partida_loader._indice_niveles)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Pruebas para el cargador de partidas
+Test unitarios para logic.partida_loader
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import partida_loader
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, partida_desde_solucion
+
+
+def escribir_catalogo(ruta, partidas):
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"partidas": partidas}, f, ensure_ascii=False)
+
+
+class TestPartidaLoader(unittest.TestCase):
+    def setUp(self):
+        """Usa un catálogo temporal y limpia el estado del módulo"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.tmpdir.name, "partidas.json")
+        escribir_catalogo(self.ruta, [
+            dict(partida_desde_solucion(SOLUCION_3X3, "facil"), id="facil_001"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "facil"), id="facil_002"),
+            dict(partida_desde_solucion(SOLUCION_6X6, "normal"), id="normal_001"),
+        ])
+        self._ruta_original = partida_loader.PARTIDAS_FILE
+        self._bundle_original = partida_loader.BUNDLE_FILE
+        self._bolsas_original = partida_loader.BOLSAS_DIR
+        partida_loader.PARTIDAS_FILE = self.ruta
+        partida_loader.BUNDLE_FILE = os.path.join(self.tmpdir.name, "partidas.kkb")
+        partida_loader.BOLSAS_DIR = os.path.join(self.tmpdir.name, "bolsas")
+        self._limpiar_estado()
+    
+    def tearDown(self):
+        self._limpiar_estado()
+        partida_loader.PARTIDAS_FILE = self._ruta_original
+        partida_loader.BUNDLE_FILE = self._bundle_original
+        partida_loader.BOLSAS_DIR = self._bolsas_original
+        self.tmpdir.cleanup()
+    
+    def _limpiar_estado(self):
+        partida_loader._indice_niveles = None
+        partida_loader._indice_mtime = None
+        partida_loader._cerrar_bundle()
+        partida_loader.reset_partidas()
+    
+    def test_conteo_por_nivel(self):
+        """Prueba el conteo de partidas por nivel"""
+        self.assertEqual(partida_loader.get_available_partidas_count("FÁCIL"), 2)
+        self.assertEqual(partida_loader.get_available_partidas_count("MEDIO"), 1)
+        self.assertEqual(partida_loader.get_available_partidas_count("EXPERTO"), 0)
+    
+    def test_indice_se_construye_una_vez(self):
+        """Prueba que solo se decodifican las partidas sorteadas, y una sola vez"""
+        conversiones = []
+        original = partida_loader._convert_partida_format
+        
+        def contar(partida):
+            conversiones.append(partida.get("id"))
+            return original(partida)
+        
+        partida_loader._convert_partida_format = contar
+        try:
+            for _ in range(5):
+                partida_loader.get_available_partidas_count("FÁCIL")
+                partida_loader.load_random_partida("FÁCIL")
+        finally:
+            partida_loader._convert_partida_format = original
+        
+        # Los conteos no decodifican nada; la partida de MEDIO nunca se sorteó
+        self.assertEqual(sorted(conversiones), ["facil_001", "facil_002"])
+    
+    def test_indice_se_invalida_al_cambiar_el_archivo(self):
+        """Prueba que un cambio de mtime reconstruye el índice"""
+        self.assertEqual(partida_loader.get_available_partidas_count("MEDIO"), 1)
+        
+        escribir_catalogo(self.ruta, [dict(partida_desde_solucion(SOLUCION_3X3, "normal"), id="normal_002")] * 3)
+        mtime = os.path.getmtime(self.ruta) + 10
+        os.utime(self.ruta, (mtime, mtime))
+        
+        self.assertEqual(partida_loader.get_available_partidas_count("MEDIO"), 3)
+        self.assertEqual(partida_loader.get_available_partidas_count("FÁCIL"), 0)
+    
+    def test_load_random_partida(self):
+        """Prueba que la partida cargada es del nivel pedido"""
+        partida = partida_loader.load_random_partida("MEDIO")
+        self.assertEqual(partida["nivel_de_dificultad"], "MEDIO")
+        self.assertTrue(partida["claves"])
+        self.assertIsNone(partida_loader.load_random_partida("OTRO"))
+    
+    def test_dimensiones_partida(self):
+        """Prueba que las dimensiones salen del tamaño de la partida o de sus claves"""
+        convertida = partida_loader._convert_partida_format(partida_desde_solucion(SOLUCION_6X6))
+        self.assertEqual(convertida["tamaño"], {"filas": 6, "columnas": 6})
+        
+        # Sin "tamaño" (p. ej. un guardado antiguo) se deduce de las claves
+        sin_tamano = {"claves": [{"tipo_de_clave": "F", "fila": 15, "columna": 12, "clave": 36, "casillas": 8}]}
+        self.assertEqual(partida_loader.dimensiones_partida(sin_tamano), (15, 20))
+        self.assertEqual(partida_loader.dimensiones_partida(None), (9, 9))
+    
+    def test_listar_partidas(self):
+        """Prueba que el listado usa solo los metadatos de cada partida"""
+        partidas = partida_loader.listar_partidas("FÁCIL")
+        self.assertEqual([meta.id for meta in partidas], ["facil_001", "facil_002"])
+        self.assertEqual((partidas[1].filas, partidas[1].columnas), (6, 6))
+        self.assertEqual(partidas[1].corridas, len(partidas[1].cargar()["claves"]))
+        self.assertFalse(partidas[0].cargada)
+        self.assertEqual(partidas[0].resumen()["partida"], 1)
+    
+    def test_indice_no_guarda_las_partidas(self):
+        """Prueba que el índice no retiene las partidas del catálogo y las relee al cargarlas"""
+        meta = partida_loader.listar_partidas("MEDIO")[0]
+        self.assertFalse(any(isinstance(argumento, dict) for argumento in meta._decodificar.args))
+        self.assertEqual(meta.cargar()["claves"],
+                         partida_loader._convert_partida_format(partida_desde_solucion(SOLUCION_6X6, "normal"))["claves"])
+        
+        # Si el catálogo cambió, la partida ya no se encuentra
+        otra = partida_loader.listar_partidas("FÁCIL")[1]
+        escribir_catalogo(self.ruta, [])
+        self.assertIsNone(otra.cargar())
+    
+    def test_sin_repetir_hasta_agotar(self):
+        """Prueba que no se repiten partidas del nivel hasta agotar la bolsa"""
+        ids = [partida_loader.load_random_partida("FÁCIL")["id"] for _ in range(2)]
+        self.assertEqual(sorted(ids), ["facil_001", "facil_002"])
+        
+        # El orden sobrevive a un reinicio (índice y bolsas en memoria descartados)
+        partida_loader.reset_partidas("FÁCIL")
+        primera = partida_loader.load_random_partida("FÁCIL")["id"]
+        partida_loader._indice_niveles = None
+        partida_loader._bolsa = None
+        segunda = partida_loader.load_random_partida("FÁCIL")["id"]
+        self.assertNotEqual(primera, segunda)
+
+
+if __name__ == '__main__':
+    unittest.main()
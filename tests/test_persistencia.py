@@ -0,0 +1,69 @@
+"""
+Pruebas para la capa de escritura segura
+Test unitarios para logic.persistencia
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.persistencia import (actualizar_json, bloqueo_archivo, escribir_json_atomico,
+                                leer_json)
+
+
+def incrementar(ruta, veces):
+    for _ in range(veces):
+        actualizar_json(ruta, lambda datos: {"contador": datos["contador"] + 1}, por_defecto={"contador": 0})
+
+
+class TestPersistencia(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.tmpdir.name, "datos", "archivo.json")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_escritura_atomica(self):
+        """Prueba que se reemplaza el archivo sin dejar temporales"""
+        escribir_json_atomico(self.ruta, {"nivel": "FÁCIL"})
+        escribir_json_atomico(self.ruta, {"nivel": "MEDIO"})
+        with open(self.ruta, encoding="utf-8") as f:
+            self.assertEqual(json.load(f), {"nivel": "MEDIO"})
+        self.assertEqual(os.listdir(os.path.dirname(self.ruta)), ["archivo.json"])
+    
+    def test_error_conserva_el_archivo_anterior(self):
+        """Prueba que un error al serializar no trunca el archivo existente"""
+        escribir_json_atomico(self.ruta, {"nivel": "FÁCIL"})
+        with self.assertRaises(TypeError):
+            escribir_json_atomico(self.ruta, {"nivel": object()})
+        self.assertEqual(leer_json(self.ruta), {"nivel": "FÁCIL"})
+        self.assertEqual(leer_json(self.ruta + ".no_existe", []), [])
+    
+    def test_bloqueo_ocupado(self):
+        """Prueba que un bloqueo ocupado se espera de forma acotada"""
+        with bloqueo_archivo(self.ruta):
+            with self.assertRaises(TimeoutError):
+                with bloqueo_archivo(self.ruta, espera_maxima=0.1):
+                    pass
+        with bloqueo_archivo(self.ruta, espera_maxima=0.1):
+            pass
+    
+    def test_actualizaciones_concurrentes(self):
+        """Prueba que varios procesos que leen-modifican-escriben no pierden cambios"""
+        procesos = [multiprocessing.Process(target=incrementar, args=(self.ruta, 20)) for _ in range(4)]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join(30)
+        self.assertEqual(leer_json(self.ruta), {"contador": 80})
+
+
+if __name__ == '__main__':
+    unittest.main()
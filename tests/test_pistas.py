@@ -0,0 +1,75 @@
+"""
+Pruebas para el motor de pistas
+Test unitarios para MotorPistas
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.indice_partida import IndicePartida
+from logic.pistas import MotorPistas
+from tests.test_solver import SOLUCION_3X3, SOLUCION_6X6, claves_de
+
+
+# Ninguna corrida tiene combinación única; (1, 1) sale de cruzar {1,2,3,4} con {4..9}
+SOLUCION_INTERSECCION = [
+    ["#", "\\", "\\"],
+    ["\\", 4, 1],
+    ["\\", 9, 5],
+]
+
+
+def motor_de(solucion):
+    return MotorPistas(IndicePartida(claves_de(solucion)))
+
+
+class TestMotorPistas(unittest.TestCase):
+    def test_combinacion_unica(self):
+        """Prueba la regla de combinación única"""
+        pista = motor_de(SOLUCION_3X3).pista()
+        self.assertEqual(pista["regla"], "combinacion_unica")
+        self.assertEqual((pista["fila"], pista["columna"], pista["valor"]), (1, 1, 1))
+        self.assertIn("{1, 3}", pista["explicacion"])
+    
+    def test_interseccion(self):
+        """Prueba la regla de intersección entre corridas"""
+        pista = motor_de(SOLUCION_INTERSECCION).pista()
+        self.assertEqual(pista["regla"], "interseccion")
+        self.assertEqual((pista["fila"], pista["columna"], pista["valor"]), (1, 1, 4))
+    
+    def test_pistas_completan_el_tablero(self):
+        """Prueba que seguir las pistas lleva a la solución sin errores"""
+        motor = motor_de(SOLUCION_6X6)
+        reglas = set()
+        while True:
+            pista = motor.pista()
+            if pista is None:
+                break
+            self.assertEqual(pista["valor"], SOLUCION_6X6[pista["fila"]][pista["columna"]])
+            reglas.add(pista["regla"])
+            motor.colocar(pista["fila"], pista["columna"], pista["valor"])
+        self.assertTrue(all(motor.valores))
+        self.assertTrue(reglas)
+    
+    def test_borrar_restaura_candidatos(self):
+        """Prueba que borrar un dígito vuelve a abrir los candidatos"""
+        motor = motor_de(SOLUCION_INTERSECCION)
+        antes = motor.candidatos_de(2, 2)
+        motor.colocar(1, 1, 4)
+        motor.colocar(1, 1, None)
+        self.assertEqual(motor.candidatos_de(2, 2), antes)
+    
+    def test_jugada_contradictoria(self):
+        """Prueba que no se dan pistas si el tablero es contradictorio"""
+        motor = motor_de(SOLUCION_3X3)
+        motor.colocar(1, 1, 9)
+        self.assertFalse(motor.consistente)
+        self.assertIsNone(motor.pista())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+Pruebas para el pool de partidas precargadas
+Test unitarios para logic.pool_partidas
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.partida_loader import _convert_partida_format
+from logic.pool_partidas import PoolPartidas
+from tests.test_solver import SOLUCION_3X3, partida_desde_solucion
+
+
+class CargadorFalso:
+    """Devuelve partidas convertidas solo para los niveles indicados."""
+    
+    def __init__(self, niveles):
+        self.niveles = niveles
+        self.llamadas = []
+        self.hilos = set()
+        self.lock = threading.Lock()
+    
+    def __call__(self, nivel):
+        with self.lock:
+            self.llamadas.append(nivel)
+            self.hilos.add(threading.current_thread().name)
+        if nivel not in self.niveles:
+            return None
+        partida = _convert_partida_format(partida_desde_solucion(SOLUCION_3X3))
+        partida["nivel_de_dificultad"] = nivel
+        return partida
+
+
+def generar_en_otro_proceso(nivel):
+    """Generador de respaldo que anota el proceso donde corrió."""
+    partida = _convert_partida_format(partida_desde_solucion(SOLUCION_3X3))
+    partida["nivel_de_dificultad"] = nivel
+    partida["pid"] = os.getpid()
+    return partida
+
+
+class TestPoolPartidas(unittest.TestCase):
+    def setUp(self):
+        self.cargador = CargadorFalso({"FÁCIL", "MEDIO"})
+        self.pool = PoolPartidas(por_nivel=2, cargador=self.cargador, generador=None)
+        self.pool.iniciar()
+    
+    def tearDown(self):
+        self.pool.detener()
+    
+    def test_partida_preparada_con_indice(self):
+        """Prueba que las partidas salen convertidas e indexadas"""
+        preparada = self.pool.obtener("FÁCIL", esperar=5)
+        self.assertIsNotNone(preparada)
+        self.assertEqual(preparada.partida["nivel_de_dificultad"], "FÁCIL")
+        self.assertEqual(preparada.indice.total_celdas, 4)
+    
+    def test_reposicion_en_segundo_plano(self):
+        """Prueba que el hilo del pool carga las partidas y repone las colas"""
+        for _ in range(3):
+            self.assertIsNotNone(self.pool.obtener("MEDIO", esperar=5))
+        
+        # El hilo vuelve a llenar la cola hasta por_nivel
+        with self.pool._condicion:
+            self.pool._condicion.wait_for(lambda: len(self.pool._colas["MEDIO"]) == 2, timeout=5)
+        self.assertEqual(self.pool.disponibles("MEDIO"), 2)
+        self.assertEqual(self.cargador.hilos, {"pool-partidas"})
+    
+    def test_nivel_sin_partidas(self):
+        """Prueba que un nivel sin partidas devuelve None sin esperar todo el plazo"""
+        self.assertIsNone(self.pool.obtener("EXPERTO", esperar=5))
+        self.assertIsNone(self.pool.obtener("OTRO"))
+    
+    def test_generador_de_respaldo(self):
+        """Prueba que se usa el generador si el catálogo no tiene el nivel"""
+        self.pool.detener()
+        generadas = []
+        
+        def generador(nivel):
+            generadas.append(nivel)
+            return CargadorFalso({nivel})(nivel)
+        
+        self.pool = PoolPartidas(por_nivel=1, cargador=self.cargador, generador=generador,
+                                 generar_en_proceso=False)
+        self.pool.iniciar()
+        preparada = self.pool.obtener("DIFÍCIL", esperar=5)
+        self.assertEqual(preparada.partida["nivel_de_dificultad"], "DIFÍCIL")
+        self.assertIn("DIFÍCIL", generadas)
+    
+    def test_generador_en_otro_proceso(self):
+        """Prueba que el generador de respaldo corre fuera del proceso de la interfaz"""
+        self.pool.detener()
+        self.pool = PoolPartidas(por_nivel=1, cargador=self.cargador, generador=generar_en_otro_proceso)
+        self.pool.iniciar()
+        preparada = self.pool.obtener("EXPERTO", esperar=30)
+        self.assertEqual(preparada.partida["nivel_de_dificultad"], "EXPERTO")
+        self.assertNotEqual(preparada.partida["pid"], os.getpid())
+    
+    def test_pedir_sin_esperar(self):
+        """Prueba que pedir() no bloquea y que el resultado se consulta después"""
+        self.pool.pedir("MEDIO")
+        self.pool.pedir("EXPERTO")
+        with self.pool._condicion:
+            self.pool._condicion.wait_for(
+                lambda: self.pool._colas["MEDIO"] and "EXPERTO" in self.pool._sin_partidas, timeout=5)
+        self.assertGreater(self.pool.disponibles("MEDIO"), 0)
+        self.assertFalse(self.pool.sin_partidas("MEDIO"))
+        self.assertTrue(self.pool.sin_partidas("EXPERTO"))
+        self.assertIsNotNone(self.pool.obtener("MEDIO"))
+
+
+if __name__ == '__main__':
+    unittest.main()
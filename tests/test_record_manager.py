@@ -0,0 +1,198 @@
+"""
+Pruebas para el manejo de récords
+Test unitarios para logic.record_manager y logic.almacen_records
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import record_manager
+from logic.almacen_records import AlmacenRecords
+from logic.servicio_records import ServicioRecords
+
+
+class TestAlmacenRecords(unittest.TestCase):
+    def setUp(self):
+        self.almacen = AlmacenRecords(":memory:")
+    
+    def tearDown(self):
+        self.almacen.cerrar()
+    
+    def test_top_por_nivel(self):
+        """Prueba que el top devuelve los mejores tiempos del nivel pedido"""
+        for jugador, tiempo in [("Ana", 300), ("Beto", 120), ("Carla", 200), ("Dani", 500)]:
+            self.almacen.agregar(jugador, "FÁCIL", tiempo)
+        self.almacen.agregar("Eva", "MEDIO", 50)
+        
+        top = self.almacen.top("FÁCIL", 3)
+        self.assertEqual([r["jugador"] for r in top], ["Beto", "Carla", "Ana"])
+        self.assertEqual(self.almacen.cantidad("FÁCIL"), 4)
+        self.assertEqual(self.almacen.top("EXPERTO"), [])
+    
+    def test_usa_el_indice_nivel_tiempo(self):
+        """Prueba que la consulta del top se resuelve con el índice (nivel, tiempo)"""
+        plan = self.almacen._conexion.execute(
+            "EXPLAIN QUERY PLAN SELECT jugador, tiempo, fecha FROM records WHERE nivel = ? "
+            "ORDER BY tiempo, fecha LIMIT ?", ("FÁCIL", 3)
+        ).fetchall()
+        self.assertIn("idx_records_nivel_tiempo", " ".join(str(tuple(fila)) for fila in plan))
+    
+    def test_historial_jugador(self):
+        """Prueba el historial de un jugador, del más reciente al más antiguo"""
+        self.almacen.agregar("Ana", "FÁCIL", 300, "2025-01-01 10:00:00")
+        self.almacen.agregar("Ana", "MEDIO", 600, "2025-01-02 10:00:00")
+        self.almacen.agregar("Beto", "FÁCIL", 100, "2025-01-03 10:00:00")
+        
+        historial = self.almacen.historial("Ana")
+        self.assertEqual([r["nivel"] for r in historial], ["MEDIO", "FÁCIL"])
+        self.assertEqual(len(self.almacen.historial("Ana", nivel="FÁCIL")), 1)
+        self.assertEqual(len(self.almacen.historial("Ana", limite=1)), 1)
+
+
+class TestServicioRecords(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.tmpdir.name, "records.db")
+        self.servicio = ServicioRecords(AlmacenRecords(self.ruta), k=3)
+    
+    def tearDown(self):
+        self.servicio.almacen.cerrar()
+        self.tmpdir.cleanup()
+    
+    def test_top_k_en_memoria(self):
+        """Prueba que el montículo conserva los K mejores y todo se escribe en la base"""
+        entradas = [self.servicio.registrar("Ana", "EXPERTO", t) for t in (500, 300, 400, 100, 600)]
+        self.assertEqual(entradas, [True, True, True, True, False])
+        self.assertEqual([r["tiempo"] for r in self.servicio.top("EXPERTO", 3)], [100, 300, 400])
+        self.assertEqual(self.servicio.almacen.cantidad("EXPERTO"), 5)
+        
+        # Más de K se consulta en la base
+        self.assertEqual(len(self.servicio.top("EXPERTO", 5)), 5)
+        self.assertTrue(self.servicio.es_record("EXPERTO", 350))
+        self.assertFalse(self.servicio.es_record("EXPERTO", 450))
+    
+    def test_cambios_de_otro_proceso(self):
+        """Prueba que el caché se invalida si otra conexión escribe en la base"""
+        self.servicio.registrar("Ana", "FÁCIL", 300)
+        self.assertEqual(len(self.servicio.top("FÁCIL")), 1)
+        
+        otro = AlmacenRecords(self.ruta)
+        otro.agregar("Beto", "FÁCIL", 100)
+        otro.cerrar()
+        self.assertEqual(self.servicio.top("FÁCIL")[0]["jugador"], "Beto")
+
+
+class TestRecordManager(unittest.TestCase):
+    def setUp(self):
+        """Usa una base y un JSON temporales"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ruta_json = os.path.join(self.tmpdir.name, "record.json")
+        with open(self.ruta_json, "w", encoding="utf-8") as f:
+            json.dump({"FÁCIL": [{"jugador": "Bob", "tiempo": 900, "fecha": "2025-06-20 00:06:39"}]}, f)
+        
+        # Lista de SaveLoadManager (sin nivel EXPERTO en el original)
+        self.ruta_lista = os.path.join(self.tmpdir.name, "récords.json")
+        with open(self.ruta_lista, "w", encoding="utf-8") as f:
+            json.dump([{"jugador": "Zoe", "nivel_dificultad": "MEDIO", "tiempo_transcurrido": 700,
+                        "fecha": "2025-06-21T10:00:00"}], f)
+        
+        self._rutas_originales = (record_manager.RECORDS_FILE, record_manager.RECORDS_LISTA_FILE,
+                                  record_manager.RECORDS_DB)
+        record_manager.RECORDS_FILE = self.ruta_json
+        record_manager.RECORDS_LISTA_FILE = self.ruta_lista
+        record_manager.RECORDS_DB = os.path.join(self.tmpdir.name, "records.db")
+    
+    def tearDown(self):
+        record_manager.cerrar_servicio()
+        (record_manager.RECORDS_FILE, record_manager.RECORDS_LISTA_FILE,
+         record_manager.RECORDS_DB) = self._rutas_originales
+        self.tmpdir.cleanup()
+    
+    def test_migracion_y_guardado(self):
+        """Prueba que los récords del JSON se migran una vez y se suman los nuevos"""
+        self.assertTrue(record_manager.guardar_record("Ana", "FÁCIL", 600))
+        top = record_manager.obtener_top_records("FÁCIL")
+        self.assertEqual([(r["jugador"], r["tiempo"]) for r in top], [("Ana", 600), ("Bob", 900)])
+        
+        # Al reabrir la base no se vuelve a importar el JSON
+        record_manager.cerrar_servicio()
+        self.assertEqual(len(record_manager.obtener_top_records("FÁCIL")), 2)
+        self.assertEqual(record_manager.obtener_top_records("MEDIO")[0]["jugador"], "Zoe")
+    
+    def test_migracion_concurrente(self):
+        """Prueba que dos instancias que migran a la vez importan el JSON una sola vez"""
+        ruta = os.path.join(self.tmpdir.name, "legado.json")
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump({"FÁCIL": [{"jugador": "Ana", "tiempo": 100, "fecha": "2025-01-01"},
+                                 {"jugador": "Mal", "tiempo": "rápido", "fecha": "2025-01-01"}]}, f)
+        
+        ruta_db = os.path.join(self.tmpdir.name, "compartida.db")
+        almacenes = [AlmacenRecords(ruta_db), AlmacenRecords(ruta_db)]
+        barrera = threading.Barrier(2)
+        importados, errores = [], []
+        
+        def migrar(almacen):
+            barrera.wait()
+            try:
+                importados.append(almacen.migrar_json(ruta))
+            except Exception as e:
+                errores.append(e)
+        
+        hilos = [threading.Thread(target=migrar, args=(almacen,)) for almacen in almacenes]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        
+        self.assertEqual(errores, [])
+        self.assertEqual(sorted(importados), [0, 1])  # el récord con tiempo inválido se omite
+        self.assertEqual(almacenes[0].cantidad(), 1)
+        for almacen in almacenes:
+            almacen.cerrar()
+    
+    def test_file_manager_agrega_records(self):
+        """Prueba que FileManager agrega récords en su data_dir con el formato de SaveLoadManager"""
+        from utils.file_manager import FileManager
+        
+        data_dir = os.path.join(self.tmpdir.name, "otra_data")
+        manager = FileManager(data_dir)
+        self.assertTrue(manager.agregar_records([{"jugador": "Lia", "nivel_dificultad": "EXPERTO",
+                                                  "tiempo_transcurrido": 3700}]))
+        self.assertFalse(manager.agregar_records([{"jugador": "Lia", "nivel_dificultad": "EXPERTO"}]))
+        records = manager.load_records()
+        self.assertEqual([(r["jugador"], r["nivel_dificultad"], r["tiempo_transcurrido"], r["tiempo_formato"])
+                          for r in records], [("Lia", "EXPERTO", 3700, "01:01:40")])
+        self.assertTrue(os.path.exists(os.path.join(data_dir, "kakuro2025_records.db")))
+        # El servicio global no ve los récords de otro data_dir
+        self.assertEqual(record_manager.obtener_top_records("EXPERTO"), [])
+    
+    def test_top_tres_y_nuevo_record(self):
+        """Prueba que el top se limita a tres y se detecta un nuevo récord"""
+        for tiempo in (100, 200, 300, 400):
+            record_manager.guardar_record("Carla", "MEDIO", tiempo)
+        self.assertEqual([r["tiempo"] for r in record_manager.obtener_top_records("MEDIO")], [100, 200, 300])
+        self.assertTrue(record_manager.verificar_nuevo_record("MEDIO", 250))
+        self.assertFalse(record_manager.verificar_nuevo_record("MEDIO", 350))
+        self.assertEqual(len(record_manager.obtener_historial_jugador("Carla")), 4)
+    
+    def test_datos_invalidos(self):
+        """Prueba que no se guardan récords sin jugador o con nivel inválido"""
+        self.assertFalse(record_manager.guardar_record("", "FÁCIL", 10))
+        self.assertFalse(record_manager.guardar_record("Ana", "OTRO", 10))
+        self.assertEqual(record_manager.obtener_top_records("OTRO"), [])
+    
+    def test_limpiar_nivel(self):
+        """Prueba que se eliminan los récords de un nivel"""
+        self.assertTrue(record_manager.limpiar_records_nivel("FÁCIL"))
+        self.assertEqual(record_manager.obtener_top_records("FÁCIL"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Pruebas para el módulo de resolución
+Test unitarios para KakuroSolver
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic.partida_loader import _convert_partida_format
+from logic.solver import KakuroSolver, verificar_partida
+from logic.validator import KakuroValidator
+
+
+def partida_desde_solucion(solucion, dificultad="facil"):
+    """
+    Construye una partida en el formato de kakuro2025_partidas.json a partir
+    de una solución donde las casillas blancas ya tienen su dígito.
+    """
+    filas = len(solucion)
+    columnas = len(solucion[0])
+    tablero = [["?" if isinstance(c, int) else c for c in fila] for fila in solucion]
+    sumas_filas = [[None] * columnas for _ in range(filas)]
+    sumas_columnas = [[None] * columnas for _ in range(filas)]
+
+    for i in range(filas):
+        for j in range(columnas):
+            if solucion[i][j] != "\\":
+                continue
+            k = j + 1
+            total = 0
+            while k < columnas and isinstance(solucion[i][k], int):
+                total += solucion[i][k]
+                k += 1
+            if total:
+                sumas_filas[i][j] = total
+            k = i + 1
+            total = 0
+            while k < filas and isinstance(solucion[k][j], int):
+                total += solucion[k][j]
+                k += 1
+            if total:
+                sumas_columnas[i][j] = total
+
+    return {
+        "dificultad": dificultad,
+        "tamaño": {"filas": filas, "columnas": columnas},
+        "tablero": tablero,
+        "sumas_filas": sumas_filas,
+        "sumas_columnas": sumas_columnas,
+        "solucion": [[str(c) for c in fila] for fila in solucion],
+    }
+
+
+SOLUCION_3X3 = [
+    ["#", "\\", "\\"],
+    ["\\", 1, 3],
+    ["\\", 2, 4],
+]
+
+SOLUCION_6X6 = [
+    ["#", "\\", "\\", "#", "\\", "\\"],
+    ["\\", 9, 7, "\\", 1, 2],
+    ["\\", 8, 9, 6, 7, 4],
+    ["#", "\\", 8, 9, "\\", "#"],
+    ["\\", 3, 1, 2, 4, "\\"],
+    ["\\", 1, 2, "\\", 1, 3],
+]
+
+# Dos soluciones: [[1, 2], [2, 1]] y [[2, 1], [1, 2]]
+SOLUCION_AMBIGUA = [
+    ["#", "\\", "\\"],
+    ["\\", 1, 2],
+    ["\\", 2, 1],
+]
+
+
+def claves_de(solucion):
+    return _convert_partida_format(partida_desde_solucion(solucion))["claves"]
+
+
+class TestKakuroSolver(unittest.TestCase):
+    def assertSolucionValida(self, claves, resultado):
+        """Comprueba que cada corrida suma su clave y no repite dígitos"""
+        self.assertIsNotNone(resultado)
+        for clave in claves:
+            fila = clave["fila"] - 1
+            columna = clave["columna"] - 1
+            if clave["tipo_de_clave"] == "F":
+                valores = [resultado[(fila, columna + k)] for k in range(1, clave["casillas"] + 1)]
+            else:
+                valores = [resultado[(fila + k, columna)] for k in range(1, clave["casillas"] + 1)]
+            self.assertEqual(sum(valores), clave["clave"])
+            self.assertEqual(len(valores), len(set(valores)))
+
+    def test_solve_tablero_pequeno(self):
+        """Prueba que se encuentra la única solución de un tablero 3x3"""
+        resultado = KakuroSolver(claves_de(SOLUCION_3X3)).solve()
+        self.assertEqual(resultado, {(1, 1): 1, (1, 2): 3, (2, 1): 2, (2, 2): 4})
+
+    def test_solve_tablero_mediano(self):
+        """Prueba que la solución encontrada cumple todas las claves"""
+        claves = claves_de(SOLUCION_6X6)
+        self.assertSolucionValida(claves, KakuroSolver(claves).solve())
+
+    def test_solve_sin_solucion(self):
+        """Prueba que un tablero imposible devuelve None"""
+        claves = claves_de(SOLUCION_3X3)
+        claves[0]["clave"] = 30
+        self.assertIsNone(KakuroSolver(claves).solve())
+
+    def test_validator_solve(self):
+        """Prueba que KakuroValidator delega en el motor de resolución"""
+        resultado = KakuroValidator().solve(claves_de(SOLUCION_3X3))
+        self.assertEqual(resultado[(2, 2)], 4)
+
+    
+    def test_count_solutions_unica(self):
+        """Prueba el conteo en una partida de solución única"""
+        solver = KakuroSolver(claves_de(SOLUCION_3X3))
+        self.assertEqual(solver.count_solutions(), 1)
+        self.assertTrue(solver.is_unique())
+    
+    def test_count_solutions_se_detiene_en_la_segunda(self):
+        """Prueba que el conteo se detiene al encontrar la segunda solución"""
+        solver = KakuroSolver(claves_de(SOLUCION_AMBIGUA))
+        self.assertEqual(solver.count_solutions(limite=2), 2)
+        self.assertEqual(solver.count_solutions(limite=10), 2)
+        self.assertFalse(solver.is_unique())
+        self.assertEqual(len(solver.solutions()), 2)
+    
+    def test_count_solutions_con_limite_de_nodos(self):
+        """Prueba que la búsqueda se corta al superar max_nodos"""
+        solver = KakuroSolver(claves_de(SOLUCION_AMBIGUA))
+        solver.count_solutions(limite=2, max_nodos=1)
+        self.assertTrue(solver.interrumpida)
+        self.assertLessEqual(solver.nodos, 2)
+        
+        solver.count_solutions(limite=2)
+        self.assertFalse(solver.interrumpida)
+    
+    def test_estadisticas(self):
+        """Prueba que la búsqueda reporta nodos, rondas y tiempo"""
+        solver = KakuroSolver(claves_de(SOLUCION_6X6))
+        solver.count_solutions()
+        stats = solver.get_stats()
+        self.assertGreaterEqual(stats["nodos"], 1)
+        self.assertGreater(stats["rondas_propagacion"], 0)
+        self.assertGreaterEqual(stats["tiempo"], 0)
+    
+    def test_verificar_partida(self):
+        """Prueba la verificación contra la solución incluida en la partida"""
+        resultado = verificar_partida(partida_desde_solucion(SOLUCION_3X3))
+        self.assertTrue(resultado["unica"])
+        self.assertTrue(resultado["coincide_solucion"])
+        
+        resultado = verificar_partida(partida_desde_solucion(SOLUCION_AMBIGUA))
+        self.assertEqual(resultado["soluciones"], 2)
+        self.assertFalse(resultado["unica"])
+
+    def test_verificar_partida_invalida(self):
+        """Prueba que una partida vacía o mal formada no cuenta como única"""
+        for partida in ({"id": "vacia"}, {"id": "sin_corridas", "tablero": [["X", "X"], ["X", "X"]]}):
+            resultado = verificar_partida(partida)
+            self.assertEqual(resultado["soluciones"], 0)
+            self.assertFalse(resultado["unica"])
+            self.assertIn("error", resultado)
+
+    def test_verificar_partida_suma_imposible(self):
+        """Prueba que una corrida con suma 0 o inalcanzable se reporta como error"""
+        for fila, suma in ((0, 0), (1, 18)):
+            partida = partida_desde_solucion(SOLUCION_3X3)
+            partida["sumas_filas"][fila + 1][0] = suma
+            resultado = verificar_partida(partida)
+            self.assertEqual(resultado["soluciones"], 0)
+            self.assertIn(f"en ({fila + 2}, 1)", resultado["error"])
+            self.assertIn(f"suma {suma}", resultado["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
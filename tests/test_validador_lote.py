@@ -0,0 +1,76 @@
+"""
+Pruebas para la validación por lotes
+Test unitarios para ValidadorLote
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from logic.validator import KakuroValidator
+from tests.test_solver import SOLUCION_6X6, claves_de
+
+
+def tablero_de(solucion):
+    return [[v if isinstance(v, int) else None for v in fila] for fila in solucion]
+
+
+@unittest.skipIf(np is None, "NumPy no está instalado")
+class TestValidadorLote(unittest.TestCase):
+    def setUp(self):
+        """Configuración inicial para cada prueba"""
+        from logic.validador_lote import ValidadorLote
+        self.claves = claves_de(SOLUCION_6X6)
+        self.lote = ValidadorLote(self.claves)
+    
+    def test_lote_mixto(self):
+        """Prueba veredictos y corridas fallidas de varios tableros"""
+        correcto = tablero_de(SOLUCION_6X6)
+        
+        suma_mal = tablero_de(SOLUCION_6X6)
+        suma_mal[5][5] = 4
+        
+        repetido = tablero_de(SOLUCION_6X6)
+        repetido[1][1], repetido[1][2] = 7, 9  # fila 9,7 -> 7,9 mantiene la suma de la fila
+        
+        incompleto = tablero_de(SOLUCION_6X6)
+        incompleto[3][2] = None
+        
+        from logic.validador_lote import tableros_a_arreglo
+        veredictos, fallidas = self.lote.validar(tableros_a_arreglo([correcto, suma_mal, repetido, incompleto]))
+        
+        self.assertEqual(veredictos.tolist(), [True, False, False, False])
+        self.assertEqual(len(fallidas[0]), 0)
+        
+        indice = self.lote.indice
+        self.assertEqual(sorted(fallidas[1].tolist()), sorted(r for r in indice.runs_de(5, 5) if r is not None))
+        self.assertEqual(sorted(fallidas[3].tolist()), sorted(indice.runs_de(3, 2)))
+        # Cambiar el orden en la fila rompe las dos columnas afectadas, no la fila
+        horizontal, _ = indice.runs_de(1, 1)
+        self.assertNotIn(horizontal, fallidas[2].tolist())
+        self.assertEqual(len(fallidas[2]), 2)
+    
+    def test_duplicados_con_suma_correcta(self):
+        """Prueba que un dígito repetido se detecta aunque la suma coincida"""
+        claves = claves_de([["#", "\\"], ["\\", 4], ["\\", 2]])
+        claves = [c for c in claves if c["tipo_de_clave"] == "C"]
+        tableros = np.array([[[0, 0], [0, 3], [0, 3]], [[0, 0], [0, 4], [0, 2]]])
+        veredictos, _ = KakuroValidator().validate_batch(claves, tableros)
+        self.assertEqual(veredictos.tolist(), [False, True])
+    
+    def test_validator_validate_batch(self):
+        """Prueba la API del validador con listas estilo estado_tablero"""
+        veredictos, fallidas = KakuroValidator().validate_batch(self.claves, [tablero_de(SOLUCION_6X6)] * 3)
+        self.assertTrue(veredictos.all())
+
+
+if __name__ == '__main__':
+    unittest.main()
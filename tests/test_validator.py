@@ -59,6 +59,34 @@ class TestKakuroValidator(unittest.TestCase):
         target_sum = 15
         self.assertFalse(self.validator.validate_column_sum(col_values, target_sum))
 
+    
+    def test_validate_row_sum_invalid_no_completable(self):
+        """Prueba fila cuyas casillas vacías no pueden alcanzar la suma"""
+        row_values = [9, None, None]
+        target_sum = 11
+        self.assertFalse(self.validator.validate_row_sum(row_values, target_sum))
+    
+    def test_validate_row_sum_completa_incorrecta(self):
+        """Prueba fila llena cuya suma no coincide con el objetivo"""
+        self.assertFalse(self.validator.validate_row_sum([1, 2], 15))
+        self.assertTrue(self.validator.validate_row_sum([7, 8], 15))
+    
+    def test_valid_digits(self):
+        """Prueba los dígitos que aún caben en una corrida parcial"""
+        self.assertEqual(self.validator.valid_digits([None, None], 3), [1, 2])
+        self.assertEqual(self.validator.valid_digits([1, None, None], 24), [])
+        self.assertEqual(self.validator.valid_digits([9, None, None], 24), [7, 8])
+
+    
+    def test_validate_board_shape(self):
+        """Prueba la forma del tablero con dimensiones distintas de 9x9"""
+        tablero = [[None] * 20 for _ in range(15)]
+        self.assertTrue(self.validator.validate_board_shape(tablero, 15, 20))
+        self.assertFalse(self.validator.validate_board_shape(tablero, 9, 9))
+        tablero[3] = tablero[3][:-1]
+        self.assertFalse(self.validator.validate_board_shape(tablero, 15, 20))
+        self.assertTrue(self.validator.validate_position(14, 19, 15, 20))
+        self.assertFalse(self.validator.validate_position(15, 0, 15, 20))
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
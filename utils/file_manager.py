@@ -4,14 +4,21 @@ Maneja la persistencia de datos del juego
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
+from logic.almacen_records import RECORDS_DB, AlmacenRecords
+from logic.persistencia import escribir_json_atomico
+from logic.record_manager import NIVELES, RECORDS_LISTA_FILE
+from logic.servicio_records import TOP_K, ServicioRecords, fila_lista
+
 
 class FileManager:
     def __init__(self, data_dir="data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self._records = None  # Servicio de récords de data_dir, se abre en el primer uso
     
     def read_json(self, filename: str) -> Dict[str, Any]:
         """Lee un archivo JSON"""
@@ -26,11 +33,10 @@ class FileManager:
             return {}
     
     def write_json(self, filename: str, data: Dict[str, Any]) -> bool:
-        """Escribe datos en un archivo JSON"""
+        """Escribe datos en un archivo JSON (reemplazo atómico)"""
         file_path = self.data_dir / filename
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=2, ensure_ascii=False)
+            escribir_json_atomico(str(file_path), data)
             return True
         except Exception:
             return False
@@ -57,13 +63,51 @@ class FileManager:
         data = self.read_json("kakuro2025_configuración.json")
         return data.get("configuracion", {})
     
-    def save_records(self, records: List[Dict[str, Any]]) -> bool:
-        """Guarda los récords de jugadores"""
-        return self.write_json("kakuro2025_récords.json", {
-            "records": records
-        })
+    def _servicio_records(self) -> ServicioRecords:
+        """Servicio de récords con la base dentro de data_dir (migra su lista JSON anterior)."""
+        if self._records is None:
+            almacen = AlmacenRecords(str(self.data_dir / os.path.basename(RECORDS_DB)))
+            almacen.migrar_json(str(self.data_dir / os.path.basename(RECORDS_LISTA_FILE)))
+            self._records = ServicioRecords(almacen)
+        return self._records
+    
+    def agregar_records(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Agrega récords nuevos a la base de récords de data_dir.
+
+        Cada récord se suma a los existentes (no reemplaza la tabla), así que
+        no se deben volver a pasar los que devolvió load_records.
+
+        Args:
+            records: Récords con "jugador", "nivel_dificultad" y "tiempo_transcurrido"
+        """
+        guardados = True
+        for record in records:
+            jugador = record.get("jugador")
+            nivel = record.get("nivel_dificultad")
+            try:
+                tiempo = int(record.get("tiempo_transcurrido"))
+            except (TypeError, ValueError):
+                tiempo = None
+            if not jugador or nivel not in NIVELES or tiempo is None:
+                print(f"[RECORDS] Récord inválido, no se guarda: {record}")
+                guardados = False
+                continue
+            try:
+                self._servicio_records().registrar(jugador, nivel, tiempo)
+            except Exception as e:
+                print(f"[RECORDS] Error guardando récord: {e}")
+                guardados = False
+        return guardados
     
     def load_records(self) -> List[Dict[str, Any]]:
-        """Carga los récords de jugadores"""
-        data = self.read_json("kakuro2025_récords.json")
-        return data.get("records", []) 
\ No newline at end of file
+        """
+        Carga los mejores récords de jugadores de todos los niveles, en el
+        mismo formato que SaveLoadManager.get_records.
+        """
+        try:
+            servicio = self._servicio_records()
+            return [fila_lista(record, nivel) for nivel in NIVELES for record in servicio.top(nivel, TOP_K)]
+        except Exception as e:
+            print(f"[RECORDS] Error cargando récords: {e}")
+            return []
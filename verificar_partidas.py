@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Verifica en paralelo todas las partidas de un archivo de partidas.
+
+Lee data/kakuro2025_partidas.json (o cualquier archivo con el mismo esquema),
+resuelve cada partida con KakuroSolver en un ProcessPoolExecutor y escribe
+una línea JSON por partida con su id, tiempo de resolución, nodos de
+búsqueda y veredicto de unicidad.
+
+Uso:
+    python verificar_partidas.py [archivo] [-o salida.jsonl] [-p procesos]
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.partida_loader import PARTIDAS_FILE, _load_partidas_file
+from logic.solver import verificar_partida
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica la unicidad de las partidas de Kakuro")
+    parser.add_argument("archivo", nargs="?", default=PARTIDAS_FILE,
+                        help=f"Archivo de partidas (por defecto {PARTIDAS_FILE})")
+    parser.add_argument("-o", "--salida", default=None,
+                        help="Archivo JSON Lines de salida (por defecto la salida estándar)")
+    parser.add_argument("-p", "--procesos", type=int, default=None,
+                        help="Número de procesos (por defecto uno por CPU)")
+    parser.add_argument("--chunksize", type=int, default=16,
+                        help="Partidas enviadas a cada proceso por lote")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+
+    partidas = _load_partidas_file(args.archivo)
+    if partidas is None:
+        return 1
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    resumen = {"total": 0, "unicas": 0, "multiples": 0, "sin_solucion": 0, "invalidas": 0}
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.procesos) as executor:
+            for resultado in executor.map(verificar_partida, partidas, chunksize=max(1, args.chunksize)):
+                salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+
+                resumen["total"] += 1
+                if "error" in resultado:
+                    resumen["invalidas"] += 1
+                elif resultado["soluciones"] == 0:
+                    resumen["sin_solucion"] += 1
+                elif resultado["unica"]:
+                    resumen["unicas"] += 1
+                else:
+                    resumen["multiples"] += 1
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    print(f"[VERIFICAR] {resumen['total']} partidas: {resumen['unicas']} únicas, "
+          f"{resumen['multiples']} con varias soluciones, {resumen['sin_solucion']} sin solución, "
+          f"{resumen['invalidas']} inválidas",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())